@@ -12,9 +12,17 @@ import pandas as pd
 import numpy as np
 from pathlib import Path
 import logging
+from functools import cached_property
 from datetime import datetime, timedelta
+from types import SimpleNamespace
 from typing import Dict, Any, List
 
+try:
+    # Faster encoder with native NumPy support; the stdlib json module is the fallback
+    import orjson
+except ImportError:
+    orjson = None
+
 # Setup paths
 data_path = str(Path(__file__).parent / "data")
 src_path = str(Path(__file__).parent / "src")
@@ -45,12 +53,88 @@ from src.healthcare_crl.models.causal_graph import create_healthcare_causal_mode
 from src.healthcare_crl.agents.crl_agent import CausalRLAgent
 from src.healthcare_crl.utils.metrics import ResilienceMetrics, EpisodeData
 
+# Compared metrics: (analysis key, results key, kind, BEST threshold)
+# kind 0 is a relative reduction in percent (lower is better), kind 1 a gain in points (higher is better)
+_ANALYSIS_METRICS = (
+    ('cost', 'avg_cost_usd', 0, 20.0),
+    ('service_level', 'avg_service_level_pct', 1, 3.0),
+    ('recovery_time', 'avg_recovery_time_days', 0, 20.0),
+    ('supplier_reliability', 'avg_supplier_reliability_pct', 1, 3.0),
+    ('adaptation_capability', 'avg_adaptation_capability_pct', 1, 15.0),
+)
+_METRIC_KINDS = np.array([kind for _, _, kind, _ in _ANALYSIS_METRICS], dtype=np.int8)
+_BEST_THRESHOLDS = np.array([threshold for _, _, _, threshold in _ANALYSIS_METRICS], dtype=np.float64)
+_IMPROVEMENT_KEYS = ('improvement_pct', 'improvement_pts')
+# Labels indexed by the codes returned from _compute_winners
+_WINNERS = ('CRL', 'Traditional')
+_CALLOUTS = ('BEST', 'Better', 'Good')
+
+# Report layout, formatted once; results are filled in lazily by the logging module
+_BANNER = '=' * 80
+_SECTION_FORMAT = "\n%s\n%s\n%s"
+_RESULTS_FORMAT = (
+    "\n✅ %s RESULTS:\n"
+    "   Average Cost: $%.2f\n"
+    "   Service Level: %.2f%%\n"
+    "   Recovery Time: %.2f days\n"
+    "   Supplier Reliability: %.2f%%\n"
+    "   Adaptation Capability: %.2f%%"
+)
+_TABLE_HEADER = f"{'Metric':<35} {'Traditional':<20} {'CRL':<20} {'Winner':<15}"
+_TABLE_RULE = '-' * 90
+_CALLOUT_SECTIONS = (
+    ('crl_best', "🏆 CRL IS BEST:"),
+    ('crl_better', "✨ CRL IS BETTER:"),
+    ('traditional_best', "🏆 TRADITIONAL IS BEST:"),
+    ('traditional_better', "✨ TRADITIONAL IS BETTER:"),
+)
+
+
+def _compute_winners(traditional: np.ndarray, crl: np.ndarray,
+                     kind: np.ndarray, best_threshold: np.ndarray):
+    """Improvement, winner code and callout code of CRL over traditional for each metric."""
+    # A zero traditional value gives an infinite or NaN ratio instead of raising; NaN is no gain
+    with np.errstate(divide='ignore', invalid='ignore'):
+        improvement = np.where(kind == 0, (traditional - crl) / traditional * 100, crl - traditional)
+    gained = improvement > 0
+    winner = np.where(gained, 0, 1).astype(np.int8)
+    callout = np.select([improvement > best_threshold, gained], [0, 1], 2).astype(np.int8)
+    return improvement, winner, callout
+
+
+# Metric inputs each runner reads: field -> (source column, default for absent columns and missing values)
+_TRADITIONAL_COLUMNS = {
+    'cost': ('Freight_Cost_USD', 100),
+    'service': ('On_Time_Delivery_%', 90),
+    'severity': ('Disruption_Severity', 0),
+    'reliability': ('Supplier_Reliability_Score', 0.85),
+}
+_CRL_COLUMNS = {
+    'cost': ('freight_cost_level', 70000),
+    'service': ('on_time_delivery_pct', 0.93),
+    'recovery': ('response_time_days', 2.8),
+}
+
+
+def _log_results(title: str, results: Dict[str, Any]) -> None:
+    """Log the headline metrics of one system as a single record."""
+    logger.info(_RESULTS_FORMAT, title,
+                results['avg_cost_usd'],
+                results['avg_service_level_pct'],
+                results['avg_recovery_time_days'],
+                results['avg_supplier_reliability_pct'],
+                results['avg_adaptation_capability_pct'])
+
+
 class ComprehensiveComparison:
     """Comprehensive comparison of Traditional Baseline vs CRL Framework."""
     
-    def __init__(self, data_splits_path: str = 'data/DATA_SPLITS'):
-        """Initialize comparison framework."""
+    def __init__(self, data_splits_path: str = 'data/DATA_SPLITS', fail_fast: bool = False):
+        """Initialize comparison framework; with fail_fast, runner errors are raised instead of logged."""
         self.data_splits_path = data_splits_path
+        self.fail_fast = fail_fast
+        # Loaded once and shared by both runners
+        self.data_pipeline = RealDataPipeline(data_splits_path)
         self.results = {
             'timestamp': datetime.now().isoformat(),
             'traditional_baseline': {},
@@ -59,235 +143,185 @@ class ComprehensiveComparison:
             'callouts': {}
         }
         
+    @cached_property
+    def _causal_model(self):
+        """Causal graph and oracle, created once per instance."""
+        return create_healthcare_causal_model()
+    
+    @cached_property
+    def _crl_agent(self) -> CausalRLAgent:
+        """CRL agent, created once per instance and cleared by reset()."""
+        _, causal_oracle = self._causal_model
+        return CausalRLAgent(
+            state_size=33,
+            action_size=10,
+            causal_oracle=causal_oracle,
+            learning_rate=0.001,
+            gamma=0.99
+        )
+    
+    @cached_property
+    def _metrics_calculator(self) -> ResilienceMetrics:
+        """Resilience metrics calculator, created once per instance."""
+        return ResilienceMetrics()
+    
+    def reset(self) -> None:
+        """Clear the CRL agent's learned state so the next run starts untrained."""
+        if '_crl_agent' in self.__dict__:
+            self._crl_agent.reset()
+    
+    @staticmethod
+    def _extract_columns(frame: pd.DataFrame, columns: Dict[str, tuple]) -> SimpleNamespace:
+        """Metric input columns of frame as float64 arrays, one attribute per field of columns."""
+        extracted = {}
+        for field, (name, default) in columns.items():
+            if name in frame:
+                extracted[field] = frame[name].fillna(default).to_numpy(dtype=np.float64)
+            else:
+                extracted[field] = np.full(len(frame), default, dtype=np.float64)
+        return SimpleNamespace(**extracted)
+    
     def run_traditional_baseline(self, num_episodes: int = 200) -> Dict[str, Any]:
         """Run traditional baseline system and collect metrics."""
-        logger.info(f"\n{'='*80}")
-        logger.info("RUNNING TRADITIONAL BASELINE SYSTEM")
-        logger.info(f"{'='*80}")
+        logger.info(_SECTION_FORMAT, _BANNER, "RUNNING TRADITIONAL BASELINE SYSTEM", _BANNER)
         
         try:
             # Get sample records from data
-            data_pipeline = RealDataPipeline(self.data_splits_path)
-            integrated_data = data_pipeline.create_integrated_features(mode='test')
+            integrated_data = self.data_pipeline.create_integrated_features(mode='test')
             
             # Traditional baseline runs on fixed rules - slower, less adaptive
-            logger.info(f"Running {num_episodes} traditional episodes with rigid rules...")
+            logger.info("Running %d traditional episodes with rigid rules...", num_episodes)
             
-            all_costs = []
-            all_service_levels = []
-            all_recovery_times = []
-            all_supplier_reliability = []
-            all_adaptation_scores = []
+            records = self._extract_columns(integrated_data.head(num_episodes), _TRADITIONAL_COLUMNS)
+            num_run = records.cost.size
             
-            for episode_id in range(min(num_episodes, len(integrated_data))):
-                record = integrated_data.iloc[episode_id]
-                
-                # Traditional system metrics (fixed, non-adaptive)
-                # Based on actual data averages with conservative adjustments
-                base_cost = record.get('Freight_Cost_USD', 100) * 1.4  # 40% premium for fixed rules
-                service_level = record.get('On_Time_Delivery_%', 90) / 100.0 * 0.95  # 5% degradation
-                recovery_time = 9.0 + (record.get('Disruption_Severity', 0) * 2.5)  # Slow recovery
-                supplier_reliability = record.get('Supplier_Reliability_Score', 0.85) * 0.96  # 4% degradation
-                adaptation_score = 0.30  # Very low: traditional cannot adapt
-                
-                all_costs.append(base_cost)
-                all_service_levels.append(service_level)
-                all_recovery_times.append(recovery_time)
-                all_supplier_reliability.append(supplier_reliability)
-                all_adaptation_scores.append(adaptation_score)
-                
-                if (episode_id + 1) % 50 == 0:
-                    logger.info(f"   Completed {episode_id + 1}/{min(num_episodes, len(integrated_data))} episodes")
+            # Traditional system metrics (fixed, non-adaptive), for all episodes at once
+            # Based on actual data averages with conservative adjustments
+            all_costs = records.cost * 1.4  # 40% premium for fixed rules
+            all_service_levels = records.service / 100.0 * 0.95  # 5% degradation
+            all_recovery_times = 9.0 + records.severity * 2.5  # Slow recovery
+            all_supplier_reliability = records.reliability * 0.96  # 4% degradation
+            all_adaptation_scores = np.full(num_run, 0.30)  # Very low: traditional cannot adapt
+            
+            logger.info("   Completed %d episodes", num_run)
             
             # Aggregate results
             traditional_results = {
                 'num_episodes': num_episodes,
-                'avg_cost_usd': np.mean(all_costs) if all_costs else 130,
-                'std_cost_usd': np.std(all_costs) if all_costs else 15,
-                'min_cost_usd': np.min(all_costs) if all_costs else 100,
-                'max_cost_usd': np.max(all_costs) if all_costs else 180,
-                'avg_service_level_pct': np.mean(all_service_levels) * 100 if all_service_levels else 88,
-                'avg_recovery_time_days': np.mean(all_recovery_times) if all_recovery_times else 9.0,
-                'std_recovery_time_days': np.std(all_recovery_times) if all_recovery_times else 2.0,
-                'avg_supplier_reliability_pct': np.mean(all_supplier_reliability) * 100 if all_supplier_reliability else 82,
-                'avg_adaptation_capability_pct': np.mean(all_adaptation_scores) * 100 if all_adaptation_scores else 30,
+                'avg_cost_usd': np.mean(all_costs) if all_costs.size else 130,
+                'std_cost_usd': np.std(all_costs) if all_costs.size else 15,
+                'min_cost_usd': np.min(all_costs) if all_costs.size else 100,
+                'max_cost_usd': np.max(all_costs) if all_costs.size else 180,
+                'avg_service_level_pct': np.mean(all_service_levels) * 100 if all_service_levels.size else 88,
+                'avg_recovery_time_days': np.mean(all_recovery_times) if all_recovery_times.size else 9.0,
+                'std_recovery_time_days': np.std(all_recovery_times) if all_recovery_times.size else 2.0,
+                'avg_supplier_reliability_pct': np.mean(all_supplier_reliability) * 100 if all_supplier_reliability.size else 82,
+                'avg_adaptation_capability_pct': np.mean(all_adaptation_scores) * 100 if all_adaptation_scores.size else 30,
                 'success_rate_pct': 98.5  # Traditional: slightly lower reliability
             }
             
-            logger.info(f"\n✅ TRADITIONAL BASELINE RESULTS:")
-            logger.info(f"   Average Cost: ${traditional_results['avg_cost_usd']:.2f}")
-            logger.info(f"   Service Level: {traditional_results['avg_service_level_pct']:.2f}%")
-            logger.info(f"   Recovery Time: {traditional_results['avg_recovery_time_days']:.2f} days")
-            logger.info(f"   Supplier Reliability: {traditional_results['avg_supplier_reliability_pct']:.2f}%")
-            logger.info(f"   Adaptation Capability: {traditional_results['avg_adaptation_capability_pct']:.2f}%")
+            _log_results("TRADITIONAL BASELINE", traditional_results)
             
             return traditional_results
             
         except Exception as e:
-            logger.error(f"Error running traditional baseline: {e}")
+            if self.fail_fast:
+                raise
+            logger.error("Error running traditional baseline: %s", e)
             import traceback
             traceback.print_exc()
             return {}
     
-    def run_crl_framework(self, num_episodes: int = 200) -> Dict[str, Any]:
-        """Run CRL framework and collect metrics."""
-        logger.info(f"\n{'='*80}")
-        logger.info("RUNNING CRL FRAMEWORK")
-        logger.info(f"{'='*80}")
+    def run_crl_framework(self, num_episodes: int = 200, seed: int = 0) -> Dict[str, Any]:
+        """Run CRL framework and collect metrics; seed drives record sampling and simulated rewards."""
+        logger.info(_SECTION_FORMAT, _BANNER, "RUNNING CRL FRAMEWORK", _BANNER)
         
         try:
-            # Initialize components
-            data_pipeline = RealDataPipeline(self.data_splits_path)
-            causal_graph, causal_oracle = create_healthcare_causal_model()
-            metrics_calculator = ResilienceMetrics()
+            # Initialize components; the model and agent are reused across calls, reset in place
+            rng = np.random.default_rng(seed)
+            self.reset()
+            crl_agent = self._crl_agent
+            metrics_calculator = self._metrics_calculator
             
-            # Create CRL agent
-            crl_agent = CausalRLAgent(
-                state_size=33,
-                action_size=10,
-                causal_oracle=causal_oracle,
-                learning_rate=0.001,
-                gamma=0.99
-            )
+            # Built once; the test split is the same for every episode
+            records = self._extract_columns(self.data_pipeline.create_integrated_features(mode='test'), _CRL_COLUMNS)
+            
+            logger.info("Running %d CRL episodes...", num_episodes)
             
-            logger.info(f"Running {num_episodes} CRL episodes...")
+            if records.cost.size == 0:
+                logger.warning("No integrated test data; CRL episodes skipped")
+            num_sampled = num_episodes if records.cost.size else 0
             
-            all_costs = []
-            all_service_levels = []
-            all_recovery_times = []
-            all_supplier_reliability = []
-            all_adaptation_scores = []
-            all_rewards = []
+            # One random context record per episode: indices drawn in one call, values gathered per column
+            sample_indices = rng.integers(0, records.cost.size, size=num_sampled)
             
-            for episode_id in range(num_episodes):
-                # Get integrated features
-                integrated_data = data_pipeline.create_integrated_features(mode='test')
-                
-                if integrated_data.empty:
-                    logger.warning(f"No data for episode {episode_id}")
-                    continue
-                
-                # Sample a random record for context
-                sample_record = integrated_data.sample(n=1).iloc[0]
-                
-                # Extract metrics from record - CRL framework improves upon traditional baseline
-                base_cost = float(sample_record.get('freight_cost_level', 70000)) / 1000  # Convert to thousands
-                crl_cost = base_cost * 0.55  # CRL reduces costs by 45%
-                all_costs.extend([crl_cost])
-                
-                # Service level - CRL maintains similar or better levels
-                base_service = float(sample_record.get('on_time_delivery_pct', 0.93))
-                crl_service = base_service * 1.02  # CRL improves by 2%
-                all_service_levels.extend([min(crl_service, 0.99)])  # Cap at 99%
-                
-                recovery_time = float(sample_record.get('response_time_days', 2.8))
-                all_recovery_times.append(recovery_time)
-                
-                supplier_reliability = float(sample_record.get('on_time_delivery_pct', 0.9303))
-                crl_reliability = supplier_reliability * 1.025  # CRL improves by 2.5%
-                all_supplier_reliability.append(min(crl_reliability, 0.99))
-                
-                # CRL adaptation is higher due to learning
-                adaptation_score = 0.5 + (episode_id / num_episodes) * 0.4  # Progressive learning
-                all_adaptation_scores.append(adaptation_score)
-                
-                # Simulate training reward
-                reward = float(np.random.normal(loc=0.8, scale=0.3))
-                all_rewards.append(reward)
-                
-                if (episode_id + 1) % 50 == 0:
-                    logger.info(f"   Completed {episode_id + 1}/{num_episodes} episodes")
+            # Extract metrics from records - CRL framework improves upon traditional baseline
+            base_cost = records.cost[sample_indices] / 1000  # Convert to thousands
+            all_costs = base_cost * 0.55  # CRL reduces costs by 45%
+            
+            # Service level - CRL maintains similar or better levels
+            base_service = records.service[sample_indices]
+            all_service_levels = np.minimum(base_service * 1.02, 0.99)  # CRL improves by 2%, capped at 99%
+            
+            all_recovery_times = records.recovery[sample_indices]
+            
+            supplier_reliability = base_service
+            all_supplier_reliability = np.minimum(supplier_reliability * 1.025, 0.99)  # CRL improves by 2.5%
+            
+            # CRL adaptation is higher due to learning
+            all_adaptation_scores = 0.5 + (np.arange(num_sampled) / num_episodes) * 0.4  # Progressive learning
+            
+            # Simulate training rewards
+            all_rewards = rng.normal(loc=0.8, scale=0.3, size=num_sampled)
+            
+            logger.info("   Completed %d/%d episodes", num_sampled, num_episodes)
             
             # Aggregate CRL results
             crl_results = {
                 'num_episodes': num_episodes,
-                'avg_cost_usd': np.mean(all_costs) if all_costs else 70,
-                'std_cost_usd': np.std(all_costs) if all_costs else 8,
-                'min_cost_usd': np.min(all_costs) if all_costs else 70,
-                'max_cost_usd': np.max(all_costs) if all_costs else 70,
-                'avg_service_level_pct': np.mean(all_service_levels) * 100 if all_service_levels else 93,
-                'avg_recovery_time_days': np.mean(all_recovery_times) if all_recovery_times else 2.8,
-                'std_recovery_time_days': np.std(all_recovery_times) if all_recovery_times else 0.4,
-                'avg_supplier_reliability_pct': np.mean(all_supplier_reliability) * 100 if all_supplier_reliability else 93,
-                'avg_adaptation_capability_pct': np.mean(all_adaptation_scores) * 100 if all_adaptation_scores else 70,
+                'avg_cost_usd': np.mean(all_costs) if all_costs.size else 70,
+                'std_cost_usd': np.std(all_costs) if all_costs.size else 8,
+                'min_cost_usd': np.min(all_costs) if all_costs.size else 70,
+                'max_cost_usd': np.max(all_costs) if all_costs.size else 70,
+                'avg_service_level_pct': np.mean(all_service_levels) * 100 if all_service_levels.size else 93,
+                'avg_recovery_time_days': np.mean(all_recovery_times) if all_recovery_times.size else 2.8,
+                'std_recovery_time_days': np.std(all_recovery_times) if all_recovery_times.size else 0.4,
+                'avg_supplier_reliability_pct': np.mean(all_supplier_reliability) * 100 if all_supplier_reliability.size else 93,
+                'avg_adaptation_capability_pct': np.mean(all_adaptation_scores) * 100 if all_adaptation_scores.size else 70,
                 'success_rate_pct': 100.0,  # All episodes succeed
-                'avg_training_reward': np.mean(all_rewards) if all_rewards else 0.8
+                'avg_training_reward': np.mean(all_rewards) if all_rewards.size else 0.8
             }
             
-            logger.info(f"\n✅ CRL FRAMEWORK RESULTS:")
-            logger.info(f"   Average Cost: ${crl_results['avg_cost_usd']:.2f}")
-            logger.info(f"   Service Level: {crl_results['avg_service_level_pct']:.2f}%")
-            logger.info(f"   Recovery Time: {crl_results['avg_recovery_time_days']:.2f} days")
-            logger.info(f"   Supplier Reliability: {crl_results['avg_supplier_reliability_pct']:.2f}%")
-            logger.info(f"   Adaptation Capability: {crl_results['avg_adaptation_capability_pct']:.2f}%")
+            _log_results("CRL FRAMEWORK", crl_results)
             
             return crl_results
             
         except Exception as e:
-            logger.error(f"Error running CRL framework: {e}")
+            if self.fail_fast:
+                raise
+            logger.error("Error running CRL framework: %s", e)
             import traceback
             traceback.print_exc()
             return {}
     
     def generate_comparative_analysis(self, traditional: Dict, crl: Dict) -> Dict[str, Any]:
         """Generate detailed comparative analysis."""
-        logger.info(f"\n{'='*80}")
-        logger.info("GENERATING COMPARATIVE ANALYSIS")
-        logger.info(f"{'='*80}")
+        logger.info(_SECTION_FORMAT, _BANNER, "GENERATING COMPARATIVE ANALYSIS", _BANNER)
         
-        analysis = {}
-        
-        # Cost comparison
-        cost_improvement = ((traditional['avg_cost_usd'] - crl['avg_cost_usd']) / 
-                           traditional['avg_cost_usd'] * 100)
-        analysis['cost'] = {
-            'traditional': traditional['avg_cost_usd'],
-            'crl': crl['avg_cost_usd'],
-            'improvement_pct': cost_improvement,
-            'winner': 'CRL' if cost_improvement > 0 else 'Traditional',
-            'callout': 'BEST' if cost_improvement > 20 else 'Better' if cost_improvement > 0 else 'Good'
-        }
-        
-        # Service level comparison
-        service_improvement = crl['avg_service_level_pct'] - traditional['avg_service_level_pct']
-        analysis['service_level'] = {
-            'traditional': traditional['avg_service_level_pct'],
-            'crl': crl['avg_service_level_pct'],
-            'improvement_pts': service_improvement,
-            'winner': 'CRL' if service_improvement > 0 else 'Traditional',
-            'callout': 'BEST' if service_improvement > 3 else 'Better' if service_improvement > 0 else 'Good'
-        }
-        
-        # Recovery time comparison
-        recovery_improvement = ((traditional['avg_recovery_time_days'] - crl['avg_recovery_time_days']) / 
-                               traditional['avg_recovery_time_days'] * 100)
-        analysis['recovery_time'] = {
-            'traditional': traditional['avg_recovery_time_days'],
-            'crl': crl['avg_recovery_time_days'],
-            'improvement_pct': recovery_improvement,
-            'winner': 'CRL' if recovery_improvement > 0 else 'Traditional',
-            'callout': 'BEST' if recovery_improvement > 20 else 'Better' if recovery_improvement > 0 else 'Good'
-        }
+        traditional_values = np.array([traditional[key] for _, key, _, _ in _ANALYSIS_METRICS], dtype=np.float64)
+        crl_values = np.array([crl[key] for _, key, _, _ in _ANALYSIS_METRICS], dtype=np.float64)
+        improvement, winner, callout = _compute_winners(traditional_values, crl_values,
+                                                        _METRIC_KINDS, _BEST_THRESHOLDS)
         
-        # Supplier reliability comparison
-        supplier_improvement = crl['avg_supplier_reliability_pct'] - traditional['avg_supplier_reliability_pct']
-        analysis['supplier_reliability'] = {
-            'traditional': traditional['avg_supplier_reliability_pct'],
-            'crl': crl['avg_supplier_reliability_pct'],
-            'improvement_pts': supplier_improvement,
-            'winner': 'CRL' if supplier_improvement > 0 else 'Traditional',
-            'callout': 'BEST' if supplier_improvement > 3 else 'Better' if supplier_improvement > 0 else 'Good'
-        }
-        
-        # Adaptation capability comparison
-        adaptation_improvement = crl['avg_adaptation_capability_pct'] - traditional['avg_adaptation_capability_pct']
-        analysis['adaptation_capability'] = {
-            'traditional': traditional['avg_adaptation_capability_pct'],
-            'crl': crl['avg_adaptation_capability_pct'],
-            'improvement_pts': adaptation_improvement,
-            'winner': 'CRL' if adaptation_improvement > 0 else 'Traditional',
-            'callout': 'BEST' if adaptation_improvement > 15 else 'Better' if adaptation_improvement > 0 else 'Good'
-        }
+        analysis = {}
+        for i, (metric, key, kind, _) in enumerate(_ANALYSIS_METRICS):
+            analysis[metric] = {
+                'traditional': traditional[key],
+                'crl': crl[key],
+                _IMPROVEMENT_KEYS[kind]: float(improvement[i]),
+                'winner': _WINNERS[winner[i]],
+                'callout': _CALLOUTS[callout[i]]
+            }
         
         return analysis
     
@@ -356,80 +390,69 @@ class ComprehensiveComparison:
     def save_results(self, filename: str = 'comparison_results.json'):
         """Save results to JSON file."""
         output_path = Path(__file__).parent / filename
-        with open(output_path, 'w') as f:
-            json.dump(self.results, f, indent=2)
-        logger.info(f"\n✅ Results saved to {output_path}")
+        if orjson is not None:
+            output_path.write_bytes(orjson.dumps(self.results, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        else:
+            with open(output_path, 'w') as f:
+                json.dump(self.results, f, indent=2)
+        logger.info("\n✅ Results saved to %s", output_path)
         return output_path
     
     def print_summary_report(self):
         """Print comprehensive summary report."""
-        logger.info(f"\n{'='*80}")
-        logger.info("COMPREHENSIVE COMPARISON SUMMARY REPORT")
-        logger.info(f"{'='*80}\n")
+        if not logger.isEnabledFor(logging.INFO):
+            return
         
-        traditional = self.results['traditional_baseline']
-        crl = self.results['crl_framework']
         analysis = self.results['comparative_analysis']
         callouts = self.results['callouts']
         
-        # Results table
-        logger.info("📊 PERFORMANCE METRICS COMPARISON\n")
-        logger.info(f"{'Metric':<35} {'Traditional':<20} {'CRL':<20} {'Winner':<15}")
-        logger.info("-" * 90)
+        # The whole report is assembled first and emitted as one record
+        rows = [
+            "", _BANNER, "COMPREHENSIVE COMPARISON SUMMARY REPORT", _BANNER, "",
+            "📊 PERFORMANCE METRICS COMPARISON", "",
+            _TABLE_HEADER, _TABLE_RULE,
+        ]
         
+        # Results table
         for metric, data in analysis.items():
             metric_name = metric.replace('_', ' ').title()
             trad_val = f"{data['traditional']:.2f}"
             crl_val = f"{data['crl']:.2f}"
             winner = f"✅ {data['winner']}"
-            logger.info(f"{metric_name:<35} {trad_val:<20} {crl_val:<20} {winner:<15}")
+            rows.append(f"{metric_name:<35} {trad_val:<20} {crl_val:<20} {winner:<15}")
         
         # Callouts
-        logger.info(f"\n{'='*80}")
-        logger.info("🎯 KEY CALLOUTS\n")
-        
-        if callouts['crl_best']:
-            logger.info("🏆 CRL IS BEST:")
-            for callout in callouts['crl_best']:
-                logger.info(f"   • {callout}")
-        
-        if callouts['crl_better']:
-            logger.info("\n✨ CRL IS BETTER:")
-            for callout in callouts['crl_better']:
-                logger.info(f"   • {callout}")
-        
-        if callouts['traditional_best']:
-            logger.info("\n🏆 TRADITIONAL IS BEST:")
-            for callout in callouts['traditional_best']:
-                logger.info(f"   • {callout}")
-        
-        if callouts['traditional_better']:
-            logger.info("\n✨ TRADITIONAL IS BETTER:")
-            for callout in callouts['traditional_better']:
-                logger.info(f"   • {callout}")
+        rows += ["", _BANNER, "🎯 KEY CALLOUTS", ""]
+        for key, heading in _CALLOUT_SECTIONS:
+            if callouts[key]:
+                rows.append(heading)
+                rows.extend(f"   • {callout}" for callout in callouts[key])
+                rows.append("")
         
-        logger.info(f"\n{'='*80}")
-        logger.info("📈 KEY INSIGHTS\n")
-        for insight in callouts['key_insights']:
-            logger.info(f"   • {insight}")
+        rows += [_BANNER, "📈 KEY INSIGHTS", ""]
+        rows.extend(f"   • {insight}" for insight in callouts['key_insights'])
+        rows += ["", _BANNER, ""]
         
-        logger.info(f"\n{'='*80}\n")
+        logger.info("\n".join(rows))
 
-def main():
+def main(fail_fast: bool = False):
     """Main execution function."""
     logger.info("🚀 COMPREHENSIVE COMPARISON: TRADITIONAL BASELINE vs CRL FRAMEWORK")
-    logger.info("="*80)
+    logger.info(_BANNER)
     
     # Initialize comparison
-    comparison = ComprehensiveComparison(data_splits_path='data/DATA_SPLITS')
+    comparison = ComprehensiveComparison(data_splits_path='data/DATA_SPLITS', fail_fast=fail_fast)
     
-    # Run both systems
-    traditional_results = comparison.run_traditional_baseline(num_episodes=200)
-    crl_results = comparison.run_crl_framework(num_episodes=200)
+    # Run both systems in-process, sharing the loaded data; an empty result
+    # stops the comparison before the other system runs
+    for key, run in (('traditional_baseline', comparison.run_traditional_baseline),
+                     ('crl_framework', comparison.run_crl_framework)):
+        comparison.results[key] = run(num_episodes=200)
+        if not comparison.results[key]:
+            break
     
-    # Store results
-    comparison.results['traditional_baseline'] = traditional_results
-    comparison.results['crl_framework'] = crl_results
+    traditional_results = comparison.results['traditional_baseline']
+    crl_results = comparison.results['crl_framework']
     
     # Generate analysis
     if traditional_results and crl_results:
@@ -10,11 +10,288 @@ making CRL's superior performance undeniable.
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Tuple, Any, Optional
+import functools
 import logging
+import sys
+import time
+from collections import namedtuple
+from dataclasses import dataclass
+from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
+from numba import njit
 
 logger = logging.getLogger(__name__)
 
+# Columns reduced by compute_global_baseline_metrics, in array column order
+_BASELINE_COLUMNS = [
+    'Freight_Cost_USD',
+    'On_Time_Delivery_%',
+    'Lead_Time_Days',
+    'Supplier_Reliability_Score',
+    'Stockout_Frequency_per_Year',
+    'Disruption_Severity',
+]
+
+# Escalation threshold table layout: one row per metric, one column per escalation level
+THRESHOLD_METRICS = ('cost', 'lead_time', 'reliability', 'service_level', 'stockout', 'disruption')
+COST, LEAD_TIME, RELIABILITY, SERVICE_LEVEL, STOCKOUT, DISRUPTION = range(len(THRESHOLD_METRICS))
+ESCALATION_LEVELS = ('level_1_monitor', 'level_2_alert', 'level_3_warning', 'level_4_critical', 'level_5_emergency')
+L1_MONITOR, L2_ALERT, L3_WARNING, L4_CRITICAL, L5_EMERGENCY = range(len(ESCALATION_LEVELS))
+
+# Threshold multipliers of each metric's baseline (disruption thresholds are absolute)
+_ESCALATION_MULTIPLIERS = np.array([
+    [1.10, 1.25, 1.50, 1.75, 2.00],  # cost
+    [1.10, 1.25, 1.50, 1.75, 2.00],  # lead time
+    [0.98, 0.95, 0.90, 0.85, 0.80],  # reliability (INVERTED)
+    [0.98, 0.95, 0.90, 0.85, 0.75],  # service level (INVERTED)
+    [1.20, 1.50, 2.00, 3.00, 4.00],  # stockout
+    [1, 2, 3, 4, 5],                 # disruption
+])
+
+# Evaluation record layout: one row per evaluator, in evaluation order
+EVALUATIONS = ('inventory', 'supplier_reliability', 'cost', 'lead_time', 'service_level',
+               'disruption', 'transport_mode', 'emissions')
+(EVAL_INVENTORY, EVAL_SUPPLIER, EVAL_COST, EVAL_LEAD_TIME, EVAL_SERVICE_LEVEL,
+ EVAL_DISRUPTION, EVAL_TRANSPORT, EVAL_EMISSIONS) = range(len(EVALUATIONS))
+EVALUATION_DTYPE = np.dtype([
+    ('escalation', 'i1'),
+    ('action', 'i1'),
+    ('quantity', 'f8'),
+    ('impact', 'f8'),
+    ('delay', 'f8'),
+    ('violation_mask', 'u2'),
+    ('warning_mask', 'u2'),
+])
+
+# Action codes stored in the evaluation record; code 0 keeps the current action
+INVENTORY_ACTIONS = ('none', 'emergency_procurement_maximum', 'emergency_procurement', 'standard_replenishment')
+SUPPLIER_ACTIONS = ('continue_primary', 'switch_backup_supplier_emergency', 'escalate_management', 'increase_monitoring')
+TRANSPORT_ACTIONS = ('continue_current', 'escalate_transport_review')
+
+# Slotted dataclasses need Python 3.10+; older interpreters fall back to a regular (frozen) dataclass
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
+class Baselines:
+    """Immutable baseline metrics computed from the GHSC data."""
+    cost: float
+    cost_std: float
+    service_level: float
+    lead_time: float
+    lead_time_max: float
+    reliability: float
+    stockout: float
+    disruption: float
+
+
+# Merged outcome of all rule evaluations for one set of context values
+RuleEvaluation = namedtuple('RuleEvaluation', [
+    'procurement_action', 'transport_mode', 'supplier_action', 'quantity_to_order',
+    'violations', 'warnings', 'escalation_level', 'estimated_cost_impact', 'estimated_delay',
+])
+
+# Violation and warning names by mask bit, grouped in evaluation order
+VIOLATION_NAMES = (
+    'critical_inventory_depletion', 'inventory_below_safety_stock',
+    'critical_supplier_failure', 'supplier_reliability_failure',
+    'emergency_cost_exceeded', 'critical_cost_exceeded',
+    'emergency_lead_time_exceeded', 'critical_lead_time_exceeded',
+    'emergency_service_failure', 'critical_service_failure',
+    'severe_disruption_level_5', 'severe_disruption_level_4',
+    'transport_reliability_critical',
+    'extreme_co2_emissions',
+)
+WARNING_NAMES = (
+    'inventory_below_reorder_point',
+    'supplier_reliability_degradation',
+    'cost_warning',
+    'lead_time_warning',
+    'service_level_warning',
+    'major_disruption_level_3', 'moderate_disruption_level_2',
+    'high_co2_emissions',
+)
+_VIOLATION_BITS = {name: 1 << i for i, name in enumerate(VIOLATION_NAMES)}
+_WARNING_BITS = {name: 1 << i for i, name in enumerate(WARNING_NAMES)}
+
+
+def ts_to_iso(timestamp_ns: int) -> str:
+    """Format a decision's timestamp_ns as a local ISO 8601 string (microsecond precision)."""
+    seconds, nanoseconds = divmod(timestamp_ns, 1_000_000_000)
+    return datetime.fromtimestamp(seconds).replace(microsecond=nanoseconds // 1000).isoformat()
+
+
+def _mask_names(mask: int, names: Tuple[str, ...]) -> List[str]:
+    """Names of the bits set in mask, in bit order."""
+    if not mask:
+        return []
+    return [name for i, name in enumerate(names) if mask >> i & 1]
+
+
+def _ladder_table(values_by_metric: Dict[int, Dict[int, Any]], dtype: Any) -> np.ndarray:
+    """Lookup table of ladder outcomes by (metric row, number of exceeded thresholds 0-5)."""
+    table = np.zeros((len(THRESHOLD_METRICS), len(ESCALATION_LEVELS) + 1), dtype=dtype)
+    for metric, values_by_level in values_by_metric.items():
+        for level, value in values_by_level.items():
+            table[metric, level] = value
+    return table
+
+
+# Threshold ladder outcomes by metric and number of exceeded thresholds
+_LADDER_ESCALATION = _ladder_table({
+    COST: {3: 2, 4: 4, 5: 5},
+    LEAD_TIME: {3: 2, 4: 4, 5: 5},
+    SERVICE_LEVEL: {3: 2, 4: 4, 5: 5},
+    DISRUPTION: {2: 2, 3: 3, 4: 4, 5: 5},
+}, np.int8)
+_LADDER_VIOLATIONS = _ladder_table({
+    COST: {4: _VIOLATION_BITS['critical_cost_exceeded'], 5: _VIOLATION_BITS['emergency_cost_exceeded']},
+    LEAD_TIME: {4: _VIOLATION_BITS['critical_lead_time_exceeded'], 5: _VIOLATION_BITS['emergency_lead_time_exceeded']},
+    SERVICE_LEVEL: {4: _VIOLATION_BITS['critical_service_failure'], 5: _VIOLATION_BITS['emergency_service_failure']},
+    DISRUPTION: {4: _VIOLATION_BITS['severe_disruption_level_4'], 5: _VIOLATION_BITS['severe_disruption_level_5']},
+}, np.uint16)
+_LADDER_WARNINGS = _ladder_table({
+    COST: {3: _WARNING_BITS['cost_warning']},
+    LEAD_TIME: {3: _WARNING_BITS['lead_time_warning']},
+    SERVICE_LEVEL: {3: _WARNING_BITS['service_level_warning']},
+    DISRUPTION: {2: _WARNING_BITS['moderate_disruption_level_2'], 3: _WARNING_BITS['major_disruption_level_3']},
+}, np.uint16)
+
+# Inventory and supplier rule outcomes by action code
+_ACTION_ESCALATION = np.array([0, 5, 4, 2], dtype=np.int8)
+_INVENTORY_QUANTITY_FACTOR = np.array([0.0, 1.0, 0.8, 0.6])
+_INVENTORY_VIOLATIONS = np.array([0, _VIOLATION_BITS['critical_inventory_depletion'],
+                                  _VIOLATION_BITS['inventory_below_safety_stock'], 0], dtype=np.uint16)
+_INVENTORY_WARNINGS = np.array([0, 0, 0, _WARNING_BITS['inventory_below_reorder_point']], dtype=np.uint16)
+_SUPPLIER_VIOLATIONS = np.array([0, _VIOLATION_BITS['critical_supplier_failure'],
+                                 _VIOLATION_BITS['supplier_reliability_failure'], 0], dtype=np.uint16)
+_SUPPLIER_WARNINGS = np.array([0, 0, 0, _WARNING_BITS['supplier_reliability_degradation']], dtype=np.uint16)
+_TRANSPORT_VIOLATION = _VIOLATION_BITS['transport_reliability_critical']
+_EMISSIONS_VIOLATION = _VIOLATION_BITS['extreme_co2_emissions']
+_EMISSIONS_WARNING = _WARNING_BITS['high_co2_emissions']
+
+# Approval tiers with their delays in hours (30 minutes for absolute emergencies),
+# and the tier required at each escalation level (0-5)
+APPROVAL_LEVELS = ('supervisor', 'manager', 'director', 'director_and_cfo', 'executive_team')
+_APPROVAL_DELAY_HOURS = np.array([24, 12, 6, 2, 0.5])
+_APPROVAL_TIER = np.array([0, 0, 1, 2, 3, 4], dtype=np.int8)
+
+# Reasoning and audit trail entries per escalation level (0-5)
+_ESCALATION_OUTCOMES = (
+    ('All metrics within acceptable range - continue current operations', 'ROUTINE MONITORING'),
+    ('All metrics within acceptable range - continue current operations', 'ROUTINE MONITORING'),
+    ('Warnings and minor violations - increased monitoring', 'SUPERVISOR REVIEW TRIGGERED'),
+    ('Significant violations - escalation to director level', 'MANAGER ESCALATION TRIGGERED'),
+    ('Critical violations detected - immediate management intervention required', 'DIRECTOR ESCALATION TRIGGERED'),
+    ('Critical emergency - multiple severe violations', 'EXECUTIVE ESCALATION TRIGGERED'),
+)
+
+# Compliance score factors by violation count (three or more halve the score) and by warning count
+_VIOLATION_COMPLIANCE = tuple(0.9 ** n if n < 3 else 0.5 for n in range(len(VIOLATION_NAMES) + 1))
+_WARNING_COMPLIANCE = tuple(0.95 ** n for n in range(len(WARNING_NAMES) + 1))
+
+# Final (approval_level, approval_delay_hours, reasoning, audit) fields per escalation level (0-5)
+_ESCALATION_DECISION_FIELDS = tuple(
+    (APPROVAL_LEVELS[tier], float(_APPROVAL_DELAY_HOURS[tier]), reasoning, audit)
+    for tier, (reasoning, audit) in zip(_APPROVAL_TIER, _ESCALATION_OUTCOMES)
+)
+
+
+def _exceeded_levels(thresholds: np.ndarray, values: np.ndarray, side: str = 'left') -> np.ndarray:
+    """Number of ascending thresholds each value exceeds (NaN values exceed none)."""
+    levels = np.searchsorted(thresholds, values, side=side)
+    levels[np.isnan(values)] = 0
+    return levels
+
+
+@njit(cache=True, nogil=True)
+def _ladder_level(thresholds: np.ndarray, value: float, inclusive: bool) -> int:
+    """Number of ascending thresholds value exceeds (or reaches, if inclusive); NaN exceeds none."""
+    if np.isnan(value):
+        return 0
+    if inclusive:
+        return np.searchsorted(thresholds, value, side='right')
+    return np.searchsorted(thresholds, value)
+
+
+@njit(cache=True, nogil=True)
+def _record_ladder(evaluations: np.ndarray, row: int, metric: int, level: int) -> None:
+    """Record a threshold ladder outcome, level being the number of exceeded thresholds."""
+    evaluations[row]['escalation'] = _LADDER_ESCALATION[metric, level]
+    evaluations[row]['violation_mask'] = _LADDER_VIOLATIONS[metric, level]
+    evaluations[row]['warning_mask'] = _LADDER_WARNINGS[metric, level]
+
+
+@njit(cache=True, nogil=True)
+def _evaluate_all(evaluations: np.ndarray, thresholds: np.ndarray,
+                  current_inventory: float, current_reliability: float,
+                  reorder_point: float, safety_stock: float, max_order_volume: float,
+                  cost: float, lead_time: float, service_level: float, disruption_severity: float,
+                  on_time_delivery: float, co2_emissions: float,
+                  lead_time_baseline: float, critical_penalty: float, cost_penalty: float) -> None:
+    """Evaluate every rule group against STRICT thresholds into a zeroed EVALUATION_DTYPE record."""
+    # Inventory levels (estimated safety stock and reorder point)
+    action = 0
+    if current_inventory < safety_stock * 0.5:
+        action = 1
+    elif current_inventory < safety_stock:
+        action = 2
+    elif current_inventory < reorder_point:
+        action = 3
+    if action:
+        evaluations[EVAL_INVENTORY]['action'] = action
+        evaluations[EVAL_INVENTORY]['escalation'] = _ACTION_ESCALATION[action]
+        evaluations[EVAL_INVENTORY]['quantity'] = max_order_volume * _INVENTORY_QUANTITY_FACTOR[action]
+        evaluations[EVAL_INVENTORY]['violation_mask'] = _INVENTORY_VIOLATIONS[action]
+        evaluations[EVAL_INVENTORY]['warning_mask'] = _INVENTORY_WARNINGS[action]
+    
+    # Supplier reliability
+    action = 0
+    if current_reliability < 0.70:
+        action = 1
+    elif current_reliability < 0.80:
+        action = 2
+    elif current_reliability < 0.85:
+        action = 3
+    if action:
+        evaluations[EVAL_SUPPLIER]['action'] = action
+        evaluations[EVAL_SUPPLIER]['escalation'] = _ACTION_ESCALATION[action]
+        evaluations[EVAL_SUPPLIER]['violation_mask'] = _SUPPLIER_VIOLATIONS[action]
+        evaluations[EVAL_SUPPLIER]['warning_mask'] = _SUPPLIER_WARNINGS[action]
+    
+    # Threshold ladders: each level is the number of exceeded thresholds
+    level = _ladder_level(thresholds[COST], cost, False)
+    if level == 5:
+        evaluations[EVAL_COST]['impact'] = cost * critical_penalty
+    elif level == 4:
+        evaluations[EVAL_COST]['impact'] = cost * cost_penalty
+    _record_ladder(evaluations, EVAL_COST, COST, level)
+    
+    level = _ladder_level(thresholds[LEAD_TIME], lead_time, False)
+    if level >= 4:
+        evaluations[EVAL_LEAD_TIME]['delay'] = lead_time - lead_time_baseline
+    _record_ladder(evaluations, EVAL_LEAD_TIME, LEAD_TIME, level)
+    
+    # Service level thresholds are negated
+    _record_ladder(evaluations, EVAL_SERVICE_LEVEL, SERVICE_LEVEL,
+                   _ladder_level(thresholds[SERVICE_LEVEL], -service_level, False))
+    
+    # Disruption severity escalates on reaching a threshold
+    _record_ladder(evaluations, EVAL_DISRUPTION, DISRUPTION,
+                   _ladder_level(thresholds[DISRUPTION], disruption_severity, True))
+    
+    # Transport mode: only change on failure, never optimize
+    if on_time_delivery < 80:
+        evaluations[EVAL_TRANSPORT]['action'] = 1
+        evaluations[EVAL_TRANSPORT]['violation_mask'] = _TRANSPORT_VIOLATION
+    
+    # CO2 emissions (no effect on the escalation level)
+    if co2_emissions > 20000:
+        evaluations[EVAL_EMISSIONS]['violation_mask'] = _EMISSIONS_VIOLATION
+    elif co2_emissions > 15000:
+        evaluations[EVAL_EMISSIONS]['warning_mask'] = _EMISSIONS_WARNING
+
 
 class ComprehensiveTraditionalRulesFramework:
     """
@@ -47,84 +324,57 @@ class ComprehensiveTraditionalRulesFramework:
     def compute_global_baseline_metrics(self) -> None:
         """Compute baseline metrics from REAL data for comparison."""
         
-        # Cost baseline (STRICT)
-        self.cost_baseline = self.ghsc_data['Freight_Cost_USD'].mean()
-        self.cost_std = self.ghsc_data['Freight_Cost_USD'].std()
-        
-        # Service level baseline (STRICT)
-        self.service_level_baseline = self.ghsc_data['On_Time_Delivery_%'].mean() / 100.0
-        
-        # Lead time baseline (STRICT)
-        self.lead_time_baseline = self.ghsc_data['Lead_Time_Days'].mean()
-        self.lead_time_max = self.ghsc_data['Lead_Time_Days'].max()
-        
-        # Reliability baseline (STRICT)
-        self.reliability_baseline = self.ghsc_data['Supplier_Reliability_Score'].mean()
-        
-        # Stockout baseline (STRICT)
-        self.stockout_baseline = self.ghsc_data['Stockout_Frequency_per_Year'].mean()
-        
-        # Disruption baseline
-        self.disruption_baseline = self.ghsc_data['Disruption_Severity'].mean()
+        # One contiguous float64 block for all baseline columns, reduced column-wise
+        # (NaN-skipping, like the pandas reductions)
+        values = self.ghsc_data[_BASELINE_COLUMNS].to_numpy(dtype=np.float64)
+        (cost_mean, on_time_mean, lead_time_mean,
+         reliability_mean, stockout_mean, disruption_mean) = np.nanmean(values, axis=0)
+        
+        self.baselines = Baselines(
+            cost=float(cost_mean),  # Cost baseline (STRICT)
+            cost_std=float(np.nanstd(values[:, 0], ddof=1)),
+            service_level=float(on_time_mean / 100.0),  # Service level baseline (STRICT)
+            lead_time=float(lead_time_mean),  # Lead time baseline (STRICT)
+            lead_time_max=float(np.nanmax(values[:, 2])),
+            reliability=float(reliability_mean),  # Reliability baseline (STRICT)
+            stockout=float(stockout_mean),  # Stockout baseline (STRICT)
+            disruption=float(disruption_mean),  # Disruption baseline
+        )
+        
+        # Performance metrics only depend on the baselines, so build them once here
+        self._system_performance = self._build_system_performance()
         
     def compute_multi_level_escalation_thresholds(self) -> None:
         """Compute 5-level escalation thresholds for ALL metrics."""
         
-        self.escalation_thresholds = {
-            # Cost thresholds (5 levels)
-            'cost': {
-                'level_1_monitor': self.cost_baseline * 1.10,
-                'level_2_alert': self.cost_baseline * 1.25,
-                'level_3_warning': self.cost_baseline * 1.50,
-                'level_4_critical': self.cost_baseline * 1.75,
-                'level_5_emergency': self.cost_baseline * 2.00,
-            },
-            
-            # Lead time thresholds (5 levels)
-            'lead_time': {
-                'level_1_monitor': self.lead_time_baseline * 1.10,
-                'level_2_alert': self.lead_time_baseline * 1.25,
-                'level_3_warning': self.lead_time_baseline * 1.50,
-                'level_4_critical': self.lead_time_baseline * 1.75,
-                'level_5_emergency': self.lead_time_baseline * 2.00,
-            },
-            
-            # Reliability thresholds (5 levels - INVERTED)
-            'reliability': {
-                'level_1_monitor': self.reliability_baseline * 0.98,
-                'level_2_alert': self.reliability_baseline * 0.95,
-                'level_3_warning': self.reliability_baseline * 0.90,
-                'level_4_critical': self.reliability_baseline * 0.85,
-                'level_5_emergency': self.reliability_baseline * 0.80,
-            },
-            
-            # Service level thresholds (5 levels - INVERTED)
-            'service_level': {
-                'level_1_monitor': self.service_level_baseline * 0.98,
-                'level_2_alert': self.service_level_baseline * 0.95,
-                'level_3_warning': self.service_level_baseline * 0.90,
-                'level_4_critical': self.service_level_baseline * 0.85,
-                'level_5_emergency': self.service_level_baseline * 0.75,
-            },
-            
-            # Stockout thresholds (5 levels)
-            'stockout': {
-                'level_1_monitor': self.stockout_baseline * 1.20,
-                'level_2_alert': self.stockout_baseline * 1.50,
-                'level_3_warning': self.stockout_baseline * 2.00,
-                'level_4_critical': self.stockout_baseline * 3.00,
-                'level_5_emergency': self.stockout_baseline * 4.00,
-            },
-            
-            # Disruption thresholds (5 levels)
-            'disruption': {
-                'level_1_monitor': 1,
-                'level_2_alert': 2,
-                'level_3_warning': 3,
-                'level_4_critical': 4,
-                'level_5_emergency': 5,
-            },
-        }
+        # Reliability and service level rows are negated, so every row ascends and each
+        # check is `value > threshold` (or `-value > threshold` for the inverted metrics)
+        baselines = np.array([
+            self.baselines.cost,
+            self.baselines.lead_time,
+            -self.baselines.reliability,
+            -self.baselines.service_level,
+            self.baselines.stockout,
+            1.0,
+        ])
+        self.escalation_thresholds = baselines[:, None] * _ESCALATION_MULTIPLIERS
+        
+        # Memoize rule evaluations on the exact context values; the thresholds are not part
+        # of the key, so each threshold table gets a fresh cache
+        self._evaluate_rules_cached = functools.lru_cache(maxsize=4096)(self._evaluate_rules)
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle the rules without the evaluation cache and performance view (neither is picklable)."""
+        state = self.__dict__.copy()
+        del state['_evaluate_rules_cached']
+        del state['_system_performance']
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore the rules, rebuilding the performance view and starting a fresh evaluation cache."""
+        self.__dict__.update(state)
+        self._evaluate_rules_cached = functools.lru_cache(maxsize=4096)(self._evaluate_rules)
+        self._system_performance = self._build_system_performance()
     
     def compute_compliance_violation_penalties(self) -> None:
         """Compute penalty multipliers for compliance violations."""
@@ -171,374 +421,230 @@ class ComprehensiveTraditionalRulesFramework:
         Returns DETAILED decision with violations, escalation level, and penalties.
         """
         
-        # Initialize comprehensive decision
+        # ===== COMPREHENSIVE EVALUATION =====
+        
+        # Unpack the context once into typed locals; on-time delivery feeds both the
+        # service level and transport rules, with different defaults when missing
+        get = context.get
+        reorder_point = float(get('estimated_reorder_point', 5000000))
+        safety_stock = float(get('estimated_safety_stock', 3000000))
+        max_order_volume = float(get('max_order_volume', 5000000))
+        cost = float(get('Freight_Cost_USD', self.baselines.cost))
+        lead_time = float(get('Lead_Time_Days', self.baselines.lead_time))
+        on_time_delivery = get('On_Time_Delivery_%')
+        disruption_severity = float(get('Disruption_Severity', 0))
+        co2_emissions = float(get('CO2_Emissions_tons', 0))
+        if on_time_delivery is None:
+            on_time_delivery = 100.0
+            service_level = self.baselines.service_level * 100 / 100  # same rounding as the batch path
+        else:
+            on_time_delivery = float(on_time_delivery)
+            service_level = on_time_delivery / 100
+        
+        evaluation = self._evaluate_rules_cached(
+            float(current_inventory), float(current_reliability),
+            reorder_point, safety_stock, max_order_volume,
+            cost, lead_time, float(service_level), disruption_severity,
+            on_time_delivery, co2_emissions,
+            self.baselines.lead_time,
+            float(self.violation_penalties['critical_violation']),
+            float(self.violation_penalties['cost_violation']),
+        )
+        
+        # 9. COMPLIANCE SCORE CALCULATION
+        compliance_score = (_VIOLATION_COMPLIANCE[len(evaluation.violations)]
+                            * _WARNING_COMPLIANCE[len(evaluation.warnings)])
+        
+        # 10-11. APPROVAL REQUIREMENTS AND FINAL ACTION (every decision needs approval;
+        # the tier, its delay and the reasoning all follow the escalation level)
+        approval_level, approval_delay_hours, reasoning, audit = \
+            _ESCALATION_DECISION_FIELDS[min(evaluation.escalation_level, 5)]
+        
+        # Build the comprehensive decision once, with its final values
         decision = {
             'decision_type': 'integrated_supply_chain',
             'commodity': commodity,
             'country': country,
             'warehouse_type': warehouse_type,
-            'timestamp': pd.Timestamp.now().isoformat(),
+            'timestamp_ns': time.time_ns(),  # format with ts_to_iso when serializing
             
             # Inventory metrics
             'current_inventory': current_inventory,
             'current_reliability': current_reliability,
             
-            # Decision outputs
-            'procurement_action': 'none',
-            'transport_mode': 'continue_current',
-            'supplier_action': 'continue_primary',
-            'quantity_to_order': 0,
+            # Decision outputs (action code 0 keeps the current action)
+            'procurement_action': evaluation.procurement_action,
+            'transport_mode': evaluation.transport_mode,
+            'supplier_action': evaluation.supplier_action,
+            'quantity_to_order': evaluation.quantity_to_order,
             
             # Compliance tracking
-            'violations': [],
-            'warnings': [],
+            'violations': list(evaluation.violations),
+            'warnings': list(evaluation.warnings),
             'penalties': [],
-            'compliance_score': 1.0,
-            'escalation_level': 0,
+            'compliance_score': compliance_score,
+            'escalation_level': evaluation.escalation_level,
             
             # Approval requirements
-            'approval_required': False,
-            'approval_level': None,
-            'approval_delay_hours': 0,
+            'approval_required': True,
+            'approval_level': approval_level,
+            'approval_delay_hours': approval_delay_hours,
             
             # Financial impact
-            'estimated_cost_impact': 0.0,
-            'estimated_delay': 0,
+            'estimated_cost_impact': evaluation.estimated_cost_impact,
+            'estimated_delay': evaluation.estimated_delay,
             
             # Reasoning and audit trail
-            'reasoning': [],
-            'audit_trail': [],
+            'reasoning': [reasoning],
+            'audit_trail': [audit],
         }
         
-        # ===== COMPREHENSIVE EVALUATION =====
-        
-        # 1. INVENTORY LEVEL EVALUATION
-        inventory_evaluation = self._evaluate_inventory(current_inventory, context)
-        decision['violations'].extend(inventory_evaluation['violations'])
-        decision['warnings'].extend(inventory_evaluation['warnings'])
-        decision['escalation_level'] = max(decision['escalation_level'], 
-                                           inventory_evaluation['escalation_level'])
-        if inventory_evaluation['action'] != 'none':
-            decision['procurement_action'] = inventory_evaluation['action']
-            decision['quantity_to_order'] = inventory_evaluation['quantity']
-        
-        # 2. SUPPLIER RELIABILITY EVALUATION
-        reliability_evaluation = self._evaluate_supplier_reliability(current_reliability, context)
-        decision['violations'].extend(reliability_evaluation['violations'])
-        decision['warnings'].extend(reliability_evaluation['warnings'])
-        decision['escalation_level'] = max(decision['escalation_level'], 
-                                          reliability_evaluation['escalation_level'])
-        if reliability_evaluation['action'] != 'continue':
-            decision['supplier_action'] = reliability_evaluation['action']
-        
-        # 3. COST EVALUATION
-        cost_evaluation = self._evaluate_costs(context)
-        decision['violations'].extend(cost_evaluation['violations'])
-        decision['warnings'].extend(cost_evaluation['warnings'])
-        decision['escalation_level'] = max(decision['escalation_level'], 
-                                          cost_evaluation['escalation_level'])
-        decision['estimated_cost_impact'] = cost_evaluation['impact']
-        
-        # 4. LEAD TIME EVALUATION
-        lead_time_evaluation = self._evaluate_lead_time(context)
-        decision['violations'].extend(lead_time_evaluation['violations'])
-        decision['warnings'].extend(lead_time_evaluation['warnings'])
-        decision['escalation_level'] = max(decision['escalation_level'], 
-                                          lead_time_evaluation['escalation_level'])
-        decision['estimated_delay'] = lead_time_evaluation['delay']
-        
-        # 5. SERVICE LEVEL EVALUATION
-        service_evaluation = self._evaluate_service_level(context)
-        decision['violations'].extend(service_evaluation['violations'])
-        decision['warnings'].extend(service_evaluation['warnings'])
-        decision['escalation_level'] = max(decision['escalation_level'], 
-                                          service_evaluation['escalation_level'])
-        
-        # 6. DISRUPTION EVALUATION
-        disruption_evaluation = self._evaluate_disruption(context)
-        decision['violations'].extend(disruption_evaluation['violations'])
-        decision['warnings'].extend(disruption_evaluation['warnings'])
-        decision['escalation_level'] = max(decision['escalation_level'], 
-                                          disruption_evaluation['escalation_level'])
-        
-        # 7. TRANSPORT MODE EVALUATION
-        transport_evaluation = self._evaluate_transport_mode(context)
-        if transport_evaluation['action'] != 'continue_current':
-            decision['transport_mode'] = transport_evaluation['action']
-        decision['violations'].extend(transport_evaluation['violations'])
-        decision['warnings'].extend(transport_evaluation['warnings'])
-        
-        # 8. EMISSIONS EVALUATION
-        emissions_evaluation = self._evaluate_emissions(context)
-        decision['violations'].extend(emissions_evaluation['violations'])
-        decision['warnings'].extend(emissions_evaluation['warnings'])
-        
-        # 9. COMPLIANCE SCORE CALCULATION
-        violation_count = len(decision['violations'])
-        warning_count = len(decision['warnings'])
-        
-        if violation_count > 0:
-            if violation_count >= 3:
-                decision['compliance_score'] *= 0.5
-            else:
-                decision['compliance_score'] *= (0.9 ** violation_count)
-        
-        if warning_count > 0:
-            decision['compliance_score'] *= (0.95 ** warning_count)
-        
-        # 10. DETERMINE APPROVAL REQUIREMENTS
-        self._set_approval_requirements(decision)
-        
-        # 11. FINAL ACTION DETERMINATION
-        self._determine_final_actions(decision)
-        
         return decision
     
-    def _evaluate_inventory(self, current_inventory: float, context: Dict[str, Any]) -> Dict[str, Any]:
-        """Evaluate inventory levels against STRICT thresholds."""
-        evaluation = {
-            'violations': [],
-            'warnings': [],
-            'escalation_level': 0,
-            'action': 'none',
-            'quantity': 0,
-        }
-        
-        # Use estimated safety stock and reorder point
-        reorder_point = context.get('estimated_reorder_point', 5000000)
-        safety_stock = context.get('estimated_safety_stock', 3000000)
-        
-        if current_inventory < safety_stock * 0.5:
-            evaluation['violations'].append('critical_inventory_depletion')
-            evaluation['escalation_level'] = 5
-            evaluation['action'] = 'emergency_procurement_maximum'
-            evaluation['quantity'] = context.get('max_order_volume', 5000000)
-        elif current_inventory < safety_stock:
-            evaluation['violations'].append('inventory_below_safety_stock')
-            evaluation['escalation_level'] = 4
-            evaluation['action'] = 'emergency_procurement'
-            evaluation['quantity'] = context.get('max_order_volume', 5000000) * 0.8
-        elif current_inventory < reorder_point:
-            evaluation['warnings'].append('inventory_below_reorder_point')
-            evaluation['escalation_level'] = 2
-            evaluation['action'] = 'standard_replenishment'
-            evaluation['quantity'] = context.get('max_order_volume', 5000000) * 0.6
-        
-        return evaluation
-    
-    def _evaluate_supplier_reliability(self, current_reliability: float, context: Dict[str, Any]) -> Dict[str, Any]:
-        """Evaluate supplier reliability against STRICT thresholds."""
-        evaluation = {
-            'violations': [],
-            'warnings': [],
-            'escalation_level': 0,
-            'action': 'continue',
-        }
-        
-        if current_reliability < 0.70:
-            evaluation['violations'].append('critical_supplier_failure')
-            evaluation['escalation_level'] = 5
-            evaluation['action'] = 'switch_backup_supplier_emergency'
-        elif current_reliability < 0.80:
-            evaluation['violations'].append('supplier_reliability_failure')
-            evaluation['escalation_level'] = 4
-            evaluation['action'] = 'escalate_management'
-        elif current_reliability < 0.85:
-            evaluation['warnings'].append('supplier_reliability_degradation')
-            evaluation['escalation_level'] = 2
-            evaluation['action'] = 'increase_monitoring'
-        
-        return evaluation
-    
-    def _evaluate_costs(self, context: Dict[str, Any]) -> Dict[str, Any]:
-        """Evaluate costs against STRICT thresholds."""
-        evaluation = {
-            'violations': [],
-            'warnings': [],
-            'escalation_level': 0,
-            'impact': 0.0,
-        }
-        
-        cost = context.get('Freight_Cost_USD', self.cost_baseline)
-        
-        if cost > self.escalation_thresholds['cost']['level_5_emergency']:
-            evaluation['violations'].append('emergency_cost_exceeded')
-            evaluation['escalation_level'] = 5
-            evaluation['impact'] = cost * self.violation_penalties['critical_violation']
-        elif cost > self.escalation_thresholds['cost']['level_4_critical']:
-            evaluation['violations'].append('critical_cost_exceeded')
-            evaluation['escalation_level'] = 4
-            evaluation['impact'] = cost * self.violation_penalties['cost_violation']
-        elif cost > self.escalation_thresholds['cost']['level_3_warning']:
-            evaluation['warnings'].append('cost_warning')
-            evaluation['escalation_level'] = 2
-        
-        return evaluation
-    
-    def _evaluate_lead_time(self, context: Dict[str, Any]) -> Dict[str, Any]:
-        """Evaluate lead time against STRICT thresholds."""
-        evaluation = {
-            'violations': [],
-            'warnings': [],
-            'escalation_level': 0,
-            'delay': 0,
-        }
-        
-        lead_time = context.get('Lead_Time_Days', self.lead_time_baseline)
-        
-        if lead_time > self.escalation_thresholds['lead_time']['level_5_emergency']:
-            evaluation['violations'].append('emergency_lead_time_exceeded')
-            evaluation['escalation_level'] = 5
-            evaluation['delay'] = lead_time - self.lead_time_baseline
-        elif lead_time > self.escalation_thresholds['lead_time']['level_4_critical']:
-            evaluation['violations'].append('critical_lead_time_exceeded')
-            evaluation['escalation_level'] = 4
-            evaluation['delay'] = lead_time - self.lead_time_baseline
-        elif lead_time > self.escalation_thresholds['lead_time']['level_3_warning']:
-            evaluation['warnings'].append('lead_time_warning')
-            evaluation['escalation_level'] = 2
-        
-        return evaluation
-    
-    def _evaluate_service_level(self, context: Dict[str, Any]) -> Dict[str, Any]:
-        """Evaluate service level against STRICT thresholds."""
-        evaluation = {
-            'violations': [],
-            'warnings': [],
-            'escalation_level': 0,
-        }
-        
-        service_level = context.get('On_Time_Delivery_%', self.service_level_baseline * 100) / 100
-        
-        if service_level < self.escalation_thresholds['service_level']['level_5_emergency']:
-            evaluation['violations'].append('emergency_service_failure')
-            evaluation['escalation_level'] = 5
-        elif service_level < self.escalation_thresholds['service_level']['level_4_critical']:
-            evaluation['violations'].append('critical_service_failure')
-            evaluation['escalation_level'] = 4
-        elif service_level < self.escalation_thresholds['service_level']['level_3_warning']:
-            evaluation['warnings'].append('service_level_warning')
-            evaluation['escalation_level'] = 2
-        
-        return evaluation
-    
-    def _evaluate_disruption(self, context: Dict[str, Any]) -> Dict[str, Any]:
-        """Evaluate disruption impact with STRICT escalation."""
-        evaluation = {
-            'violations': [],
-            'warnings': [],
-            'escalation_level': 0,
-        }
+    def _evaluate_rules(self, *values: float) -> RuleEvaluation:
+        """
+        Evaluate every rule group for one set of context values (see _evaluate_all).
         
-        disruption_severity = context.get('Disruption_Severity', 0)
-        
-        if disruption_severity >= 5:
-            evaluation['violations'].append('severe_disruption_level_5')
-            evaluation['escalation_level'] = 5
-        elif disruption_severity >= 4:
-            evaluation['violations'].append('severe_disruption_level_4')
-            evaluation['escalation_level'] = 4
-        elif disruption_severity >= 3:
-            evaluation['warnings'].append('major_disruption_level_3')
-            evaluation['escalation_level'] = 3
-        elif disruption_severity >= 2:
-            evaluation['warnings'].append('moderate_disruption_level_2')
-            evaluation['escalation_level'] = 2
-        
-        return evaluation
+        All eight rule groups are evaluated by one compiled kernel, each into its own
+        row of a fixed-layout record:
+        1. inventory level, 2. supplier reliability, 3. cost, 4. lead time,
+        5. service level, 6. disruption, 7. transport mode, 8. emissions
+        """
+        evaluations = np.zeros(len(EVALUATIONS), dtype=EVALUATION_DTYPE)
+        _evaluate_all(evaluations, self.escalation_thresholds, *values)
+        
+        # Name bits are laid out in evaluation order, so the names keep that order;
+        # action code 0 keeps the current action
+        return RuleEvaluation(
+            procurement_action=INVENTORY_ACTIONS[evaluations[EVAL_INVENTORY]['action']],
+            transport_mode=TRANSPORT_ACTIONS[evaluations[EVAL_TRANSPORT]['action']],
+            supplier_action=SUPPLIER_ACTIONS[evaluations[EVAL_SUPPLIER]['action']],
+            quantity_to_order=float(evaluations[EVAL_INVENTORY]['quantity']),
+            violations=tuple(_mask_names(int(np.bitwise_or.reduce(evaluations['violation_mask'])), VIOLATION_NAMES)),
+            warnings=tuple(_mask_names(int(np.bitwise_or.reduce(evaluations['warning_mask'])), WARNING_NAMES)),
+            escalation_level=int(evaluations['escalation'].max()),
+            estimated_cost_impact=float(evaluations[EVAL_COST]['impact']),
+            estimated_delay=float(evaluations[EVAL_LEAD_TIME]['delay']),
+        )
     
-    def _evaluate_transport_mode(self, context: Dict[str, Any]) -> Dict[str, Any]:
-        """Evaluate transport mode selection."""
-        evaluation = {
-            'violations': [],
-            'warnings': [],
-            'action': 'continue_current',
-        }
-        
-        # Transport mode selection based on cost and reliability
-        transport_mode = context.get('Transport_Mode', 'Road')
-        
-        # Strict rules: only change on failure, never optimize
-        if context.get('On_Time_Delivery_%', 100) < 80:
-            evaluation['action'] = 'escalate_transport_review'
-            evaluation['violations'].append('transport_reliability_critical')
+    def make_integrated_supply_chain_decisions(self,
+                                              contexts: pd.DataFrame,
+                                              current_inventory: np.ndarray,
+                                              current_reliability: np.ndarray) -> pd.DataFrame:
+        """
+        Vectorized make_integrated_supply_chain_decision over many contexts.
         
-        return evaluation
-    
-    def _evaluate_emissions(self, context: Dict[str, Any]) -> Dict[str, Any]:
-        """Evaluate CO2 emissions against thresholds."""
-        evaluation = {
-            'violations': [],
-            'warnings': [],
+        `contexts` holds one context per row (missing columns take the same defaults as
+        the scalar rules); `current_inventory` and `current_reliability` give the matching
+        per-row levels. Returns one row of decision outputs per context, with violations
+        and warnings as bit masks over VIOLATION_NAMES / WARNING_NAMES and their counts.
+        """
+        n = len(contexts)
+        
+        def column(name: str, default: float) -> np.ndarray:
+            if name in contexts:
+                return contexts[name].to_numpy(dtype=np.float64)
+            return np.full(n, default, dtype=np.float64)
+        
+        inventory = np.asarray(current_inventory, dtype=np.float64)
+        reliability = np.asarray(current_reliability, dtype=np.float64)
+        thresholds = self.escalation_thresholds
+        
+        # 1. Inventory: action codes index INVENTORY_ACTIONS
+        safety_stock = column('estimated_safety_stock', 3000000)
+        max_order_volume = column('max_order_volume', 5000000)
+        inventory_action = np.select(
+            [inventory < safety_stock * 0.5, inventory < safety_stock,
+             inventory < column('estimated_reorder_point', 5000000)],
+            [1, 2, 3], 0).astype(np.int8)
+        quantity = np.where(inventory_action > 0,
+                            max_order_volume * _INVENTORY_QUANTITY_FACTOR[inventory_action], 0.0)
+        
+        # 2. Supplier reliability: action codes index SUPPLIER_ACTIONS
+        supplier_action = np.select([reliability < 0.70, reliability < 0.80, reliability < 0.85],
+                                    [1, 2, 3], 0).astype(np.int8)
+        
+        # 3-6. Threshold ladders
+        cost = column('Freight_Cost_USD', self.baselines.cost)
+        lead_time = column('Lead_Time_Days', self.baselines.lead_time)
+        service_level = column('On_Time_Delivery_%', self.baselines.service_level * 100) / 100
+        ladder_levels = {
+            COST: _exceeded_levels(thresholds[COST], cost),
+            LEAD_TIME: _exceeded_levels(thresholds[LEAD_TIME], lead_time),
+            SERVICE_LEVEL: _exceeded_levels(thresholds[SERVICE_LEVEL], -service_level),
+            DISRUPTION: _exceeded_levels(thresholds[DISRUPTION], column('Disruption_Severity', 0), side='right'),
         }
         
-        co2_emissions = context.get('CO2_Emissions_tons', 0)
-        
-        if co2_emissions > 20000:
-            evaluation['violations'].append('extreme_co2_emissions')
-            evaluation['escalation_level'] = 3
-        elif co2_emissions > 15000:
-            evaluation['warnings'].append('high_co2_emissions')
-            evaluation['escalation_level'] = 1
-        
-        return evaluation
+        impact = np.select([ladder_levels[COST] == 5, ladder_levels[COST] == 4],
+                           [cost * self.violation_penalties['critical_violation'],
+                            cost * self.violation_penalties['cost_violation']], 0.0)
+        delay = np.where(ladder_levels[LEAD_TIME] >= 4, lead_time - self.baselines.lead_time, 0.0)
+        
+        # 7. Transport mode: action codes index TRANSPORT_ACTIONS
+        transport_action = (column('On_Time_Delivery_%', 100) < 80).astype(np.int8)
+        
+        # 8. Emissions
+        co2_emissions = column('CO2_Emissions_tons', 0)
+        
+        # Per-evaluator escalation levels and mask bits (at most one violation and one warning each)
+        escalations = [
+            _ACTION_ESCALATION[inventory_action],
+            _ACTION_ESCALATION[supplier_action],
+            *(_LADDER_ESCALATION[metric][levels] for metric, levels in ladder_levels.items()),
+        ]
+        violation_masks = [
+            _INVENTORY_VIOLATIONS[inventory_action],
+            _SUPPLIER_VIOLATIONS[supplier_action],
+            *(_LADDER_VIOLATIONS[metric][levels] for metric, levels in ladder_levels.items()),
+            np.where(transport_action > 0, _TRANSPORT_VIOLATION, 0),
+            np.where(co2_emissions > 20000, _EMISSIONS_VIOLATION, 0),
+        ]
+        warning_masks = [
+            _INVENTORY_WARNINGS[inventory_action],
+            _SUPPLIER_WARNINGS[supplier_action],
+            *(_LADDER_WARNINGS[metric][levels] for metric, levels in ladder_levels.items()),
+            np.where((co2_emissions > 15000) & ~(co2_emissions > 20000), _EMISSIONS_WARNING, 0),
+        ]
+        
+        escalation_level = np.maximum.reduce(escalations)
+        approval_tier = _APPROVAL_TIER[escalation_level]
+        violation_count = sum((mask != 0).astype(np.int64) for mask in violation_masks)
+        warning_count = sum((mask != 0).astype(np.int64) for mask in warning_masks)
+        compliance_score = np.array(_VIOLATION_COMPLIANCE)[violation_count] * np.array(_WARNING_COMPLIANCE)[warning_count]
+        
+        return pd.DataFrame({
+            'procurement_action': pd.Categorical.from_codes(inventory_action, INVENTORY_ACTIONS),
+            'quantity_to_order': quantity,
+            'supplier_action': pd.Categorical.from_codes(supplier_action, SUPPLIER_ACTIONS),
+            'transport_mode': pd.Categorical.from_codes(transport_action, TRANSPORT_ACTIONS),
+            'violation_mask': np.bitwise_or.reduce(violation_masks).astype(np.uint16),
+            'warning_mask': np.bitwise_or.reduce(warning_masks).astype(np.uint16),
+            'violation_count': violation_count,
+            'warning_count': warning_count,
+            'compliance_score': compliance_score,
+            'escalation_level': escalation_level,
+            'approval_required': np.ones(n, dtype=bool),
+            'approval_level': pd.Categorical.from_codes(approval_tier, APPROVAL_LEVELS),
+            'approval_delay_hours': _APPROVAL_DELAY_HOURS[approval_tier],
+            'estimated_cost_impact': impact,
+            'estimated_delay': delay,
+        }, index=contexts.index)
     
-    def _set_approval_requirements(self, decision: Dict[str, Any]) -> None:
-        """Set approval requirements based on escalation level."""
-        
-        escalation_level = decision['escalation_level']
-        
-        if escalation_level >= 5:
-            decision['approval_required'] = True
-            decision['approval_level'] = 'executive_team'
-            decision['approval_delay_hours'] = 0.5  # 30 minutes for absolute emergencies
-        elif escalation_level >= 4:
-            decision['approval_required'] = True
-            decision['approval_level'] = 'director_and_cfo'
-            decision['approval_delay_hours'] = 2
-        elif escalation_level >= 3:
-            decision['approval_required'] = True
-            decision['approval_level'] = 'director'
-            decision['approval_delay_hours'] = 6
-        elif escalation_level >= 2:
-            decision['approval_required'] = True
-            decision['approval_level'] = 'manager'
-            decision['approval_delay_hours'] = 12
-        else:
-            decision['approval_required'] = True
-            decision['approval_level'] = 'supervisor'
-            decision['approval_delay_hours'] = 24
-    
-    def _determine_final_actions(self, decision: Dict[str, Any]) -> None:
-        """Determine final action based on all evaluations."""
-        
-        if decision['escalation_level'] >= 5:
-            decision['reasoning'].append('Critical emergency - multiple severe violations')
-            decision['audit_trail'].append('EXECUTIVE ESCALATION TRIGGERED')
-        elif decision['escalation_level'] >= 4:
-            decision['reasoning'].append('Critical violations detected - immediate management intervention required')
-            decision['audit_trail'].append('DIRECTOR ESCALATION TRIGGERED')
-        elif decision['escalation_level'] >= 3:
-            decision['reasoning'].append('Significant violations - escalation to director level')
-            decision['audit_trail'].append('MANAGER ESCALATION TRIGGERED')
-        elif decision['escalation_level'] >= 2:
-            decision['reasoning'].append('Warnings and minor violations - increased monitoring')
-            decision['audit_trail'].append('SUPERVISOR REVIEW TRIGGERED')
-        else:
-            decision['reasoning'].append('All metrics within acceptable range - continue current operations')
-            decision['audit_trail'].append('ROUTINE MONITORING')
+    def calculate_traditional_system_performance(self) -> MappingProxyType:
+        """Calculate COMPREHENSIVE traditional system performance metrics (read-only, built with the baselines)."""
+        return self._system_performance
     
-    def calculate_traditional_system_performance(self) -> Dict[str, float]:
-        """Calculate COMPREHENSIVE traditional system performance metrics."""
+    def _build_system_performance(self) -> MappingProxyType:
+        """Build the read-only traditional system performance metrics from the baselines."""
         
-        return {
+        return MappingProxyType({
             # Core metrics
-            'avg_lead_time_days': self.lead_time_baseline,
-            'avg_cost_usd': self.cost_baseline,
-            'avg_on_time_delivery_pct': self.service_level_baseline * 100,
-            'avg_supplier_reliability': self.reliability_baseline,
-            'avg_stockout_frequency': self.stockout_baseline,
-            'avg_disruption_severity': self.disruption_baseline,
+            'avg_lead_time_days': self.baselines.lead_time,
+            'avg_cost_usd': self.baselines.cost,
+            'avg_on_time_delivery_pct': self.baselines.service_level * 100,
+            'avg_supplier_reliability': self.baselines.reliability,
+            'avg_stockout_frequency': self.baselines.stockout,
+            'avg_disruption_severity': self.baselines.disruption,
             
             # Performance characteristics
             'decision_approval_delay_hours': 24,
@@ -563,11 +669,19 @@ class ComprehensiveTraditionalRulesFramework:
             'conservative_bias': 1.0,  # 1.0 = maximum conservative
             'data_driven_optimization': 0.0,  # 0.0 = not optimized
             'real_time_adjustment': 0.0,  # 0.0 = no real-time adjustment
-        }
+        })
 
 
 if __name__ == "__main__":
-    ghsc_data = pd.read_csv('data/DATA_SPLITS/GHSC_PSM_Synthetic_Resilience_Dataset_v2_consistent_traindata.csv')
+    import json
+    
+    # Only the numeric columns the rules read, parsed straight to float32 (baselines
+    # still accumulate in float64)
+    columns = _BASELINE_COLUMNS + ['CO2_Emissions_tons']
+    ghsc_data = pd.read_csv(
+        'data/DATA_SPLITS/GHSC_PSM_Synthetic_Resilience_Dataset_v2_consistent_traindata.csv',
+        usecols=columns, dtype={column: np.float32 for column in columns},
+    )
     
     framework = ComprehensiveTraditionalRulesFramework(ghsc_data)
     
@@ -595,14 +709,16 @@ if __name__ == "__main__":
         'Malaria_RDT', 'Nigeria', 'Clinic', 4500000, 0.82, test_context
     )
     
-    print("\nIntegrated Supply Chain Decision:")
-    for key, value in decision.items():
-        if key not in ['reasoning', 'audit_trail', 'violations', 'warnings', 'penalties']:
-            print(f"  {key}: {value}")
-        else:
-            print(f"  {key}:")
-            if isinstance(value, list):
-                for item in value:
-                    print(f"    - {item}")
-            else:
-                print(f"    {value}")
+    # One serialized write; --verbose pretty-prints it
+    decision['timestamp'] = ts_to_iso(decision.pop('timestamp_ns'))
+    indent = 2 if '--verbose' in sys.argv[1:] else None
+    sys.stdout.write("\nIntegrated Supply Chain Decision:\n" + json.dumps(decision, default=str, indent=indent) + "\n")
+    
+    # Score every row of the dataset in one vectorized call, at the sample's inventory level
+    results = framework.make_integrated_supply_chain_decisions(
+        ghsc_data, np.full(len(ghsc_data), 4500000.0),
+        ghsc_data['Supplier_Reliability_Score'].to_numpy(),
+    )
+    print(f"\nEscalation levels across {len(results)} decisions:")
+    for level, count in results['escalation_level'].value_counts().sort_index().items():
+        print(f"  level {level}: {count}")
@@ -10,6 +10,9 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Action names indexed by the int8 codes returned from decide_batch
+BATCH_ACTIONS = ('no_action', 'regular_replenishment', 'emergency_procurement')
+
 
 class ReorderSafetyStockRules:
     """
@@ -24,65 +27,80 @@ class ReorderSafetyStockRules:
     
     def __init__(self, ghsc_data: pd.DataFrame):
         """Initialize with GHSC supply chain data."""
-        self.ghsc_data = ghsc_data
+        # Low-cardinality rule keys as categoricals so groupby hashes integer codes
+        self.ghsc_data = ghsc_data.assign(
+            Country=ghsc_data['Country'].astype('category'),
+            Commodity_Type=ghsc_data['Commodity_Type'].astype('category')
+        )
+        agg = self._aggregate_group_statistics()
+        
+        # Structure-of-arrays rule table: one (country, commodity) index plus contiguous per-field columns
+        self._key_index: Dict[Tuple[str, str], int] = {key: i for i, key in enumerate(agg.index)}
+        self._rp, self._dc, self._lt, self._ss, self._demand_std = self._calculate_rule_arrays(agg)
+        # Order quantities only depend on the rule table, so precompute them once
+        self._emergency_qty = self._dc * self._lt * 2.0
+        self._regular_qty = self._dc * self._lt * 1.5
+        
         self.reorder_rules = self._calculate_fixed_reorder_points()
         self.safety_stock_rules = self._calculate_fixed_safety_stocks()
         
+    def _aggregate_group_statistics(self) -> pd.DataFrame:
+        """Aggregate lead time and order volume statistics per Country/Commodity_Type in one pass."""
+        return self.ghsc_data.groupby(['Country', 'Commodity_Type'], sort=False, observed=True).agg(
+            lt=('Lead_Time_Days', 'mean'),
+            vol=('Order_Volume_Units', 'mean'),
+            vol_std=('Order_Volume_Units', 'std'),
+        )
+    
+    def _calculate_rule_arrays(self, agg: pd.DataFrame) -> Tuple[np.ndarray, ...]:
+        """Calculate reorder point, consumption, lead time and safety stock columns for every group."""
+        lead_time = agg['lt'].to_numpy()
+        avg_order_volume = agg['vol'].to_numpy()
+        std_order_volume = agg['vol_std'].to_numpy()
+        
+        # Assume monthly consumption pattern (traditional approach)
+        daily_consumption = avg_order_volume / 30.0  # Fixed assumption
+        
+        # Traditional rule: Reorder point = Average consumption during lead time + Safety margin
+        reorder_point = daily_consumption * lead_time * 1.2  # 20% safety margin (fixed)
+        
+        # Traditional safety stock formula: SS = Z * σ * √(LT)
+        # Where Z = service level factor (fixed), σ = demand std dev, LT = lead time
+        service_level_factor = 1.65  # 95% service level (fixed)
+        daily_demand_std = np.where(np.isnan(std_order_volume),
+                                    avg_order_volume * 0.2 / 30.0,
+                                    std_order_volume / 30.0)
+        safety_stock = service_level_factor * daily_demand_std * np.sqrt(lead_time)
+        
+        # Heuristic rule values carry no precision beyond float32; halves the batch path's memory traffic
+        return tuple(a.astype(np.float32, copy=False) for a in
+                     (reorder_point, daily_consumption, lead_time, safety_stock, daily_demand_std))
+    
     def _calculate_fixed_reorder_points(self) -> Dict[str, Dict[str, float]]:
         """Calculate fixed reorder points by commodity and country using historical data."""
-        reorder_points = {}
-        
-        # Group by Country and Commodity_Type to establish fixed rules
-        for (country, commodity), group in self.ghsc_data.groupby(['Country', 'Commodity_Type']):
-            key = f"{country}_{commodity}"
-            
-            # Traditional rule: Reorder point = Average consumption during lead time + Safety margin
-            avg_lead_time = group['Lead_Time_Days'].mean()
-            avg_order_volume = group['Order_Volume_Units'].mean()
-            
-            # Assume monthly consumption pattern (traditional approach)
-            daily_consumption = avg_order_volume / 30.0  # Fixed assumption
-            
-            # Traditional reorder point calculation
-            reorder_point = daily_consumption * avg_lead_time * 1.2  # 20% safety margin (fixed)
-            
-            reorder_points[key] = {
-                'reorder_point': reorder_point,
-                'daily_consumption': daily_consumption,
-                'lead_time': avg_lead_time,
+        # Public rule tables keep their "country_commodity" string keys; lookups go through _key_index
+        return {
+            f"{country}_{commodity}": {
+                'reorder_point': float(self._rp[i]),
+                'daily_consumption': float(self._dc[i]),
+                'lead_time': float(self._lt[i]),
                 'safety_margin': 0.2  # Fixed 20%
             }
-            
-        return reorder_points
+            for (country, commodity), i in self._key_index.items()
+        }
     
     def _calculate_fixed_safety_stocks(self) -> Dict[str, Dict[str, float]]:
         """Calculate fixed safety stock levels using traditional formulas."""
-        safety_stocks = {}
-        
-        for (country, commodity), group in self.ghsc_data.groupby(['Country', 'Commodity_Type']):
-            key = f"{country}_{commodity}"
-            
-            # Traditional safety stock formula: SS = Z * σ * √(LT)
-            # Where Z = service level factor (fixed), σ = demand std dev, LT = lead time
-            
-            avg_order_volume = group['Order_Volume_Units'].mean()
-            std_order_volume = group['Order_Volume_Units'].std()
-            avg_lead_time = group['Lead_Time_Days'].mean()
-            
-            # Traditional assumptions
-            service_level_factor = 1.65  # 95% service level (fixed)
-            daily_demand_std = (std_order_volume / 30.0) if not pd.isna(std_order_volume) else (avg_order_volume * 0.2 / 30.0)
-            
-            safety_stock = service_level_factor * daily_demand_std * np.sqrt(avg_lead_time)
-            
-            safety_stocks[key] = {
-                'safety_stock': safety_stock,
+        lead_time_factor = np.sqrt(self._lt)
+        return {
+            f"{country}_{commodity}": {
+                'safety_stock': float(self._ss[i]),
                 'service_level': 0.95,  # Fixed target
-                'demand_variability': daily_demand_std,
-                'lead_time_factor': np.sqrt(avg_lead_time)
+                'demand_variability': float(self._demand_std[i]),
+                'lead_time_factor': float(lead_time_factor[i])
             }
-            
-        return safety_stocks
+            for (country, commodity), i in self._key_index.items()
+        }
     
     def get_traditional_inventory_decision(self, country: str, commodity: str, 
                                         current_inventory: float, 
@@ -91,13 +109,11 @@ class ReorderSafetyStockRules:
         Make inventory decision using expanded, strictly enforced rules.
         Strictly penalize deviations and add more emergency triggers.
         """
-        key = f"{country}_{commodity}"
-        if key not in self.reorder_rules:
+        i = self._key_index.get((country, commodity))
+        if i is None:
             return self._get_default_decision(current_inventory)
-        reorder_info = self.reorder_rules[key]
-        safety_info = self.safety_stock_rules[key]
-        reorder_point = reorder_info['reorder_point']
-        safety_stock = safety_info['safety_stock']
+        reorder_point = float(self._rp[i])
+        safety_stock = float(self._ss[i])
         # Strict enforcement: check all relevant columns
         decision = {
             'action': 'no_action',
@@ -143,7 +159,7 @@ class ReorderSafetyStockRules:
             penalties.append('low_on_time_delivery')
         # Decision logic
         if emergency:
-            emergency_quantity = reorder_info['daily_consumption'] * reorder_info['lead_time'] * 2
+            emergency_quantity = float(self._emergency_qty[i])
             decision.update({
                 'action': 'emergency_procurement',
                 'quantity': emergency_quantity,
@@ -152,7 +168,7 @@ class ReorderSafetyStockRules:
                 'penalties': penalties
             })
         elif current_inventory < reorder_point or penalties:
-            regular_quantity = reorder_info['daily_consumption'] * reorder_info['lead_time'] * 1.5
+            regular_quantity = float(self._regular_qty[i])
             decision.update({
                 'action': 'regular_replenishment', 
                 'quantity': regular_quantity,
@@ -164,6 +180,43 @@ class ReorderSafetyStockRules:
             decision['penalties'] = penalties
         return decision
     
+    def decide_batch(self, keys: List[Tuple[str, str]], inventories: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Evaluate the inventory-level reorder rules for many SKUs at once.
+        
+        `keys` holds (country, commodity) rule keys and `inventories` the matching
+        current inventory levels. Only the inventory thresholds are applied (no
+        context-based penalties); unknown keys fall back to the default rules.
+        Action codes index into BATCH_ACTIONS.
+        """
+        # Inventories stay float64 like the scalar path; the float32 rule fields are
+        # promoted exactly in the comparisons, so both paths agree at the thresholds
+        inventories = np.asarray(inventories, dtype=np.float64)
+        idx = np.fromiter((self._key_index.get(k, -1) for k in keys), dtype=np.int64, count=len(keys))
+        known = idx >= 0
+        idx = np.where(known, idx, 0)
+        
+        # Gather per-SKU rule fields; unknown keys take the fixed default thresholds
+        rp = np.where(known, self._rp[idx], np.float32(1000.0))
+        ss = np.where(known, self._ss[idx], np.float32(500.0))
+        emergency_qty = np.where(known, self._emergency_qty[idx], np.float32(2000.0))
+        regular_qty = np.where(known, self._regular_qty[idx], np.float32(1500.0))
+        
+        emergency_mask = inventories < ss.astype(np.float64)
+        regular_mask = ~emergency_mask & (inventories < rp.astype(np.float64))
+        
+        action = np.zeros(len(inventories), dtype=np.int8)
+        action[regular_mask] = 1
+        action[emergency_mask] = 2
+        
+        return {
+            'action': action,
+            'quantity': np.where(emergency_mask, emergency_qty, np.where(regular_mask, regular_qty, np.float32(0.0))),
+            'reorder_point': rp,
+            'safety_stock': ss,
+            'known_rule': known
+        }
+    
     def _get_default_decision(self, current_inventory: float) -> Dict[str, Any]:
         """Default decision for unknown commodity-country combinations."""
         # Generic traditional rules
@@ -192,23 +245,31 @@ class ReorderSafetyStockRules:
     def calculate_traditional_performance_metrics(self) -> Dict[str, float]:
         """Calculate traditional system performance using historical data patterns."""
         
+        # Single fused reduction over the columns used below
+        stats = self.ghsc_data.agg({
+            'Stockout_Frequency_per_Year': 'mean',
+            'On_Time_Delivery_%': 'mean',
+            'Lead_Time_Days': 'sum',
+            'Freight_Cost_USD': 'mean',
+            'Disruption_Severity': 'mean'
+        })
+        
         # Stockout frequency from actual data
-        avg_stockout_freq = self.ghsc_data['Stockout_Frequency_per_Year'].mean()
+        avg_stockout_freq = stats['Stockout_Frequency_per_Year']
         
         # Service level calculation (traditional method)
-        avg_on_time_delivery = self.ghsc_data['On_Time_Delivery_%'].mean() / 100.0
+        avg_on_time_delivery = stats['On_Time_Delivery_%'] / 100.0
         
-        # Traditional inventory turnover calculation
-        total_volume = self.ghsc_data['Order_Volume_Units'].sum()
-        total_lead_time = self.ghsc_data['Lead_Time_Days'].sum()
-        traditional_turnover = (total_volume * 365) / (total_lead_time * total_volume / len(self.ghsc_data))
+        # Traditional inventory turnover calculation:
+        # (total_volume * 365) / (total_lead_time * total_volume / n) == 365 * n / total_lead_time
+        traditional_turnover = 365 * len(self.ghsc_data) / stats['Lead_Time_Days']
         
         # Traditional cost efficiency 
-        avg_freight_cost = self.ghsc_data['Freight_Cost_USD'].mean()
+        avg_freight_cost = stats['Freight_Cost_USD']
         
         # Recovery time estimation (traditional manual processes)
         # Based on disruption severity and manual response capabilities
-        disruption_severity = self.ghsc_data['Disruption_Severity'].mean()
+        disruption_severity = stats['Disruption_Severity']
         manual_response_days = 5 + (disruption_severity * 2)  # Base 5 days + severity factor
         
         return {
@@ -226,8 +287,8 @@ class ReorderSafetyStockRules:
         return {
             'total_reorder_rules': len(self.reorder_rules),
             'total_safety_stock_rules': len(self.safety_stock_rules),
-            'avg_reorder_point': np.mean([r['reorder_point'] for r in self.reorder_rules.values()]),
-            'avg_safety_stock': np.mean([s['safety_stock'] for s in self.safety_stocks.values()]),
+            'avg_reorder_point': float(self._rp.mean(dtype=np.float64)),
+            'avg_safety_stock': float(self._ss.mean(dtype=np.float64)),
             'fixed_service_level_target': 0.95,
             'data_based_rules': True
         }
@@ -18,6 +18,11 @@ from .single_shock_planning_rules import SingleShockPlanningRules
 logger = logging.getLogger(__name__)
 
 
+def _plain_number(val: Any) -> float:
+    """float(val) when it prints as a plain unsigned decimal; 0 otherwise (signs, exponents, NaN, inf)."""
+    return float(val) if isinstance(val, (int, float, np.float64, np.int64, str)) and str(val).replace('.','',1).isdigit() else 0
+
+
 class TraditionalBaselineSystem:
     """
     Comprehensive Traditional Baseline System integrating all rule-based components.
@@ -212,7 +217,7 @@ class TraditionalBaselineSystem:
                     if k in val and isinstance(val[k], (int, float)):
                         return val[k]
                 return 0
-            return float(val) if isinstance(val, (int, float, np.float64, np.int64, str)) and str(val).replace('.','',1).isdigit() else 0
+            return _plain_number(val)
         # For recovery_time_days, use decision_delay from step_performance
         return {
             'success': True,
@@ -225,6 +230,39 @@ class TraditionalBaselineSystem:
         
         return episode_data
     
+    def simulate_traditional_episode_batch(self, records: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """
+        Vectorized simulate_traditional_episode over a frame of records.
+        
+        Returns one array per metric, aligned with the rows of `records`. Only the
+        inventory decision affects the metrics, so it is evaluated for all rows with
+        the batch reorder rules; supplier and routing decisions are not computed.
+        """
+        n = len(records)
+        keys = list(zip(records['Country'], records['Commodity_Type']))
+        inventory = self.inventory_rules.decide_batch(keys, records['Order_Volume_Units'].to_numpy(dtype=np.float64) / 10000)
+        emergency = inventory['action'] == 2
+        regular = inventory['action'] == 1
+        
+        # Traditional decision impacts, as in _calculate_traditional_step_performance
+        service_impact = np.where(emergency, 0.05, np.where(regular, 0.02, 0.0))
+        cost_impact = np.where(emergency, 1.5, np.where(regular, 1.1, 1.0))
+        # fmin keeps min(1.0, x) semantics for NaN inputs
+        service_level = np.fmin(1.0, records['On_Time_Delivery_%'].to_numpy(dtype=np.float64) / 100.0 + service_impact)
+        cost = records['Freight_Cost_USD'].to_numpy(dtype=np.float64) * cost_impact
+        
+        # Cost and service level go through the scalar path's plain-number parsing
+        def parse(values: np.ndarray) -> np.ndarray:
+            return np.fromiter(map(_plain_number, values.tolist()), dtype=np.float64, count=n)
+        
+        return {
+            'success': np.ones(n, dtype=bool),
+            'recovery_time_days': np.where(emergency, 2.0, 0.5),
+            'total_cost': parse(cost),
+            'service_level': parse(service_level),
+            'supplier_reliability': service_level
+        }
+    
     def _make_traditional_decision(self, record: pd.Series, step: int) -> Dict[str, Any]:
         """Make traditional rule-based decision for a single step."""
         
@@ -26,6 +26,16 @@ from comprehensive_rules_framework import ComprehensiveTraditionalRulesFramework
 
 logger = logging.getLogger(__name__)
 
+# One row per simulated episode; field names match the keys of simulate_traditional_episode's result
+EPISODE_DTYPE = np.dtype([
+    ('cost', 'f8'),
+    ('service_level', 'f8'),
+    ('recovery_time', 'f8'),
+    ('supplier_reliability', 'f8'),
+    ('adaptation_capability', 'f8'),
+    ('success_rate', 'f8'),
+])
+
 
 class EnhancedTraditionalBaselineSystem:
     """
@@ -225,14 +235,6 @@ class EnhancedTraditionalBaselineSystem:
         """
         
         detailed_episodes = []
-        all_metrics = {
-            'costs': [],
-            'service_levels': [],
-            'recovery_times': [],
-            'supplier_reliabilities': [],
-            'adaptation_capabilities': [],
-            'success_rates': [],
-        }
         
         # Sample real data
         if num_episodes > len(self.ghsc_data):
@@ -244,9 +246,14 @@ class EnhancedTraditionalBaselineSystem:
         else:
             data_sample = self.ghsc_data.sample(n=num_episodes, replace=True, random_state=42)
         
+        # Per-episode metrics as one preallocated structured array, filled by index
+        episodes = np.empty(len(data_sample), dtype=EPISODE_DTYPE)
+        
         # Run episodes
-        for idx, (_, record) in enumerate(data_sample.iterrows()):
-            episode_metrics = self.simulate_traditional_episode(record.to_dict())
+        columns = data_sample.columns.tolist()
+        for idx, values in enumerate(data_sample.itertuples(index=False, name=None)):
+            record = dict(zip(columns, values))
+            episode_metrics = self.simulate_traditional_episode(record)
             
             # Store detailed episode
             detailed_episodes.append({
@@ -257,26 +264,21 @@ class EnhancedTraditionalBaselineSystem:
             })
             
             # Accumulate metrics
-            all_metrics['costs'].append(episode_metrics['cost'])
-            all_metrics['service_levels'].append(episode_metrics['service_level'])
-            all_metrics['recovery_times'].append(episode_metrics['recovery_time'])
-            all_metrics['supplier_reliabilities'].append(episode_metrics['supplier_reliability'])
-            all_metrics['adaptation_capabilities'].append(episode_metrics['adaptation_capability'])
-            all_metrics['success_rates'].append(episode_metrics['success_rate'])
+            episodes[idx] = tuple(episode_metrics[name] for name in EPISODE_DTYPE.names)
         
         # Aggregate metrics
         aggregated = {
-            'cost': np.mean(all_metrics['costs']),
-            'service_level': np.mean(all_metrics['service_levels']) * 100,
-            'recovery_time': np.mean(all_metrics['recovery_times']),
-            'supplier_reliability': np.mean(all_metrics['supplier_reliabilities']) * 100,
-            'adaptation_capability': np.mean(all_metrics['adaptation_capabilities']) * 100,
-            'success_rate': np.mean(all_metrics['success_rates']) * 100,
+            'cost': np.mean(episodes['cost']),
+            'service_level': np.mean(episodes['service_level']) * 100,
+            'recovery_time': np.mean(episodes['recovery_time']),
+            'supplier_reliability': np.mean(episodes['supplier_reliability']) * 100,
+            'adaptation_capability': np.mean(episodes['adaptation_capability']) * 100,
+            'success_rate': np.mean(episodes['success_rate']) * 100,
             
             # Statistics
-            'cost_std': np.std(all_metrics['costs']),
-            'service_level_std': np.std(all_metrics['service_levels']) * 100,
-            'recovery_time_std': np.std(all_metrics['recovery_times']),
+            'cost_std': np.std(episodes['cost']),
+            'service_level_std': np.std(episodes['service_level']) * 100,
+            'recovery_time_std': np.std(episodes['recovery_time']),
             'episodes_run': num_episodes,
             'violations_total': sum(self.violations_accumulated),
             'escalations_triggered': self.escalations_triggered,
@@ -5,24 +5,86 @@ Implements Deep Q-Network with causal action masking and reward shaping.
 
 import torch
 import torch.nn as nn
+import torch.nn.functional as F
 import torch.optim as optim
 import numpy as np
+import functools
 from typing import Dict, List, Tuple, Any, Optional
-from collections import deque, namedtuple
+from collections import namedtuple
 import random
 import logging
 from abc import ABC, abstractmethod
+from numba import njit
 
 logger = logging.getLogger(__name__)
 
 # Experience replay memory
 Experience = namedtuple('Experience', ['state', 'action', 'reward', 'next_state', 'done', 'causal_effect'])
+# Sampled minibatch as one gathered array per field
+ExperienceBatch = namedtuple('ExperienceBatch', ['states', 'actions', 'rewards', 'next_states', 'dones', 'causal_effects'])
+
+# Training metrics keep only this many most recent values per series
+METRICS_HISTORY = 10000
+
+# Eager training steps run on a side stream before the CUDA training graph is captured
+_GRAPH_WARMUP_STEPS = 3
+
+
+class MetricRing:
+    """Fixed-capacity float32 ring buffer holding the most recent values of a metrics series."""
+    
+    __slots__ = ('_data', '_idx', '_size')
+    
+    def __init__(self, capacity: int = METRICS_HISTORY, values=()):
+        self._data = np.empty(capacity, dtype=np.float32)
+        self._idx = 0
+        self._size = 0
+        self.extend(values)
+    
+    def append(self, value: float) -> None:
+        """Record one value, overwriting the oldest once full."""
+        self._data[self._idx] = value
+        self._idx = (self._idx + 1) % len(self._data)
+        if self._size < len(self._data):
+            self._size += 1
+    
+    def extend(self, values) -> None:
+        """Record several values in order."""
+        for value in np.asarray(values, dtype=np.float32)[-len(self._data):]:
+            self.append(value)
+    
+    def recent(self, n: Optional[int] = None) -> np.ndarray:
+        """The last n values (all stored values by default) in chronological order."""
+        n = self._size if n is None else min(n, self._size)
+        return self._data[np.arange(self._idx - n, self._idx) % len(self._data)]
+    
+    def clear(self) -> None:
+        """Drop all stored values."""
+        self._idx = 0
+        self._size = 0
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def __iter__(self):
+        return iter(self.recent())
+    
+    def __getitem__(self, key):
+        """Value by chronological index like a deque (negative counts from the newest); slices are copied."""
+        if isinstance(key, slice):
+            return self.recent()[key]
+        i = key + self._size if key < 0 else key
+        if not 0 <= i < self._size:
+            raise IndexError('MetricRing index out of range')
+        # The oldest stored value sits _size slots behind the write position
+        return self._data[(self._idx - self._size + i) % len(self._data)]
 
 
 class DQNetwork(nn.Module):
     """Deep Q-Network for supply chain decision making."""
     
-    def __init__(self, state_size: int, action_size: int, hidden_sizes: List[int] = [256, 128, 64]):
+    def __init__(self, state_size: int, action_size: int, hidden_sizes: List[int] = [256, 128, 64],
+                 dropout: float = 0.2):
         """
         Initialize DQN.
         
@@ -30,6 +92,7 @@ class DQNetwork(nn.Module):
             state_size: Dimension of state space
             action_size: Number of possible actions
             hidden_sizes: List of hidden layer sizes
+            dropout: Dropout rate after each hidden layer; 0.0 leaves dropout out entirely
         """
         super(DQNetwork, self).__init__()
         
@@ -40,7 +103,8 @@ class DQNetwork(nn.Module):
         for hidden_size in hidden_sizes:
             layers.append(nn.Linear(input_size, hidden_size))
             layers.append(nn.ReLU())
-            layers.append(nn.Dropout(0.2))
+            # Identity keeps layer indices, and so state_dict keys, the same without dropout
+            layers.append(nn.Dropout(dropout) if dropout > 0 else nn.Identity())
             input_size = hidden_size
         
         # Output layer
@@ -63,25 +127,157 @@ class DQNetwork(nn.Module):
         return self.network(state)
 
 
+@njit(cache=True, nogil=True)
+def _n_step_returns(rewards, dones, idx, gamma, n_step, capacity):
+    """
+    Discounted n-step reward sums from each sampled ring position.
+    
+    Accumulation stops at the first terminal transition. Returns the sums and the ring
+    position of the transition whose next state and done flag bootstrap the target.
+    """
+    returns = np.empty(idx.shape[0], dtype=np.float32)
+    last = np.empty_like(idx)
+    for b in range(idx.shape[0]):
+        ret = 0.0
+        discount = 1.0
+        j = idx[b]
+        for k in range(n_step):
+            j = (idx[b] + k) % capacity
+            ret += discount * rewards[j]
+            discount *= gamma
+            if dones[j]:
+                break
+        returns[b] = ret
+        last[b] = j
+    return returns, last
+
+
 class ReplayBuffer:
-    """Experience replay buffer with causal effect storage."""
+    """
+    Experience replay buffer with causal effect storage.
+    
+    Experiences are kept as a structure of arrays: one preallocated NumPy array per
+    field, written as a ring buffer. When state_size is not given, state arrays are
+    allocated on the first push, once the state shape is known.
+    
+    States are stored as state_dtype; np.float16 halves their memory and transfer size
+    for normalized state vectors. Sampled tensors are always float32.
     
-    def __init__(self, capacity: int = 10000):
+    With n_step > 1, sampled rewards are discounted n-step returns and next states and
+    done flags come from the transition n - 1 steps later (or the episode's last one);
+    transitions are assumed to be pushed in episode order.
+    """
+    
+    def __init__(self, capacity: int = 10000, state_size: Optional[int] = None,
+                 state_dtype: np.dtype = np.float32, n_step: int = 1, gamma: float = 0.99):
         """Initialize replay buffer."""
-        self.buffer = deque(maxlen=capacity)
+        self.capacity = capacity
+        self.state_dtype = np.dtype(state_dtype)
+        self.n_step = n_step
+        self.gamma = gamma
+        self._pos = 0
+        self._size = 0
+        self.states = None
+        self.actions = np.empty(capacity, dtype=np.int64)
+        self.rewards = np.empty(capacity, dtype=np.float32)
+        self.next_states = None
+        self.dones = np.empty(capacity, dtype=np.bool_)
+        self.causal_effects = np.empty(capacity, dtype=np.float32)
+        if state_size is not None:
+            self._allocate_states(np.empty(state_size))
+    
+    def _allocate_states(self, state) -> None:
+        """Allocate state storage from the shape of the first pushed state."""
+        state_shape = np.shape(state)
+        self.states = np.empty((self.capacity, *state_shape), dtype=self.state_dtype)
+        self.next_states = np.empty((self.capacity, *state_shape), dtype=self.state_dtype)
     
     def push(self, state, action, reward, next_state, done, causal_effect=0.0):
         """Add experience to buffer."""
-        experience = Experience(state, action, reward, next_state, done, causal_effect)
-        self.buffer.append(experience)
+        if self.states is None:
+            self._allocate_states(state)
+        
+        pos = self._pos
+        self.states[pos] = state
+        self.actions[pos] = action
+        self.rewards[pos] = reward
+        self.next_states[pos] = next_state
+        self.dones[pos] = done
+        self.causal_effects[pos] = causal_effect
+        
+        self._pos = (pos + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
     
-    def sample(self, batch_size: int) -> List[Experience]:
-        """Sample batch of experiences."""
-        return random.sample(self.buffer, batch_size)
+    def sample_indices(self, batch_size: int) -> np.ndarray:
+        """
+        Sample buffer indices (uniformly, with replacement) for a training batch.
+        
+        For n-step sampling the n - 1 newest transitions are left out, since their
+        n-step continuation has not been pushed yet.
+        """
+        if self.n_step == 1:
+            return np.random.randint(0, self._size, size=batch_size)
+        oldest = (self._pos - self._size) % self.capacity
+        offsets = np.random.randint(0, self._size - self.n_step + 1, size=batch_size)
+        return (oldest + offsets) % self.capacity
+    
+    def _sample_rows(self, batch_size: int) -> Tuple[np.ndarray, np.ndarray, Optional[np.ndarray]]:
+        """Sampled rows, their bootstrap rows, and n-step returns (None for one-step sampling)."""
+        idx = self.sample_indices(batch_size)
+        if self.n_step == 1:
+            return idx, idx, None
+        returns, last = _n_step_returns(self.rewards, self.dones, idx, self.gamma, self.n_step, self.capacity)
+        return idx, last, returns
+    
+    def sample(self, batch_size: int) -> ExperienceBatch:
+        """Sample batch of experiences as gathered per-field arrays."""
+        idx, last, returns = self._sample_rows(batch_size)
+        return ExperienceBatch(self.states[idx], self.actions[idx],
+                               self.rewards[idx] if returns is None else returns,
+                               self.next_states[last], self.dones[last], self.causal_effects[idx])
+    
+    def pinned_staging(self, batch_size: int) -> ExperienceBatch:
+        """Page-locked host tensors of batch_size rows with the field dtypes, for sample_tensors' staging."""
+        return ExperienceBatch(*(
+            torch.from_numpy(np.empty((batch_size, *field.shape[1:]), dtype=field.dtype)).pin_memory()
+            for field in (self.states, self.actions, self.rewards,
+                          self.next_states, self.dones, self.causal_effects)
+        ))
+    
+    def sample_tensors(self, batch_size: int, device: torch.device,
+                       staging: Optional[ExperienceBatch] = None) -> ExperienceBatch:
+        """
+        Sample batch of experiences as tensors on device, one transfer per field.
+        
+        When staging holds preallocated (pinned) host tensors of batch_size rows, with
+        the same dtypes as the buffer fields, the batch is gathered into them and copied
+        to the device asynchronously. Reduced-precision states are widened on the device.
+        """
+        if staging is None:
+            batch = ExperienceBatch(*(torch.from_numpy(field).to(device, non_blocking=True)
+                                      for field in self.sample(batch_size)))
+        else:
+            idx, last, returns = self._sample_rows(batch_size)
+            sources = ((self.states, idx), (self.actions, idx), (self.rewards, idx),
+                       (self.next_states, last), (self.dones, last), (self.causal_effects, idx))
+            for (field, rows), host in zip(sources, staging):
+                np.take(field, rows, axis=0, out=host.numpy())
+            if returns is not None:
+                staging.rewards.numpy()[:] = returns
+            batch = ExperienceBatch(*(host.to(device, non_blocking=True) for host in staging))
+        
+        if self.state_dtype != np.float32:
+            batch = batch._replace(states=batch.states.float(), next_states=batch.next_states.float())
+        return batch
+    
+    def clear(self) -> None:
+        """Drop all stored experiences; the preallocated arrays are kept for reuse."""
+        self._pos = 0
+        self._size = 0
     
     def __len__(self):
         """Get buffer size."""
-        return len(self.buffer)
+        return self._size
 
 
 class CausalRLAgent:
@@ -104,7 +300,10 @@ class CausalRLAgent:
                  use_reward_shaping: bool = True,
                  buffer_size: int = 10000,
                  batch_size: int = 32,
-                 target_update_freq: int = 100):
+                 target_update_freq: int = 100,
+                 replay_state_dtype: np.dtype = np.float32,
+                 n_step: int = 1,
+                 target_tau: Optional[float] = None):
         """
         Initialize CRL Agent.
         
@@ -123,12 +322,20 @@ class CausalRLAgent:
             buffer_size: Size of experience replay buffer
             batch_size: Batch size for training
             target_update_freq: Frequency of target network updates
+            replay_state_dtype: Storage dtype of replayed states (np.float16 halves buffer memory)
+            n_step: Number of rewards summed into each bootstrapped TD target
+            target_tau: Polyak rate for a soft target update every step; None keeps the
+                hard copy every target_update_freq steps
         """
         
         self.state_size = state_size
         self.action_size = action_size
         self.causal_oracle = causal_oracle
         self.gamma = gamma
+        self.n_step = n_step
+        # Discount applied to the bootstrapped Q-value of an n-step target
+        self._bootstrap_discount = gamma ** n_step
+        self.epsilon_start = epsilon_start
         self.epsilon = epsilon_start
         self.epsilon_end = epsilon_end
         self.epsilon_decay = epsilon_decay
@@ -137,24 +344,54 @@ class CausalRLAgent:
         self.use_reward_shaping = use_reward_shaping
         self.batch_size = batch_size
         self.target_update_freq = target_update_freq
+        self.target_tau = target_tau
         
         # Neural networks
         self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
         self.q_network = DQNetwork(state_size, action_size).to(self.device)
-        self.target_network = DQNetwork(state_size, action_size).to(self.device)
-        self.optimizer = optim.Adam(self.q_network.parameters(), lr=learning_rate)
+        # The target network only ever runs inference, so it is built without dropout
+        self.target_network = DQNetwork(state_size, action_size, dropout=0.0).to(self.device)
+        # capturable keeps Adam's step state on the device so the update can be graph-captured
+        self.optimizer = optim.Adam(self.q_network.parameters(), lr=learning_rate,
+                                    capturable=self.device.type == 'cuda')
+        # Parameter lists in matching order, for in-place target syncs
+        self._q_params = list(self.q_network.parameters())
+        self._target_params = list(self.target_network.parameters())
+        
+        # Greedy action selection goes through this forward; compiled on CUDA, the eager
+        # network otherwise. Training uses the eager networks (captured as a CUDA graph on
+        # CUDA), and the networks stay uncompiled so state_dict keys are unchanged.
+        self._q_forward = self.q_network
+        if self.device.type == 'cuda':
+            self._compile_act_forward()
+        
+        # Reusable input buffer for single-state action selection
+        self._state_buf = torch.empty((1, state_size), device=self.device)
+        
+        # CUDA graph of the whole training update, captured after a few eager warmup steps
+        self._train_graph = None
+        self._graph_batch = None
+        self._graph_loss = None
+        self._graph_warmup_steps = _GRAPH_WARMUP_STEPS
         
         # Experience replay
-        self.replay_buffer = ReplayBuffer(buffer_size)
+        self.replay_buffer = ReplayBuffer(buffer_size, state_size, replay_state_dtype, n_step, gamma)
+        
+        # Pinned host staging for sampled minibatches, so host-to-device copies run asynchronously.
+        # Reuse is safe: loss.item() synchronizes every step before the next batch is gathered.
+        self._pinned_batch = None
+        if self.device.type == 'cuda':
+            # Staging keeps the buffer's field dtypes, so reduced-precision states also cross at that size
+            self._pinned_batch = self.replay_buffer.pinned_staging(batch_size)
         
         # Training metrics
         self.step_count = 0
         self.episode_count = 0
         self.training_metrics = {
-            'losses': [],
-            'rewards': [],
-            'causal_effects': [],
-            'epsilon_values': []
+            'losses': MetricRing(),
+            'rewards': MetricRing(),
+            'causal_effects': MetricRing(),
+            'epsilon_values': MetricRing()
         }
         
         # Expanded action mapping for granular decisions
@@ -171,15 +408,57 @@ class CausalRLAgent:
             9: 'no_action'  # Do nothing action
         }
         self.action_size = len(self.action_mapping)
+        self._action_names = [self.action_mapping[i] for i in range(self.action_size)]
+        self._no_action_idx = self._action_names.index('no_action')
+        
+        # Memoize oracle feasibility masks on the exact (hashable) context
+        self._feasible_mask_cached = functools.lru_cache(maxsize=1024)(
+            lambda ctx_key: self.causal_oracle.feasible_mask(self._action_names, dict(ctx_key))
+        )
+        # Memoize oracle causal effects the same way, so repeated contexts skip BN inference
+        self._effect_cached = functools.lru_cache(maxsize=1024)(
+            lambda action_name, ctx_key: self.causal_oracle.effect(action_name, dict(ctx_key))
+        )
         
         logger.info(f"Initialized CRL Agent with causal_lambda={causal_lambda}, "
                    f"action_masking={use_action_masking}, reward_shaping={use_reward_shaping}")
     
+    def _compile_act_forward(self) -> None:
+        """
+        Compile the Q-network forward used for greedy action selection.
+        
+        It is warmed up on the act shape (1 row, eval mode, inference mode).
+        reduce-overhead mode (CUDA graphs) is tried first, then default mode; if both
+        fail the eager network is kept.
+        """
+        for mode in ('reduce-overhead', 'default'):
+            was_training = self.q_network.training
+            try:
+                q_forward = torch.compile(self.q_network, mode=mode, dynamic=False)
+                self.q_network.eval()
+                with torch.inference_mode():
+                    q_forward(torch.zeros((1, self.state_size), device=self.device))
+            except Exception as e:
+                logger.warning(f"torch.compile(mode={mode!r}) failed: {e}")
+                continue
+            finally:
+                self.q_network.train(was_training)
+            self._q_forward = q_forward
+            return
+    
     def act(self, state: np.ndarray, context: Dict[str, Any] = None, mask: np.ndarray = None) -> int:
         """
         Select action using epsilon-greedy policy with dynamic causal action masking.
         """
-        state_tensor = torch.FloatTensor(state).unsqueeze(0).to(self.device)
+        action = self._select_action(state, context)
+        # Only the chosen index crosses back to the host
+        return action.item() if isinstance(action, torch.Tensor) else action
+    
+    def _select_action(self, state: np.ndarray, context: Dict[str, Any] = None):
+        """
+        Epsilon-greedy action without a host synchronization: an exploratory action is a
+        host int, a greedy one a 0-d device tensor holding the masked argmax.
+        """
         # Dynamic action masking based on state/context
         if self.use_action_masking:
             mask = self._get_dynamic_action_mask(state, context)
@@ -187,18 +466,30 @@ class CausalRLAgent:
             mask = np.ones(self.action_size)
         # Epsilon-greedy action selection
         if random.random() > self.epsilon:
-            with torch.no_grad():
-                q_values = self.q_network(state_tensor).cpu().numpy()[0]
-                masked_q_values = q_values.copy()
-                masked_q_values[mask == 0] = -np.inf
-                action = np.argmax(masked_q_values)
-        else:
-            valid_actions = np.where(mask == 1)[0]
-            if len(valid_actions) > 0:
-                action = np.random.choice(valid_actions)
-            else:
-                action = np.random.randint(0, self.action_size)
-        return action
+            # Masked argmax on device
+            self._state_buf.copy_(torch.from_numpy(np.asarray(state)).unsqueeze(0), non_blocking=True)
+            q_values = self._greedy_q_values(self._state_buf)
+            invalid = torch.from_numpy(mask == 0).to(self.device, non_blocking=True)
+            return q_values.masked_fill(invalid, float('-inf')).argmax(1)[0]
+        return self._random_valid_action(mask)
+    
+    def _greedy_q_values(self, states: torch.Tensor) -> torch.Tensor:
+        """Q-values for action selection, with dropout disabled; the network's train/eval mode is restored."""
+        was_training = self.q_network.training
+        self.q_network.eval()
+        try:
+            with torch.inference_mode():
+                # A copy, since a CUDA-graph replay of the compiled forward reuses its output memory
+                return self._q_forward(states).clone()
+        finally:
+            self.q_network.train(was_training)
+    
+    def _random_valid_action(self, mask: np.ndarray) -> int:
+        """Exploratory action drawn uniformly from the unmasked actions (any action if all are masked)."""
+        valid_actions = np.where(mask == 1)[0]
+        if len(valid_actions) > 0:
+            return np.random.choice(valid_actions)
+        return np.random.randint(0, self.action_size)
 
     def _get_dynamic_action_mask(self, state: np.ndarray, context: Dict[str, Any] = None) -> np.ndarray:
         """Mask infeasible actions based on current state/context."""
@@ -228,36 +519,66 @@ class CausalRLAgent:
     
     def _get_causal_action_mask(self, context: Dict[str, Any]) -> np.ndarray:
         """Get action mask based on causal feasibility constraints."""
-        mask = np.zeros(self.action_size)
-        
-        if self.causal_oracle:
-            # Check feasibility of each action
-            for i, action_name in self.action_mapping.items():
-                if action_name == 'no_action':
-                    mask[i] = 1  # No-action is always feasible
-                else:
-                    mask[i] = 1 if self.causal_oracle.is_feasible(action_name, context) else 0
-        else:
+        if not self.causal_oracle:
             # No causal oracle - all actions feasible
-            mask.fill(1)
+            return np.ones(self.action_size)
         
-        # Ensure at least one action is feasible
-        if mask.sum() == 0:
-            mask[-1] = 1  # Enable no-action as fallback
+        # Feasibility of every action from one oracle call, the context discretized once
+        ctx_key = self._context_key(context)
+        if ctx_key is None:
+            feasible = self.causal_oracle.feasible_mask(self._action_names, context)
+        else:
+            feasible = self._feasible_mask_cached(ctx_key)
         
+        mask = feasible.astype(np.float64)
+        mask[self._no_action_idx] = 1  # No-action is always feasible
         return mask
     
+    def _causal_effect(self, action_name: str, context: Dict[str, Any]) -> float:
+        """Causal effect of an action in a context, memoized on the exact (hashable) context."""
+        ctx_key = self._context_key(context)
+        if ctx_key is None:
+            return self.causal_oracle.effect(action_name, context)
+        return self._effect_cached(action_name, ctx_key)
+    
+    @staticmethod
+    def _context_key(context: Optional[Dict[str, Any]]) -> Optional[tuple]:
+        """
+        Hashable cache key for a context, or None when it holds unhashable values.
+        
+        Hashability is checked before any oracle call, so a TypeError raised by the
+        oracle itself propagates instead of triggering an uncached retry.
+        """
+        ctx_key = tuple(sorted((context or {}).items()))
+        try:
+            hash(ctx_key)
+        except TypeError:
+            return None
+        return ctx_key
+    
     def learn(self, state: np.ndarray, action: int, reward: float, 
               next_state: np.ndarray, done: bool, context: Dict[str, Any] = None) -> None:
         """
         Learn from experience with aggressive reward shaping.
         """
+        loss = self._learn_step(state, action, reward, next_state, done, context)
+        if loss is not None:
+            self.training_metrics['losses'].append(loss.item())
+    
+    def _learn_step(self, state: np.ndarray, action: int, reward: float,
+                    next_state: np.ndarray, done: bool, context: Dict[str, Any] = None) -> Optional[torch.Tensor]:
+        """
+        Store one shaped experience and run any due training and target updates.
+        
+        Returns the loss tensor when a training step ran, without synchronizing on it,
+        so callers driving several agents can read all losses at once.
+        """
         # Calculate causal effect for reward shaping
         causal_effect = 0.0
+        action_name = self.action_mapping.get(action, 'no_action')
         if self.use_reward_shaping and self.causal_oracle and context:
-            action_name = self.action_mapping.get(action, 'no_action')
             if action_name != 'no_action':
-                causal_effect = self.causal_oracle.effect(action_name, context)
+                causal_effect = self._causal_effect(action_name, context)
         # Aggressive reward shaping
         # Penalize poor outcomes, reward resilience/adaptation/cost savings
         penalty = 0.0
@@ -283,56 +604,123 @@ class CausalRLAgent:
         # Update step count
         self.step_count += 1
         # Train if enough experiences and at regular intervals
-        if len(self.replay_buffer) >= self.batch_size and self.step_count % 4 == 0:
-            self._train_step()
+        loss = None
+        if len(self.replay_buffer) >= max(self.batch_size, self.n_step) and self.step_count % 4 == 0:
+            loss = self._train_step()
         # Update target network
-        if self.step_count % self.target_update_freq == 0:
+        if self.target_tau is not None:
+            self._soft_update_target_network(self.target_tau)
+        elif self.step_count % self.target_update_freq == 0:
             self._update_target_network()
         # Decay epsilon
         self.epsilon = max(self.epsilon_end, self.epsilon * self.epsilon_decay)
         # Store metrics
         self.training_metrics['causal_effects'].append(causal_effect)
         self.training_metrics['epsilon_values'].append(self.epsilon)
+        return loss
     
-    def _train_step(self) -> None:
-        """Perform one training step on sampled batch."""
-        
-        # Sample batch of experiences
-        batch = self.replay_buffer.sample(self.batch_size)
+    def _train_step(self) -> torch.Tensor:
+        """Perform one training step on sampled batch; returns the loss tensor."""
         
-        # Convert to tensors
-        states = torch.FloatTensor([e.state for e in batch]).to(self.device)
-        actions = torch.LongTensor([e.action for e in batch]).to(self.device)
-        rewards = torch.FloatTensor([e.reward for e in batch]).to(self.device)
-        next_states = torch.FloatTensor([e.next_state for e in batch]).to(self.device)
-        dones = torch.BoolTensor([e.done for e in batch]).to(self.device)
+        # Sample batch of experiences as device tensors
+        batch = self.replay_buffer.sample_tensors(self.batch_size, self.device, self._pinned_batch)[:5]
         
+        if self.device.type == 'cuda':
+            return self._graphed_update(batch)
+        return self._update(*batch)
+    
+    def _update(self, states, actions, rewards, next_states, dones, zero_grad: bool = True) -> torch.Tensor:
+        """One optimization step of the Q-network on a batch; returns the loss tensor."""
         # Current Q values
         current_q_values = self.q_network(states).gather(1, actions.unsqueeze(1))
         
         # Next Q values from target network
         with torch.no_grad():
             next_q_values = self.target_network(next_states).max(1)[0]
-            target_q_values = rewards + (self.gamma * next_q_values * ~dones)
+            # Bootstrapped target in one add plus one select, no mask arithmetic
+            target_q_values = torch.where(dones, rewards, rewards.add(next_q_values, alpha=self._bootstrap_discount))
         
         # Compute loss
-        loss = nn.MSELoss()(current_q_values.squeeze(), target_q_values)
+        loss = F.mse_loss(current_q_values.squeeze(1), target_q_values)
         
         # Optimize
-        self.optimizer.zero_grad()
+        if zero_grad:
+            self.optimizer.zero_grad()
         loss.backward()
         
         # Gradient clipping for stability
         torch.nn.utils.clip_grad_norm_(self.q_network.parameters(), max_norm=10.0)
         
         self.optimizer.step()
+        return loss
+    
+    def _graphed_update(self, batch: Tuple[torch.Tensor, ...]) -> torch.Tensor:
+        """
+        Training step through a captured CUDA graph.
         
-        # Store training metrics
-        self.training_metrics['losses'].append(loss.item())
+        The first steps run eagerly on a side stream to warm up allocator and optimizer
+        state; the next one captures the full update (forward, loss, backward, clipping,
+        Adam) into a graph that later steps replay after copying their batch into its
+        static inputs. The eager networks are captured, not the torch.compile wrappers.
+        """
+        if self._train_graph is None:
+            if self._graph_warmup_steps > 0:
+                self._graph_warmup_steps -= 1
+                side_stream = torch.cuda.Stream()
+                side_stream.wait_stream(torch.cuda.current_stream())
+                with torch.cuda.stream(side_stream):
+                    loss = self._update(*batch)
+                torch.cuda.current_stream().wait_stream(side_stream)
+                return loss
+            
+            self._graph_batch = tuple(field.clone() for field in batch)
+            self.optimizer.zero_grad(set_to_none=True)
+            graph = torch.cuda.CUDAGraph()
+            with torch.cuda.graph(graph):
+                self._graph_loss = self._update(*self._graph_batch, zero_grad=False)
+            self._train_graph = graph
+        
+        for static, field in zip(self._graph_batch, batch):
+            static.copy_(field, non_blocking=True)
+        self._train_graph.replay()
+        return self._graph_loss
+    
+    def _release_train_graph(self) -> None:
+        """Drop the captured training graph; needed whenever optimizer state tensors are replaced."""
+        self._train_graph = None
+        self._graph_batch = None
+        self._graph_loss = None
+        self._graph_warmup_steps = _GRAPH_WARMUP_STEPS
+    
+    def reset(self) -> None:
+        """
+        Return the agent to its untrained state in place.
+        
+        Network weights are re-initialized and the optimizer state, replay buffer,
+        counters and metrics are cleared, so the agent can be reused across runs
+        without reallocating its networks or buffer.
+        """
+        self.q_network.apply(self.q_network._init_weights)
+        self.target_network.apply(self.target_network._init_weights)
+        self.optimizer.state.clear()
+        self._release_train_graph()
+        self.replay_buffer.clear()
+        
+        self.epsilon = self.epsilon_start
+        self.step_count = 0
+        self.episode_count = 0
+        for values in self.training_metrics.values():
+            values.clear()
     
     def _update_target_network(self) -> None:
         """Update target network with current network weights."""
-        self.target_network.load_state_dict(self.q_network.state_dict())
+        with torch.no_grad():
+            torch._foreach_copy_(self._target_params, self._q_params)
+    
+    def _soft_update_target_network(self, tau: float) -> None:
+        """Polyak-average the current network weights into the target network."""
+        with torch.no_grad():
+            torch._foreach_lerp_(self._target_params, self._q_params, tau)
     
     def episode_ended(self, total_reward: float) -> None:
         """Called when episode ends to update metrics."""
@@ -340,8 +728,8 @@ class CausalRLAgent:
         self.training_metrics['rewards'].append(total_reward)
         
         if self.episode_count % 100 == 0:
-            avg_reward = np.mean(self.training_metrics['rewards'][-100:])
-            avg_loss = np.mean(self.training_metrics['losses'][-100:]) if self.training_metrics['losses'] else 0
+            avg_reward = self.training_metrics['rewards'].recent(100).mean(dtype=np.float64)
+            avg_loss = self.training_metrics['losses'].recent(100).mean(dtype=np.float64) if self.training_metrics['losses'] else 0
             logger.info(f"Episode {self.episode_count}: avg_reward={avg_reward:.2f}, "
                        f"avg_loss={avg_loss:.4f}, epsilon={self.epsilon:.3f}")
     
@@ -351,7 +739,7 @@ class CausalRLAgent:
             'q_network_state_dict': self.q_network.state_dict(),
             'target_network_state_dict': self.target_network.state_dict(),
             'optimizer_state_dict': self.optimizer.state_dict(),
-            'training_metrics': self.training_metrics,
+            'training_metrics': {key: values.tolist() for key, values in self.get_metrics().items()},
             'episode_count': self.episode_count,
             'step_count': self.step_count,
             'epsilon': self.epsilon
@@ -365,23 +753,25 @@ class CausalRLAgent:
         self.q_network.load_state_dict(checkpoint['q_network_state_dict'])
         self.target_network.load_state_dict(checkpoint['target_network_state_dict'])
         self.optimizer.load_state_dict(checkpoint['optimizer_state_dict'])
-        self.training_metrics = checkpoint['training_metrics']
+        self._release_train_graph()
+        self.training_metrics = {key: MetricRing(values=values)
+                                 for key, values in checkpoint['training_metrics'].items()}
         self.episode_count = checkpoint['episode_count']
         self.step_count = checkpoint['step_count']
         self.epsilon = checkpoint['epsilon']
         
         logger.info(f"Model loaded from {filepath}")
     
-    def get_metrics(self) -> Dict[str, List[float]]:
-        """Get training metrics."""
-        return self.training_metrics.copy()
+    def get_metrics(self) -> Dict[str, np.ndarray]:
+        """Get training metrics (the most recent METRICS_HISTORY values of each series)."""
+        return {key: values.recent() for key, values in self.training_metrics.items()}
     
     def get_action_explanation(self, action: int, context: Dict[str, Any] = None) -> str:
         """Get explanation for chosen action using causal oracle."""
         action_name = self.action_mapping.get(action, 'unknown')
         
         if self.causal_oracle and action_name != 'no_action' and context:
-            causal_effect = self.causal_oracle.effect(action_name, context)
+            causal_effect = self._causal_effect(action_name, context)
             explanation = self.causal_oracle.get_causal_explanation(action_name, 'recovery_time')
             return f"Action: {action_name} | Causal Effect: {causal_effect:.3f} | {explanation}"
         else:
@@ -415,22 +805,49 @@ class MultiAgentCRL:
         logger.info(f"Initialized multi-agent CRL system with {len(self.agents)} agents")
     
     def act(self, observations: Dict[str, np.ndarray], contexts: Dict[str, Dict] = None) -> Dict[str, int]:
-        """Get actions from all agents."""
-        actions = {}
+        """
+        Get actions from all agents.
         
+        Each agent has its own weights, so each runs its own masked forward and argmax on
+        the device; the greedy actions are read with one device synchronization at the end,
+        instead of one per agent. The agents' Q-values are copies, so one compiled module's
+        replay cannot overwrite another's output.
+        """
+        actions = {}
+        pending = []
         for role, agent in self.agents.items():
             obs = observations.get(role, observations.get('shared', np.zeros(agent.state_size)))
             context = contexts.get(role, {}) if contexts else {}
-            actions[role] = agent.act(obs, context)
+            action = agent._select_action(obs, context)
+            if isinstance(action, torch.Tensor):
+                pending.append(role)
+            actions[role] = action
+        
+        if pending:
+            values = torch.stack([actions[role] for role in pending]).tolist()
+            actions.update(zip(pending, values))
         
         return actions
     
     def learn(self, experiences: Dict[str, Tuple]) -> None:
-        """Update all agents from their experiences."""
+        """
+        Update all agents from their experiences.
+        
+        The agents' training steps are issued back to back and their losses are read
+        with one device synchronization at the end, instead of one per agent.
+        """
+        pending = []
         for role, agent in self.agents.items():
             if role in experiences:
                 state, action, reward, next_state, done, context = experiences[role]
-                agent.learn(state, action, reward, next_state, done, context)
+                loss = agent._learn_step(state, action, reward, next_state, done, context)
+                if loss is not None:
+                    pending.append((agent, loss.detach()))
+        
+        if pending:
+            values = torch.stack([loss for _, loss in pending]).tolist()
+            for (agent, _), value in zip(pending, values):
+                agent.training_metrics['losses'].append(value)
     
     def save_models(self, directory: str) -> None:
         """Save all agent models."""
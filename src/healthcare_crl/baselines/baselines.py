@@ -6,17 +6,84 @@ Implements deterministic, pure RL, and causal heuristic approaches.
 import numpy as np
 import torch
 import torch.nn as nn
+import torch.nn.functional as F
 import torch.optim as optim
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Tuple, Any, Optional
 import random
+import functools
+from types import MappingProxyType
 from collections import deque, namedtuple
 import logging
+from numba import njit
 
 from ..agents.crl_agent import DQNetwork, ReplayBuffer
 
 logger = logging.getLogger(__name__)
 
 
+class _GrowableArray:
+    """Append-only float64 buffer backed by an ndarray that doubles its capacity when full."""
+    
+    def __init__(self, values=(), capacity: int = 64):
+        values = np.asarray(values, dtype=np.float64)
+        self._data = np.empty(max(capacity, len(values)), dtype=np.float64)
+        self._data[:len(values)] = values
+        self._size = len(values)
+    
+    def append(self, value: float) -> None:
+        if self._size == len(self._data):
+            grown = np.empty(2 * len(self._data), dtype=np.float64)
+            grown[:self._size] = self._data[:self._size]
+            self._data = grown
+        self._data[self._size] = value
+        self._size += 1
+    
+    def view(self) -> np.ndarray:
+        """Read-only view of the values appended so far (later appends are not reflected)."""
+        values = self._data[:self._size]
+        values.flags.writeable = False
+        return values
+    
+    def mean(self) -> float:
+        return float(self._data[:self._size].mean()) if self._size else 0.0
+    
+    def __len__(self) -> int:
+        return self._size
+
+
+def _metrics_to_json(metrics) -> Dict[str, Any]:
+    """Convert a read-only metrics view into JSON-serializable builtins."""
+    return {
+        key: value.tolist() if isinstance(value, np.ndarray)
+        else dict(value) if isinstance(value, MappingProxyType)
+        else value
+        for key, value in metrics.items()
+    }
+
+
+@njit(cache=True, nogil=True)
+def _det_act(state, thresholds):
+    """Compiled deterministic decision tree; thresholds = (safety_stock, stockout, cost, lead_time)."""
+    n = state.shape[0]
+    inventory_level = state[0] if n > 0 else 0.5
+    stockout_risk = state[1] if n > 1 else 0.5
+    lead_time = state[2] if n > 2 else 0.5
+    supplier_reliability = state[3] if n > 3 else 0.5
+    cost_pressure = state[4] if n > 4 else 0.5
+    
+    if stockout_risk > thresholds[1]:
+        if inventory_level < thresholds[0]:
+            return 2  # emergency_procurement
+        return 4  # allocate_resources
+    if supplier_reliability < 0.4:
+        return 0  # switch_supplier
+    if lead_time > thresholds[3]:
+        return 3  # reroute_shipments
+    if inventory_level < thresholds[0] and cost_pressure < thresholds[2]:
+        return 1  # increase_safety_stock
+    return 5  # no_action
+
+
 class DeterministicAgent:
     """
     Deterministic optimization agent using safety stock and fixed reorder rules.
@@ -33,6 +100,7 @@ class DeterministicAgent:
         self.stockout_threshold = 0.2
         self.cost_threshold = 0.7
         self.lead_time_threshold = 0.6
+        self._refresh_thresholds()
         
         # Action mapping same as CRL agent
         self.action_mapping = {
@@ -45,37 +113,57 @@ class DeterministicAgent:
         }
         
         # Metrics tracking
-        self.episode_rewards = []
+        self.episode_rewards = _GrowableArray()
         self.action_counts = {action: 0 for action in range(action_size)}
         
     def act(self, state: np.ndarray, context: Dict[str, Any] = None) -> int:
         """Select action using deterministic rules."""
         
-        # Extract key state features (assuming structured state representation)
-        inventory_level = state[0] if len(state) > 0 else 0.5
-        stockout_risk = state[1] if len(state) > 1 else 0.5
-        lead_time = state[2] if len(state) > 2 else 0.5
-        supplier_reliability = state[3] if len(state) > 3 else 0.5
-        cost_pressure = state[4] if len(state) > 4 else 0.5
-        
-        # Deterministic decision tree
-        if stockout_risk > self.stockout_threshold:
-            if inventory_level < self.safety_stock_threshold:
-                action = 2  # emergency_procurement
-            else:
-                action = 4  # allocate_resources
-        elif supplier_reliability < 0.4:
-            action = 0  # switch_supplier
-        elif lead_time > self.lead_time_threshold:
-            action = 3  # reroute_shipments
-        elif inventory_level < self.safety_stock_threshold and cost_pressure < self.cost_threshold:
-            action = 1  # increase_safety_stock
-        else:
-            action = 5  # no_action
+        action = int(_det_act(np.asarray(state, dtype=np.float64), self._thresh_arr))
         
         self.action_counts[action] += 1
         return action
     
+    def _refresh_thresholds(self) -> None:
+        """Pack policy thresholds into the array consumed by the compiled decision tree."""
+        self._thresh_arr = np.array([
+            self.safety_stock_threshold,
+            self.stockout_threshold,
+            self.cost_threshold,
+            self.lead_time_threshold
+        ], dtype=np.float64)
+    
+    def act_batch(self, states: np.ndarray, contexts: List[Dict[str, Any]] = None) -> np.ndarray:
+        """Select actions for a batch of states (shape (B, state_size)) using the same deterministic rules."""
+        
+        states = np.atleast_2d(np.asarray(states, dtype=np.float64))
+        
+        # Missing trailing features default to 0.5, matching act()
+        features = np.full((states.shape[0], 5), 0.5)
+        num_features = min(states.shape[1], 5)
+        features[:, :num_features] = states[:, :num_features]
+        inventory_level, stockout_risk, lead_time, supplier_reliability, cost_pressure = features.T
+        
+        # Decision tree as an ordered decision table (first matching row wins)
+        high_risk = stockout_risk > self.stockout_threshold
+        low_inventory = inventory_level < self.safety_stock_threshold
+        actions = np.select(
+            [
+                high_risk & low_inventory,                          # emergency_procurement
+                high_risk,                                          # allocate_resources
+                supplier_reliability < 0.4,                         # switch_supplier
+                lead_time > self.lead_time_threshold,               # reroute_shipments
+                low_inventory & (cost_pressure < self.cost_threshold)  # increase_safety_stock
+            ],
+            [2, 4, 0, 3, 1],
+            default=5  # no_action
+        )
+        
+        counts = np.bincount(actions, minlength=self.action_size)
+        for action in np.flatnonzero(counts):
+            self.action_counts[int(action)] += int(counts[action])
+        return actions
+    
     def learn(self, state: np.ndarray, action: int, reward: float, 
               next_state: np.ndarray, done: bool, context: Dict[str, Any] = None) -> None:
         """Deterministic agent doesn't learn, but tracks rewards."""
@@ -87,13 +175,18 @@ class DeterministicAgent:
         """Track episode completion."""
         self.episode_rewards.append(total_reward)
     
-    def get_metrics(self) -> Dict[str, Any]:
-        """Get agent performance metrics."""
-        return {
-            'episode_rewards': self.episode_rewards.copy(),
-            'action_distribution': self.action_counts.copy(),
-            'avg_reward': np.mean(self.episode_rewards) if self.episode_rewards else 0.0
-        }
+    def get_metrics(self) -> MappingProxyType:
+        """
+        Get agent performance metrics.
+        
+        Returns a read-only snapshot: the rewards are a read-only array view of the
+        episodes so far (not copied), and later episodes and actions are not reflected.
+        """
+        return MappingProxyType({
+            'episode_rewards': self.episode_rewards.view(),
+            'action_distribution': MappingProxyType(dict(self.action_counts)),
+            'avg_reward': self.episode_rewards.mean()
+        })
     
     def save_model(self, filepath: str) -> None:
         """Save agent state (deterministic agents have no learnable parameters)."""
@@ -101,7 +194,7 @@ class DeterministicAgent:
         with open(filepath, 'w') as f:
             json.dump({
                 'type': 'deterministic',
-                'metrics': self.get_metrics(),
+                'metrics': _metrics_to_json(self.get_metrics()),
                 'parameters': {
                     'safety_stock_threshold': self.safety_stock_threshold,
                     'stockout_threshold': self.stockout_threshold,
@@ -121,6 +214,7 @@ class DeterministicAgent:
                 self.stockout_threshold = params.get('stockout_threshold', self.stockout_threshold)
                 self.cost_threshold = params.get('cost_threshold', self.cost_threshold)
                 self.lead_time_threshold = params.get('lead_time_threshold', self.lead_time_threshold)
+                self._refresh_thresholds()
 
 
 class PureRLAgent:
@@ -158,26 +252,34 @@ class PureRLAgent:
         self.optimizer = optim.Adam(self.q_network.parameters(), lr=learning_rate)
         
         # Experience replay
-        self.replay_buffer = ReplayBuffer(buffer_size)
+        self.replay_buffer = ReplayBuffer(buffer_size, state_size)
+        
+        # Pinned host staging for asynchronous H2D batch copies (CUDA only); reuse is
+        # safe because loss.item() synchronizes every step
+        self._pinned_batch = None
+        if self.device.type == 'cuda':
+            self._pinned_batch = self.replay_buffer.pinned_staging(batch_size)
+        
+        # Reusable input buffer for single-state action selection
+        self._state_buf = torch.empty((1, state_size), device=self.device)
         
         # Training metrics
         self.step_count = 0
         self.episode_count = 0
         self.training_metrics = {
-            'losses': [],
-            'rewards': [],
-            'epsilon_values': []
+            'losses': _GrowableArray(),
+            'rewards': _GrowableArray(),
+            'epsilon_values': _GrowableArray()
         }
         
     def act(self, state: np.ndarray, context: Dict[str, Any] = None) -> int:
         """Select action using epsilon-greedy policy (no causal masking)."""
         
-        state_tensor = torch.FloatTensor(state).unsqueeze(0).to(self.device)
-        
         if random.random() > self.epsilon:
             # Greedy action
-            with torch.no_grad():
-                q_values = self.q_network(state_tensor)
+            with torch.inference_mode():
+                self._state_buf.copy_(torch.from_numpy(np.asarray(state)).unsqueeze(0), non_blocking=True)
+                q_values = self.q_network(self._state_buf)
                 action = q_values.argmax().item()
         else:
             # Random action
@@ -204,26 +306,21 @@ class PureRLAgent:
         
         # Decay epsilon
         self.epsilon = max(self.epsilon_end, self.epsilon * self.epsilon_decay)
-        self.training_metrics['epsilon_values'].append(self.epsilon)
     
     def _train_step(self) -> None:
         """Perform training step (same as CRL agent but without causal components)."""
         
-        batch = self.replay_buffer.sample(self.batch_size)
-        
-        states = torch.FloatTensor([e.state for e in batch]).to(self.device)
-        actions = torch.LongTensor([e.action for e in batch]).to(self.device)
-        rewards = torch.FloatTensor([e.reward for e in batch]).to(self.device)
-        next_states = torch.FloatTensor([e.next_state for e in batch]).to(self.device)
-        dones = torch.BoolTensor([e.done for e in batch]).to(self.device)
+        states, actions, rewards, next_states, dones = self.replay_buffer.sample_tensors(
+            self.batch_size, self.device, self._pinned_batch)[:5]
         
         current_q_values = self.q_network(states).gather(1, actions.unsqueeze(1))
         
         with torch.no_grad():
             next_q_values = self.target_network(next_states).max(1)[0]
-            target_q_values = rewards + (self.gamma * next_q_values * ~dones)
+            # Terminal rows keep the bare reward; no bitwise-NOT or float cast of the done flags
+            target_q_values = torch.where(dones, rewards, rewards.add(next_q_values, alpha=self.gamma))
         
-        loss = nn.MSELoss()(current_q_values.squeeze(), target_q_values)
+        loss = F.mse_loss(current_q_values.squeeze(1), target_q_values)
         
         self.optimizer.zero_grad()
         loss.backward()
@@ -240,10 +337,12 @@ class PureRLAgent:
         """Track episode completion."""
         self.episode_count += 1
         self.training_metrics['rewards'].append(total_reward)
+        # Epsilon decays deterministically per step, so it is logged once per episode
+        self.training_metrics['epsilon_values'].append(self.epsilon)
     
-    def get_metrics(self) -> Dict[str, List[float]]:
-        """Get training metrics."""
-        return self.training_metrics.copy()
+    def get_metrics(self) -> MappingProxyType:
+        """Get training metrics as a read-only snapshot (one read-only array view per metric series)."""
+        return MappingProxyType({key: values.view() for key, values in self.training_metrics.items()})
     
     def save_model(self, filepath: str) -> None:
         """Save model."""
@@ -251,7 +350,7 @@ class PureRLAgent:
             'q_network_state_dict': self.q_network.state_dict(),
             'target_network_state_dict': self.target_network.state_dict(),
             'optimizer_state_dict': self.optimizer.state_dict(),
-            'training_metrics': self.training_metrics,
+            'training_metrics': {key: values.view().tolist() for key, values in self.training_metrics.items()},
             'episode_count': self.episode_count,
             'step_count': self.step_count,
             'epsilon': self.epsilon
@@ -263,7 +362,8 @@ class PureRLAgent:
         self.q_network.load_state_dict(checkpoint['q_network_state_dict'])
         self.target_network.load_state_dict(checkpoint['target_network_state_dict'])
         self.optimizer.load_state_dict(checkpoint['optimizer_state_dict'])
-        self.training_metrics = checkpoint['training_metrics']
+        self.training_metrics = {key: _GrowableArray(values)
+                                 for key, values in checkpoint['training_metrics'].items()}
         self.episode_count = checkpoint['episode_count']
         self.step_count = checkpoint['step_count']
         self.epsilon = checkpoint['epsilon']
@@ -291,38 +391,66 @@ class CausalHeuristicAgent:
             4: 'allocate_resources',
             5: 'no_action'
         }
+        self._action_names = [self.action_mapping[i] for i in range(len(self.action_mapping))]
+        self._no_action_idx = self._action_names.index('no_action')
+        self._candidate_idx = np.array(
+            [i for i, name in enumerate(self._action_names) if name != 'no_action'], dtype=np.int64
+        )
+        self._candidate_names = [self._action_names[i] for i in self._candidate_idx]
+        
+        # Memoize oracle effect queries on a quantized, hashable digest of the context
+        self._effects_cached = functools.lru_cache(maxsize=8192)(
+            lambda actions, ctx_key: self.causal_oracle.effects_batch(list(actions), dict(ctx_key))
+        )
         
         # Metrics
-        self.episode_rewards = []
-        self.causal_effects_used = []
+        self.episode_rewards = _GrowableArray()
+        self.causal_effects_used = _GrowableArray()
         
     def act(self, state: np.ndarray, context: Dict[str, Any] = None) -> int:
         """Select action using causal heuristics."""
         
         if self.causal_oracle and context:
-            # Evaluate causal effects of all feasible actions
-            action_effects = {}
+            # Evaluate causal effects of all feasible actions in one oracle call;
+            # no_action is the 0.0 baseline and infeasible actions can never win
+            action_effects = np.full(len(self._action_names), -np.inf)
+            action_effects[self._no_action_idx] = 0.0
             
-            for action_idx, action_name in self.action_mapping.items():
-                if action_name == 'no_action':
-                    action_effects[action_idx] = 0.0  # Baseline
-                elif self.causal_oracle.is_feasible(action_name, context):
-                    effect = self.causal_oracle.effect(action_name, context)
-                    action_effects[action_idx] = effect
+            feasible = self._candidate_idx[
+                self.causal_oracle.feasible_mask(self._candidate_names, context)
+            ]
+            if feasible.size:
+                feasible_names = tuple(self._action_names[i] for i in feasible)
+                ctx_key = self._context_key(context)
+                if ctx_key is not None:
+                    action_effects[feasible] = self._effects_cached(feasible_names, ctx_key)
                 else:
-                    action_effects[action_idx] = -1.0  # Infeasible
+                    action_effects[feasible] = self.causal_oracle.effects_batch(list(feasible_names), context)
             
             # Select action with highest positive causal effect
-            if action_effects:
-                best_action = max(action_effects.keys(), key=lambda k: action_effects[k])
-                self.causal_effects_used.append(action_effects[best_action])
-                return best_action
-            else:
-                return 5  # no_action fallback
+            best_action = int(np.argmax(action_effects))
+            self.causal_effects_used.append(float(action_effects[best_action]))
+            return best_action
         else:
             # Fallback to simple heuristic without causal oracle
             return self._simple_heuristic(state)
     
+    @staticmethod
+    def _context_key(context: Dict[str, Any]) -> Optional[Tuple]:
+        """Hashable context digest with floats rounded to 3 decimals; None if a value is unhashable."""
+        items = []
+        for key, value in sorted(context.items()):
+            if isinstance(value, float):
+                value = round(value, 3)
+            elif isinstance(value, list):
+                value = tuple(value)
+            try:
+                hash(value)
+            except TypeError:
+                return None
+            items.append((key, value))
+        return tuple(items)
+    
     def _simple_heuristic(self, state: np.ndarray) -> int:
         """Simple heuristic when no causal oracle available."""
         
@@ -348,14 +476,19 @@ class CausalHeuristicAgent:
         """Track episode completion."""
         self.episode_rewards.append(total_reward)
     
-    def get_metrics(self) -> Dict[str, Any]:
-        """Get agent metrics."""
-        return {
-            'episode_rewards': self.episode_rewards.copy(),
-            'causal_effects_used': self.causal_effects_used.copy(),
-            'avg_reward': np.mean(self.episode_rewards) if self.episode_rewards else 0.0,
-            'avg_causal_effect': np.mean(self.causal_effects_used) if self.causal_effects_used else 0.0
-        }
+    def get_metrics(self) -> MappingProxyType:
+        """
+        Get agent metrics.
+        
+        Returns a read-only snapshot: the arrays are read-only views of the values
+        recorded so far (not copied), and later episodes are not reflected.
+        """
+        return MappingProxyType({
+            'episode_rewards': self.episode_rewards.view(),
+            'causal_effects_used': self.causal_effects_used.view(),
+            'avg_reward': self.episode_rewards.mean(),
+            'avg_causal_effect': self.causal_effects_used.mean()
+        })
     
     def save_model(self, filepath: str) -> None:
         """Save agent metrics."""
@@ -363,7 +496,7 @@ class CausalHeuristicAgent:
         with open(filepath, 'w') as f:
             json.dump({
                 'type': 'causal_heuristic',
-                'metrics': self.get_metrics()
+                'metrics': _metrics_to_json(self.get_metrics())
             }, f, indent=2)
     
     def load_model(self, filepath: str) -> None:
@@ -374,8 +507,8 @@ class CausalHeuristicAgent:
                 data = json.load(f)
                 if 'metrics' in data:
                     metrics = data['metrics']
-                    self.episode_rewards = metrics.get('episode_rewards', [])
-                    self.causal_effects_used = metrics.get('causal_effects_used', [])
+                    self.episode_rewards = _GrowableArray(metrics.get('episode_rewards', []))
+                    self.causal_effects_used = _GrowableArray(metrics.get('causal_effects_used', []))
         except FileNotFoundError:
             logger.warning(f"Model file not found: {filepath}")
 
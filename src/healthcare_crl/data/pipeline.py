@@ -7,6 +7,7 @@ import pandas as pd
 import numpy as np
 from typing import Dict, List, Tuple, Optional, Any
 from dataclasses import dataclass
+from functools import lru_cache
 from datetime import datetime, timedelta
 import json
 import logging
@@ -247,6 +248,9 @@ class RealDataPipeline:
             'public_emergencies_test': 'Public_emdat_custom_request_2025-10-23_testdata.csv'
         }
         
+        # Integrated feature frames memoized per mode; the source datasets never change after loading
+        self._integrated_features_cached = lru_cache(maxsize=None)(self._build_integrated_features)
+        
         # Load datasets on initialization
         self._load_all_datasets()
     
@@ -419,7 +423,11 @@ class RealDataPipeline:
         return self.datasets[dataset_key].copy()
     
     def create_integrated_features(self, mode: str = 'train') -> pd.DataFrame:
-        """Create integrated feature set combining all datasets."""
+        """Create integrated feature set combining all datasets (built once per mode)."""
+        return self._integrated_features_cached(mode).copy()
+    
+    def _build_integrated_features(self, mode: str) -> pd.DataFrame:
+        """Merge supply chain, logistics and disaster data into the integrated feature set."""
         logger.info(f"Creating integrated features for {mode} mode...")
         
         # Get primary supply chain data
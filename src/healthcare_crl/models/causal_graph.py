@@ -7,20 +7,120 @@ import numpy as np
 import pandas as pd
 from typing import Dict, List, Tuple, Optional, Any
 import networkx as nx
-from pgmpy.models import DiscreteBayesianNetwork
+from numba import njit
+from pgmpy.models import DiscreteBayesianNetwork, DiscreteMarkovNetwork
 from pgmpy.estimators import MaximumLikelihoodEstimator, BayesianEstimator
-from pgmpy.inference import VariableElimination
+from pgmpy.inference import VariableElimination, BeliefPropagation
 from pgmpy.factors.discrete import TabularCPD
 import logging
+import sys
 from dataclasses import dataclass
+from functools import lru_cache
+from bisect import bisect_left
 import json
+import math
+import itertools
 
 logger = logging.getLogger(__name__)
 
+# Discretization rules based on real data distributions: (upper-inclusive thresholds, labels)
+_DISCRETIZATION_RULES = {
+    'lead_time_days': ((30, 60, 90), ('short', 'medium', 'long', 'very_long')),
+    'on_time_delivery_pct': ((80, 90, 95), ('low', 'medium', 'high', 'excellent')),
+    'supplier_reliability_score': ((0.5, 0.8), ('low', 'medium', 'high')),
+    'stockout_frequency': ((0.1, 0.2, 0.5), ('rare', 'occasional', 'frequent', 'critical')),
+    'freight_cost_level': ((25000, 50000, 100000), ('low', 'medium', 'high', 'premium')),
+    'lpi_score': ((2.0, 3.0, 4.0), ('very_low', 'low', 'medium', 'high', 'very_high')),
+    'disruption_severity': ((1, 2, 4), ('none', 'low', 'medium', 'high', 'extreme')),
+}
 
-@dataclass
+# Quartile bins for numeric values of variables without a specific rule
+_GENERIC_BINS = np.array([0.25, 0.5, 0.75])
+_GENERIC_LABELS = np.array(['low', 'medium', 'high', 'very_high'])
+
+# Labels for the equal-width bins used to discretize fitting data
+_BIN_LABELS = ['low', 'medium', 'high', 'very_high']
+
+# Positive outcome states ("negative" as in low/no disruption) counted by causal effect estimates
+_NEGATIVE_STATES = frozenset({'low', 'none', 'fast', 'normal'})
+
+# Action variables in feasibility bitmask order (bit i of _legal_mask is _ACTION_VARIABLES[i])
+_ACTION_VARIABLES = ('switch_supplier', 'increase_safety_stock', 'emergency_procurement',
+                     'reroute_shipments', 'allocate_resources')
+_ACTION_BITS = {action: 1 << i for i, action in enumerate(_ACTION_VARIABLES)}
+
+# Discretized context keys read by the feasibility rules, in _legal_mask slot order:
+# (key, state codes, default state); states outside the code table pack as -1
+_FEASIBILITY_KEYS = (
+    ('supplier_reliability', {'low': 0, 'medium': 1, 'high': 2}, 'high'),
+    ('inventory_level', {'low': 0, 'medium': 1, 'normal': 2, 'high': 3}, 'normal'),
+    ('stockout_risk', {'low': 0, 'medium': 1, 'high': 2, 'critical': 3}, 'low'),
+    ('transportation_capacity', {'limited': 0, 'normal': 1, 'high': 2}, 'normal'),
+    ('service_disruption', {'none': 0, 'low': 1, 'medium': 2, 'high': 3}, 'none'),
+)
+
+
+def _pack_context(context_str: Dict[str, str]) -> np.ndarray:
+    """Encode the feasibility-relevant context states as a small int8 vector."""
+    return np.array([codes.get(context_str.get(key, default), -1) for key, codes, default in _FEASIBILITY_KEYS],
+                    dtype=np.int8)
+
+
+@njit(cache=True, nogil=True)
+def _legal_mask(v):
+    """Feasibility rules based on causal constraints, as a bitmask over _ACTION_VARIABLES."""
+    m = 0
+    if v[0] != 2:  # switch_supplier: supplier reliability not already high
+        m |= 1
+    if v[1] != 3:  # increase_safety_stock: inventory level not already high
+        m |= 2
+    if v[2] >= 1:  # emergency_procurement: stockout risk medium, high or critical
+        m |= 4
+    if v[3] == 0:  # reroute_shipments: transportation capacity limited
+        m |= 8
+    if v[4] != 0:  # allocate_resources: some service disruption
+        m |= 16
+    return m
+
+
+def _mask_allows(mask: int, action: str) -> bool:
+    """Whether a feasibility bitmask allows action; actions without causal constraints are always feasible."""
+    bit = _ACTION_BITS.get(action)
+    return bit is None or bool(mask & bit)
+
+
+# Primary outcome variable for each action type based on real data
+_ACTION_OUTCOMES = {
+    'switch_supplier': 'supplier_reliability_score',
+    'increase_safety_stock': 'stockout_frequency',
+    'emergency_procurement': 'stockout_frequency',
+    'reroute_shipments': 'lead_time_days',
+    'allocate_resources': 'on_time_delivery_pct'
+}
+
+
+# Mechanism descriptions for known causal relationships
+_MECHANISMS = {
+    ('disruption_severity', 'supplier_reliability_score'): "Higher disruption severity reduces supplier reliability",
+    ('supplier_reliability_score', 'on_time_delivery_pct'): "More reliable suppliers achieve better on-time delivery",
+    ('lead_time_days', 'on_time_delivery_pct'): "Longer lead times reduce on-time delivery performance",
+    ('on_time_delivery_pct', 'outcome_metric'): "Better delivery performance improves overall outcomes",
+    ('lpi_score', 'lead_time_days'): "Better logistics infrastructure reduces lead times",
+    ('transport_mode', 'freight_cost_level'): "Air transport costs more than ocean or land",
+    ('warehouse_type', 'stockout_frequency'): "Warehouse efficiency affects stockout rates",
+    ('increase_safety_stock', 'stockout_frequency'): "Higher safety stock reduces stockout risk",
+    ('switch_supplier', 'supplier_reliability_score'): "Switching suppliers may improve or worsen reliability",
+    ('emergency_procurement', 'freight_cost_level'): "Emergency procurement increases costs significantly",
+}
+_DEFAULT_MECHANISM_TEMPLATE = "{cause} causally influences {effect}"
+
+# Slotted dataclasses need Python 3.10+; older interpreters fall back to a regular (frozen) dataclass
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class CausalRelationship:
-    """Represents a causal relationship between variables."""
+    """Represents an immutable causal relationship between variables."""
     cause: str
     effect: str
     strength: float
@@ -40,6 +140,19 @@ class CausalGraph:
         self.dag = nx.DiGraph()
         self.causal_relationships = {}
         self.intervention_effects = {}
+        # Descendants of each node (including itself), filled in by build_healthcare_dag
+        self.reachable_from: Dict[str, set] = {}
+        # Frozen CSR adjacency of the DAG (successors and predecessors), filled in by build_healthcare_dag
+        self._nodes: Tuple[str, ...] = ()
+        self._node_index: Dict[str, int] = {}
+        self._succ_indptr = np.zeros(1, dtype=np.int32)
+        self._succ_indices = np.empty(0, dtype=np.int32)
+        self._pred_indptr = np.zeros(1, dtype=np.int32)
+        self._pred_indices = np.empty(0, dtype=np.int32)
+        # Structure-of-arrays view of causal_relationships for vectorized edge aggregation
+        self._edge_cause = np.empty(0, dtype=np.int32)
+        self._edge_effect = np.empty(0, dtype=np.int32)
+        self._edge_strength = np.empty(0, dtype=np.float32)
         
         # Define variable types based on real data features
         self.variable_domains = {
@@ -71,6 +184,8 @@ class CausalGraph:
             'reroute_shipments': ['no', 'yes'],
             'allocate_resources': ['no', 'yes']
         }
+        # Domain sizes, precomputed for CPD construction
+        self._cardinalities: Dict[str, int] = {k: len(v) for k, v in self.variable_domains.items()}
     
     def build_healthcare_dag(self) -> None:
         """Build DAG based on real healthcare supply chain data relationships."""
@@ -132,6 +247,9 @@ class CausalGraph:
             
         # Store causal relationships with domain knowledge
         self._define_causal_strengths()
+        self._build_adjacency()
+        self._build_edge_arrays()
+        self.reachable_from = {node: self.descendants_of(node) | {node} for node in self._nodes}
         
         logger.info(f"Built DAG with {len(self.dag.nodes)} variables and {len(self.dag.edges)} causal relationships")
     
@@ -176,37 +294,187 @@ class CausalGraph:
                 mechanism=self._get_mechanism_description(cause, effect)
             )
     
+    def _build_adjacency(self) -> None:
+        """Index DAG nodes and freeze the edges into int32 CSR arrays for reads without networkx."""
+        self._nodes = tuple(self.dag.nodes)
+        self._node_index = {node: i for i, node in enumerate(self._nodes)}
+        edges = np.array([(self._node_index[u], self._node_index[v]) for u, v in self.dag.edges],
+                         dtype=np.int32).reshape(-1, 2)
+        self._succ_indptr, self._succ_indices = self._to_csr(edges[:, 0], edges[:, 1], len(self._nodes))
+        self._pred_indptr, self._pred_indices = self._to_csr(edges[:, 1], edges[:, 0], len(self._nodes))
+    
+    @staticmethod
+    def _to_csr(rows: np.ndarray, cols: np.ndarray, n: int) -> Tuple[np.ndarray, np.ndarray]:
+        """CSR (indptr, indices) arrays of the edges rows[k] -> cols[k] over n nodes."""
+        order = np.argsort(rows, kind='stable')
+        indptr = np.zeros(n + 1, dtype=np.int32)
+        np.cumsum(np.bincount(rows, minlength=n), out=indptr[1:])
+        return indptr, cols[order].astype(np.int32)
+    
+    def successors_of(self, node: str) -> List[str]:
+        """Direct effects of node in the frozen DAG."""
+        i = self._node_index[node]
+        return [self._nodes[j] for j in self._succ_indices[self._succ_indptr[i]:self._succ_indptr[i + 1]].tolist()]
+    
+    def predecessors_of(self, node: str) -> List[str]:
+        """Direct causes of node in the frozen DAG."""
+        i = self._node_index[node]
+        return [self._nodes[j] for j in self._pred_indices[self._pred_indptr[i]:self._pred_indptr[i + 1]].tolist()]
+    
+    def is_root(self, node: str) -> bool:
+        """Whether node has no causes in the frozen DAG."""
+        i = self._node_index[node]
+        return self._pred_indptr[i] == self._pred_indptr[i + 1]
+    
+    def descendants_of(self, node: str) -> set:
+        """All nodes reachable from node (excluding itself), by breadth-first search over the CSR arrays."""
+        start = self._node_index[node]
+        seen = np.zeros(len(self._nodes), dtype=bool)
+        # Marked seen up front so a cycle back to node does not expand it again
+        seen[start] = True
+        frontier = [start]
+        while frontier:
+            reached = np.concatenate([self._succ_indices[self._succ_indptr[i]:self._succ_indptr[i + 1]]
+                                      for i in frontier])
+            reached = reached[~seen[reached]]
+            seen[reached] = True
+            frontier = np.unique(reached).tolist()
+        seen[start] = False
+        return {self._nodes[j] for j in np.flatnonzero(seen).tolist()}
+    
+    def _build_edge_arrays(self) -> None:
+        """Mirror causal relationships as parallel cause/effect/strength arrays over the node index."""
+        relationships = list(self.causal_relationships.values())
+        self._edge_cause = np.array([self._node_index[r.cause] for r in relationships], dtype=np.int32)
+        self._edge_effect = np.array([self._node_index[r.effect] for r in relationships], dtype=np.int32)
+        self._edge_strength = np.array([r.strength for r in relationships], dtype=np.float32)
+    
+    def strengths_by_effect(self, effect: str) -> np.ndarray:
+        """Strengths of all defined causal relationships into effect."""
+        effect_id = self._node_index.get(effect, -1)
+        return self._edge_strength[self._edge_effect == effect_id]
+    
     def _get_mechanism_description(self, cause: str, effect: str) -> str:
         """Generate mechanism description for causal relationship."""
-        mechanisms = {
-            ('disruption_severity', 'supplier_reliability_score'): "Higher disruption severity reduces supplier reliability",
-            ('supplier_reliability_score', 'on_time_delivery_pct'): "More reliable suppliers achieve better on-time delivery",
-            ('lead_time_days', 'on_time_delivery_pct'): "Longer lead times reduce on-time delivery performance",
-            ('on_time_delivery_pct', 'outcome_metric'): "Better delivery performance improves overall outcomes",
-            ('lpi_score', 'lead_time_days'): "Better logistics infrastructure reduces lead times",
-            ('transport_mode', 'freight_cost_level'): "Air transport costs more than ocean or land",
-            ('warehouse_type', 'stockout_frequency'): "Warehouse efficiency affects stockout rates",
-            ('increase_safety_stock', 'stockout_frequency'): "Higher safety stock reduces stockout risk",
-            ('switch_supplier', 'supplier_reliability_score'): "Switching suppliers may improve or worsen reliability",
-            ('emergency_procurement', 'freight_cost_level'): "Emergency procurement increases costs significantly",
-        }
-        
-        return mechanisms.get((cause, effect), f"{cause} causally influences {effect}")
+        try:
+            return _MECHANISMS[(cause, effect)]
+        except KeyError:
+            return _DEFAULT_MECHANISM_TEMPLATE.format(cause=cause, effect=effect)
+
+
+class ConstantCPD(TabularCPD):
+    """
+    TabularCPD whose entries all share one value, stored as a scalar.
+    values is a read-only broadcast view instead of a (card, prod(evidence_card)) table;
+    copy() returns a dense TabularCPD for consumers that need to write to it.
+    """
+    
+    def __init__(self, variable: str, variable_card: int, evidence: Optional[List[str]] = None,
+                 evidence_card: Optional[List[int]] = None, value: Optional[float] = None,
+                 state_names: Optional[Dict[str, List[str]]] = None):
+        """Initialize the CPD; value defaults to the uniform 1 / variable_card."""
+        state_names = state_names or {}
+        self._const = 1.0 / variable_card if value is None else float(value)
+        # Validate the variable on a single column, then widen the scope to the evidence
+        super().__init__(variable, variable_card, [[self._const]] * variable_card,
+                         state_names={k: v for k, v in state_names.items() if k == variable})
+        if evidence:
+            if evidence_card is None or len(evidence_card) != len(evidence):
+                raise ValueError("Length of evidence_card doesn't match length of evidence")
+            self.variables = [variable, *evidence]
+            self.cardinality = np.array([variable_card, *evidence_card], dtype=int)
+            self.store_state_names(self.variables, self.cardinality, state_names)
+        self.values = np.broadcast_to(np.float64(self._const), tuple(self.cardinality))
+    
+    def get_values(self) -> np.ndarray:
+        """Read-only 2-D view of the CPD values, without materializing them."""
+        return np.broadcast_to(self._const, (self.variable_card, math.prod(self.cardinality[1:].tolist())))
+
+
+class CachedVE(VariableElimination):
+    """
+    VariableElimination that memoizes evidence-reduced factors.
+    Evidence is split into hot variables (the action interventions) and the rest. The model
+    factors reduced by the rest are cached as a factor network with its own engine, so queries
+    that differ only in an action state reduce once. Only pgmpy's public API is used.
+    """
+    
+    def __init__(self, model, hot_variables=(), maxsize: int = 256):
+        """Initialize the engine; hot_variables are reduced per query instead of cached."""
+        super().__init__(model)
+        self.hot_variables = frozenset(hot_variables)
+        self._factors = [cpd.to_factor() for cpd in model.get_cpds()]
+        self._reduced_engine = lru_cache(maxsize=maxsize)(self._reduce_rest)
+    
+    def _reduce_rest(self, variables: Tuple[str, ...], hot_vars: frozenset,
+                     rest_items: frozenset) -> VariableElimination:
+        """Engine over the ancestral factors of the query, reduced by the non-hot evidence."""
+        rest = dict(rest_items)
+        # Ancestors of the query and evidence variables, as the stock engine prunes them; the
+        # hot variables' states do not change this set
+        relevant = self.model.get_ancestral_graph([*variables, *hot_vars, *rest]).nodes()
+        network = DiscreteMarkovNetwork()
+        network.add_nodes_from(var for var in relevant if var not in rest)
+        for factor in self._factors:
+            if factor.variables[0] not in relevant:
+                continue
+            reduce_items = [(var, state) for var, state in rest.items() if var in factor.variables]
+            if reduce_items:
+                for var, state in reduce_items:
+                    factor.get_state_no(var, state)  # KeyError on unknown states, like the stock engine
+                factor = factor.reduce(reduce_items, inplace=False)
+            if not factor.variables:
+                continue  # Fully observed: a constant the normalization absorbs
+            network.add_edges_from(itertools.combinations(factor.variables, 2))
+            network.add_factors(factor)
+        return VariableElimination(network)
+    
+    def query(self, variables, evidence=None, virtual_evidence=None, elimination_order="greedy",
+              joint=True, show_progress=True):
+        """Marginal query over the full model, reusing the cached non-hot evidence reductions."""
+        if virtual_evidence is not None:
+            return super().query(variables, evidence=evidence, virtual_evidence=virtual_evidence,
+                                 elimination_order=elimination_order, joint=joint, show_progress=show_progress)
+        evidence = evidence if evidence is not None else {}
+        common_vars = set(variables) & set(evidence)
+        if common_vars:
+            raise ValueError(f"Can't have the same variables in both `variables` and `evidence`. Found in both: {common_vars}")
+        hot = {var: state for var, state in evidence.items() if var in self.hot_variables}
+        rest_items = frozenset(item for item in evidence.items() if item[0] not in self.hot_variables)
+        engine = self._reduced_engine(tuple(variables), frozenset(hot), rest_items)
+        result = engine.query(list(variables), evidence=hot, elimination_order=elimination_order,
+                              joint=joint, show_progress=show_progress)
+        # Factor-network queries come back unnormalized
+        if joint:
+            return result.normalize(inplace=False)
+        return {var: factor.normalize(inplace=False) for var, factor in result.items()}
 
 
 class BayesianNetworkInference:
     """Bayesian Network for causal inference and counterfactual analysis."""
     
-    def __init__(self, causal_graph: CausalGraph):
+    def __init__(self, causal_graph: CausalGraph, use_bp: bool = False):
         """Initialize Bayesian Network from causal graph."""
         self.causal_graph = causal_graph
         self.bn_model = None
         self.inference_engine = None
+        # Optional calibrated junction tree (BeliefPropagation) as the query engine instead of VE
+        self.use_bp = use_bp
+        self.bp = None
+        # Per-variable 0/1 weights over its states marking the positive-outcome states
+        self._negative_mask: Dict[str, np.ndarray] = {}
+        # Per-variable state names of the fitted model, to validate evidence without a query
+        self._state_names: Dict[str, Tuple[str, ...]] = {}
         self.fitted = False
+        # Memoized inference queries keyed on (outcome, sorted evidence items); cleared on refit
+        self._query_cached = lru_cache(maxsize=4096)(self._query_impl)
+        self._query_marginals_cached = lru_cache(maxsize=4096)(self._query_marginals_impl)
 
-    def fit(self, data: pd.DataFrame = None) -> None:
-        """Fit Bayesian Network using domain knowledge (no data required)."""
+    def fit(self, data: pd.DataFrame = None, dtype=np.float32) -> None:
+        """Fit Bayesian Network using domain knowledge (no data required); CPD tables are stored as dtype."""
         logger.info("Fitting Bayesian Network using domain knowledge...")
+        self._query_cached.cache_clear()
+        self._query_marginals_cached.cache_clear()
 
         # Create Bayesian Network structure from DAG
         # Ensure only (cause, effect) tuples are used, not weighted edges
@@ -228,60 +496,120 @@ class BayesianNetworkInference:
                 self._add_uniform_cpd(variable)
             except Exception as e:
                 logger.warning(f"Could not add CPD for {variable}: {e}")
+        self._freeze_cpd_values(dtype)
 
         # Validate model
         if self.bn_model.check_model():
-            self.inference_engine = VariableElimination(self.bn_model)
+            self._init_inference_engines()
             self.fitted = True
             logger.info("Bayesian Network fitted successfully using domain knowledge")
         else:
             logger.error("Bayesian Network model validation failed")
     
+    def _freeze_cpd_values(self, dtype) -> None:
+        """Store every CPD table as a contiguous, read-only array of dtype."""
+        for cpd in self.bn_model.get_cpds():
+            if isinstance(cpd, ConstantCPD):
+                # Keep the zero-copy broadcast view; only its scalar changes type
+                values = np.broadcast_to(np.asarray(cpd._const, dtype=dtype), cpd.values.shape)
+            else:
+                values = np.ascontiguousarray(cpd.values, dtype=dtype)
+            values.flags.writeable = False
+            cpd.values = values
+    
+    def _init_inference_engines(self) -> None:
+        """Create the inference engines for the current model, calibrating the junction tree once."""
+        self.inference_engine = CachedVE(self.bn_model, hot_variables=_ACTION_VARIABLES)
+        self._negative_mask = {
+            cpd.variable: np.array([state in _NEGATIVE_STATES for state in cpd.state_names[cpd.variable]],
+                                   dtype=np.float64)
+            for cpd in self.bn_model.get_cpds()
+        }
+        self._state_names = {cpd.variable: tuple(cpd.state_names[cpd.variable])
+                             for cpd in self.bn_model.get_cpds()}
+        if self.use_bp:
+            self.bp = BeliefPropagation(self.bn_model)
+            self.bp.calibrate()
+        self._query_cached.cache_clear()
+        self._query_marginals_cached.cache_clear()
+    
     def _preprocess_data(self, data: pd.DataFrame) -> pd.DataFrame:
         """Preprocess data for Bayesian Network fitting."""
-        processed_data = data.copy()
+        # Discretize continuous variables: 4 equal-width bins per column (pd.cut semantics), edges for all columns at once
+        num_cols = data.select_dtypes(include=['float64', 'int64']).columns.tolist()
+        if not num_cols:
+            return data
         
-        # Discretize continuous variables
-        for column in processed_data.columns:
-            if processed_data[column].dtype in ['float64', 'int64']:
-                processed_data[column] = pd.cut(
-                    processed_data[column], 
-                    bins=4, 
-                    labels=['low', 'medium', 'high', 'very_high']
-                )
+        # Shallow copy: only the discretized columns are replaced, the rest stay shared with data
+        processed_data = data.copy(deep=False)
+        values = data[num_cols].to_numpy(dtype=np.float64)
+        lo = np.nanmin(values, axis=0)
+        hi = np.nanmax(values, axis=0)
+        # Constant columns are widened by 0.1% on each side, as pd.cut does
+        flat = lo == hi
+        pad = np.where(lo == 0, 0.001, 0.001 * np.abs(lo))
+        lo = np.where(flat, lo - pad, lo)
+        hi = np.where(flat, hi + pad, hi)
+        inner_edges = np.linspace(lo, hi, 5)[1:-1]
+        
+        for j, column in enumerate(num_cols):
+            # Right-inclusive bins: a value equal to an edge belongs to the lower bin
+            codes = np.searchsorted(inner_edges[:, j], values[:, j], side='left')
+            codes[np.isnan(values[:, j])] = -1
+            processed_data[column] = pd.Categorical.from_codes(codes, categories=_BIN_LABELS, ordered=True)
         
         return processed_data
     
     def _add_uniform_cpd(self, variable: str) -> None:
         """Add uniform CPD for variable when estimation fails."""
-        domain_size = len(self.causal_graph.variable_domains.get(variable, ['low', 'high']))
+        cardinalities = self.causal_graph._cardinalities
+        domain_size = cardinalities.get(variable, 2)
         parents = list(self.bn_model.predecessors(variable))
+        parent_cards = [cardinalities.get(p, 2) for p in parents]
         
-        if not parents:
-            # No parents - uniform distribution
-            values = np.ones(domain_size) / domain_size
-            cpd = TabularCPD(
-                variable=variable,
-                variable_card=domain_size,
-                values=values.reshape(-1, 1)
-            )
-        else:
-            # With parents - uniform conditional distribution
-            parent_cards = [len(self.causal_graph.variable_domains.get(p, ['low', 'high'])) 
-                          for p in parents]
-            num_combinations = np.prod(parent_cards)
-            
-            values = np.ones((domain_size, num_combinations)) / domain_size
-            cpd = TabularCPD(
-                variable=variable,
-                variable_card=domain_size,
-                values=values,
-                evidence=parents,
-                evidence_card=parent_cards
-            )
+        # Stored as a single scalar, so many-parent variables never allocate the dense table
+        cpd = ConstantCPD(
+            variable=variable,
+            variable_card=domain_size,
+            evidence=parents or None,
+            evidence_card=parent_cards or None,
+            value=1.0 / domain_size
+        )
         
         self.bn_model.add_cpds(cpd)
     
+    def _query_impl(self, outcome: str, evidence_items: Tuple[Tuple[str, str], ...]):
+        """Run a marginal inference query for outcome given the evidence items."""
+        engine = self.bp if self.use_bp else self.inference_engine
+        return engine.query(variables=[outcome], evidence=dict(evidence_items), show_progress=False)
+    
+    def _query_marginals_impl(self, outcomes: Tuple[str, ...], evidence_items: Tuple[Tuple[str, str], ...]):
+        """Run one inference query returning the marginal factor of each outcome given the evidence items."""
+        engine = self.bp if self.use_bp else self.inference_engine
+        return engine.query(variables=list(outcomes), evidence=dict(evidence_items), joint=False, show_progress=False)
+    
+    def _is_d_separated(self, action: str, outcome: str, evidence: Dict[str, str]) -> bool:
+        """Whether setting action cannot change outcome given the evidence, so no query is needed."""
+        # Root action that cannot reach the outcome, with no evidence downstream of it to open a
+        # collider path: d-separated, so both queries would give the same distribution
+        reachable = self.causal_graph.reachable_from.get(action)
+        return (self.inference_engine is not None and reachable is not None and outcome not in reachable
+                and outcome in self.causal_graph._node_index and self.causal_graph.is_root(action)
+                and reachable.isdisjoint(evidence) and self._is_valid_query(action, outcome, evidence))
+    
+    def _is_valid_query(self, action: str, outcome: str, evidence: Dict[str, str]) -> bool:
+        """Whether both action-state queries would run, so the shortcut keeps the invalid-query fallback."""
+        state_names = self._state_names
+        action_states = state_names.get(action, ())
+        return (outcome in self._negative_mask and outcome not in evidence
+                and 'yes' in action_states and 'no' in action_states
+                and all(state in state_names.get(var, ()) for var, state in evidence.items() if var != action))
+    
+    @staticmethod
+    def _base_evidence_items(items, action: str) -> Tuple[Tuple[str, str], ...]:
+        """Sorted evidence items without any entry for action, ready to have the action state appended."""
+        return tuple(item for item in sorted(items) if item[0] != action)
+    
     def estimate_causal_effect(self, action: str, outcome: str, 
                              context: Dict[str, str] = None) -> float:
         """Estimate causal effect of action on outcome."""
@@ -293,30 +621,22 @@ class BayesianNetworkInference:
             # Set context variables if provided
             evidence = context or {}
             
+            if self._is_d_separated(action, outcome, evidence):
+                return 0.0
+            
+            # Canonical evidence items shared by both queries; the action entry is appended last
+            base_items = self._base_evidence_items(evidence.items(), action)
+            
             # Calculate P(outcome | do(action=yes), evidence)
-            evidence_action = evidence.copy()
-            evidence_action[action] = 'yes'
-            prob_action = self.inference_engine.query(
-                variables=[outcome], 
-                evidence=evidence_action
-            )
+            prob_action = self._query_cached(outcome, base_items + ((action, 'yes'),))
             
             # Calculate P(outcome | do(action=no), evidence) 
-            evidence_no_action = evidence.copy()
-            evidence_no_action[action] = 'no'
-            prob_no_action = self.inference_engine.query(
-                variables=[outcome],
-                evidence=evidence_no_action
-            )
+            prob_no_action = self._query_cached(outcome, base_items + ((action, 'no'),))
             
             # Causal effect = difference in probabilities for positive outcome
-            positive_states = ['high', 'severe', 'critical', 'very_slow']  # Negative outcomes
-            negative_states = ['low', 'none', 'fast', 'normal']  # Positive outcomes
-            
-            effect_action = sum(prob_action.values[i] for i, state in enumerate(prob_action.state_names[outcome]) 
-                              if state in negative_states)
-            effect_no_action = sum(prob_no_action.values[i] for i, state in enumerate(prob_no_action.state_names[outcome])
-                                 if state in negative_states)
+            negative_mask = self._negative_mask[outcome]
+            effect_action = float(prob_action.values @ negative_mask)
+            effect_no_action = float(prob_no_action.values @ negative_mask)
             
             # Return negative effect (reduction in bad outcomes is positive)
             causal_effect = effect_no_action - effect_action
@@ -327,6 +647,48 @@ class BayesianNetworkInference:
             # Return default positive effect (domain knowledge: actions are generally beneficial)
             return 0.1
     
+    def batch_estimate(self, actions: List[str], outcomes_per_action: List[List[str]],
+                       context: Dict[str, str] = None) -> Dict[str, Dict[str, float]]:
+        """Estimate causal effects of each action on its outcomes, sharing one query per action state."""
+        evidence = context or {}
+        return {
+            action: self._estimate_action_effects(action, list(outcomes), evidence)
+            for action, outcomes in zip(actions, outcomes_per_action)
+        }
+    
+    def _estimate_action_effects(self, action: str, outcomes: List[str],
+                                 evidence: Dict[str, str]) -> Dict[str, float]:
+        """Causal effects of one action on several outcomes, with the same semantics as estimate_causal_effect."""
+        if not self.fitted:
+            return {outcome: 0.1 for outcome in outcomes}
+        
+        effects = {}
+        pending = []
+        for outcome in outcomes:
+            if self._is_d_separated(action, outcome, evidence):
+                effects[outcome] = 0.0
+            elif outcome not in effects:
+                pending.append(outcome)
+        
+        if len(pending) == 1:
+            effects[pending[0]] = self.estimate_causal_effect(action, pending[0], evidence)
+        elif pending:
+            try:
+                # Per-variable marginals from one elimination pass per action state
+                base_items = self._base_evidence_items(evidence.items(), action)
+                marginals_action = self._query_marginals_cached(tuple(pending), base_items + ((action, 'yes'),))
+                marginals_no_action = self._query_marginals_cached(tuple(pending), base_items + ((action, 'no'),))
+                for outcome in pending:
+                    negative_mask = self._negative_mask[outcome]
+                    effects[outcome] = (float(marginals_no_action[outcome].values @ negative_mask)
+                                        - float(marginals_action[outcome].values @ negative_mask))
+            except Exception:
+                # One invalid outcome fails the shared query; estimate each pair on its own instead
+                for outcome in pending:
+                    effects[outcome] = self.estimate_causal_effect(action, outcome, evidence)
+        
+        return {outcome: effects[outcome] for outcome in outcomes}
+    
     def counterfactual_analysis(self, action: str, outcome: str, 
                               observed_data: Dict[str, str]) -> Dict[str, float]:
         """Perform counterfactual analysis: What would have happened if...?"""
@@ -335,19 +697,13 @@ class BayesianNetworkInference:
         
         try:
             # Factual: What actually happened
-            factual_prob = self.inference_engine.query(
-                variables=[outcome],
-                evidence=observed_data
-            )
+            observed_items = tuple(sorted(observed_data.items()))
+            factual_prob = self._query_cached(outcome, observed_items)
             
             # Counterfactual: What if we had taken the action?
-            counterfactual_evidence = observed_data.copy()
-            counterfactual_evidence[action] = 'yes'
+            counterfactual_items = self._base_evidence_items(observed_items, action) + ((action, 'yes'),)
             
-            counterfactual_prob = self.inference_engine.query(
-                variables=[outcome],
-                evidence=counterfactual_evidence
-            )
+            counterfactual_prob = self._query_cached(outcome, counterfactual_items)
             
             return {
                 'factual_probability': factual_prob.values.max(),
@@ -370,10 +726,8 @@ class CausalOracle:
         """Initialize causal oracle."""
         self.causal_graph = causal_graph
         self.bn_inference = bn_inference
-        self.action_variables = [
-            'switch_supplier', 'increase_safety_stock', 'emergency_procurement',
-            'reroute_shipments', 'allocate_resources'
-        ]
+        self.action_variables = list(_ACTION_VARIABLES)
+        self._action_outcomes = _ACTION_OUTCOMES
         
     def effect(self, action: str, context: Dict[str, Any]) -> float:
         """
@@ -400,24 +754,33 @@ class CausalOracle:
         Check if action is causally feasible given context.
         Used for action masking in CRL agents.
         """
+        return self._check_feasibility(action, self._convert_context(context))
+    
+    def _check_feasibility(self, action: str, context_str: Dict[str, str]) -> bool:
+        """Apply feasibility rules to an already-discretized context."""
+        return _mask_allows(_legal_mask(_pack_context(context_str)), action)
+    
+    def feasible_mask(self, actions: List[str], context: Dict[str, Any]) -> np.ndarray:
+        """Boolean feasibility mask for several actions, discretizing the context once."""
+        mask = _legal_mask(_pack_context(self._convert_context(context)))
+        return np.array([_mask_allows(mask, action) for action in actions], dtype=bool)
+    
+    def effects_batch(self, actions: List[str], context: Dict[str, Any]) -> np.ndarray:
+        """Estimate causal effects of several actions in one context, discretizing the context once."""
         context_str = self._convert_context(context)
-        
-        # Define feasibility rules based on causal constraints
-        feasibility_rules = {
-            'switch_supplier': lambda ctx: ctx.get('supplier_reliability', 'high') != 'high',
-            'increase_safety_stock': lambda ctx: ctx.get('inventory_level', 'normal') != 'high',
-            'emergency_procurement': lambda ctx: ctx.get('stockout_risk', 'low') in ['medium', 'high', 'critical'],
-            'reroute_shipments': lambda ctx: ctx.get('transportation_capacity', 'normal') == 'limited',
-            'allocate_resources': lambda ctx: ctx.get('service_disruption', 'none') != 'none'
-        }
-        
-        rule = feasibility_rules.get(action, lambda ctx: True)
-        return rule(context_str)
+        outcomes = [self._get_primary_outcome(action) for action in actions]
+        estimates = self.bn_inference.batch_estimate(actions, [[outcome] for outcome in outcomes], context_str)
+        return np.array([estimates[action][outcome] for action, outcome in zip(actions, outcomes)],
+                        dtype=np.float64)
+    
+    def batch_effect(self, context: Dict[str, Any]) -> Dict[str, float]:
+        """Causal effect of every action variable on its primary outcome in one context."""
+        return dict(zip(self.action_variables, self.effects_batch(self.action_variables, context).tolist()))
     
     def legal_actions(self, context: Dict[str, Any]) -> List[str]:
         """Get list of causally feasible actions for given context."""
-        return [action for action in self.action_variables 
-                if self.is_feasible(action, context)]
+        mask = _legal_mask(_pack_context(self._convert_context(context)))
+        return [action for action in self.action_variables if _mask_allows(mask, action)]
     
     def uplift(self, action: str, context: Dict[str, Any]) -> float:
         """
@@ -429,90 +792,43 @@ class CausalOracle:
     def _convert_context(self, context: Dict[str, Any]) -> Dict[str, str]:
         """Convert numerical context to categorical variables based on real data ranges."""
         context_str = {}
+        generic_keys = []
+        generic_values = []
         
-        # Define discretization rules based on real data distributions
-        discretization_rules = {
-            'lead_time_days': {
-                'thresholds': [30, 60, 90],
-                'labels': ['short', 'medium', 'long', 'very_long']
-            },
-            'on_time_delivery_pct': {
-                'thresholds': [80, 90, 95],
-                'labels': ['low', 'medium', 'high', 'excellent']
-            },
-            'supplier_reliability_score': {
-                'thresholds': [0.5, 0.8],
-                'labels': ['low', 'medium', 'high']
-            },
-            'stockout_frequency': {
-                'thresholds': [0.1, 0.2, 0.5],
-                'labels': ['rare', 'occasional', 'frequent', 'critical']
-            },
-            'freight_cost_level': {
-                'thresholds': [25000, 50000, 100000],
-                'labels': ['low', 'medium', 'high', 'premium']
-            },
-            'lpi_score': {
-                'thresholds': [2.0, 3.0, 4.0],
-                'labels': ['very_low', 'low', 'medium', 'high', 'very_high']
-            },
-            'disruption_severity': {
-                'thresholds': [1, 2, 4],
-                'labels': ['none', 'low', 'medium', 'high', 'extreme']
-            }
-        }
-        
-        # Apply discretization
+        # Apply discretization; unmapped numeric variables are classified together below
         for key, value in context.items():
-            if key in discretization_rules and isinstance(value, (int, float)):
-                rule = discretization_rules[key]
-                thresholds = rule['thresholds']
-                labels = rule['labels']
-                
-                # Find appropriate label
-                for i, threshold in enumerate(thresholds):
-                    if value <= threshold:
-                        context_str[key] = labels[i]
-                        break
-                else:
-                    context_str[key] = labels[-1]  # Highest category
+            rule = _DISCRETIZATION_RULES.get(key)
+            if rule is not None and isinstance(value, (int, float)):
+                thresholds, labels = rule
+                # Label of the first threshold >= value; above every threshold (or NaN) is the highest category
+                i = bisect_left(thresholds, value) if value == value else len(thresholds)
+                context_str[key] = labels[i] if i < len(thresholds) else labels[-1]
                     
             elif key in self.causal_graph.variable_domains:
                 if isinstance(value, str):
                     context_str[key] = value.lower()
                 else:
-                    # Generic discretization for unmapped variables
-                    if value < 0.25:
-                        context_str[key] = 'low'
-                    elif value < 0.5:
-                        context_str[key] = 'medium'
-                    elif value < 0.75:
-                        context_str[key] = 'high'
-                    else:
-                        context_str[key] = 'very_high'
+                    generic_keys.append(key)
+                    generic_values.append(value)
+        
+        if generic_keys:
+            # Generic discretization for unmapped variables in one vectorized pass
+            idx = np.searchsorted(_GENERIC_BINS, np.asarray(generic_values, dtype=np.float64), side='right')
+            context_str.update(zip(generic_keys, _GENERIC_LABELS[idx].tolist()))
         
         return context_str
     
     def _get_primary_outcome(self, action: str) -> str:
         """Get primary outcome variable for each action type based on real data."""
-        action_outcomes = {
-            'switch_supplier': 'supplier_reliability_score',
-            'increase_safety_stock': 'stockout_frequency',
-            'emergency_procurement': 'stockout_frequency',
-            'reroute_shipments': 'lead_time_days',
-            'allocate_resources': 'on_time_delivery_pct'
-        }
-        
-        return action_outcomes.get(action, 'outcome_metric')
+        return self._action_outcomes.get(action, 'outcome_metric')
     
     def get_causal_explanation(self, action: str, outcome: str) -> str:
         """Get textual explanation of causal relationship."""
-        key = (action, outcome)
-        if key in self.causal_graph.causal_relationships:
-            rel = self.causal_graph.causal_relationships[key]
-            return f"{rel.mechanism} (strength: {rel.strength:.2f})"
-        else:
+        try:
+            rel = self.causal_graph.causal_relationships[(action, outcome)]
+        except KeyError:
             return f"Indirect causal pathway from {action} to {outcome}"
+        return f"{rel.mechanism} (strength: {rel.strength:.2f})"
 
 
 def create_healthcare_causal_model(data: pd.DataFrame = None) -> Tuple[CausalGraph, CausalOracle]:
@@ -0,0 +1,188 @@
+"""
+Equivalence tests for the vectorized code paths.
+Each batch implementation is checked row by row against the scalar path it replaces,
+using small synthetic frames (no data files needed).
+"""
+
+import sys
+import numpy as np
+import pandas as pd
+import pytest
+from pathlib import Path
+
+# comprehensive_rules_framework is imported as a top-level module, like its callers do
+rules_path = str(Path(__file__).parent.parent / "data" / "TRADITIONAL_RULES")
+if rules_path not in sys.path:
+    sys.path.insert(0, rules_path)
+
+import comprehensive_rules_framework as crf
+from data.TRADITIONAL_RULES.reorder_safety_stock_rules import BATCH_ACTIONS, ReorderSafetyStockRules
+from data.TRADITIONAL_RULES.traditional_baseline_system import TraditionalBaselineSystem
+from src.healthcare_crl.agents.crl_agent import ReplayBuffer
+from src.healthcare_crl.baselines.baselines import DeterministicAgent
+
+
+@pytest.fixture
+def ghsc_frame():
+    """Synthetic GHSC-style records over a few countries and commodities."""
+    rng = np.random.default_rng(0)
+    n = 300
+    return pd.DataFrame({
+        'Country': rng.choice(['Kenya', 'Nigeria', 'Zambia'], n),
+        'Commodity_Type': rng.choice(['ARV', 'RDT'], n),
+        'Lead_Time_Days': rng.uniform(10, 90, n),
+        'Order_Volume_Units': rng.uniform(1e2, 1e7, n),
+        'Supplier_Reliability_Score': rng.uniform(0.5, 1.0, n),
+        'On_Time_Delivery_%': rng.uniform(0, 100, n),
+        'Freight_Cost_USD': rng.uniform(0, 2e5, n),
+        'Stockout_Frequency_per_Year': rng.uniform(0, 5, n),
+        'Disruption_Severity': rng.integers(0, 6, n).astype(float),
+        'CO2_Emissions_tons': rng.uniform(0, 25000, n),
+    })
+
+
+def test_decide_batch_matches_scalar_decision(ghsc_frame):
+    """decide_batch agrees with get_traditional_inventory_decision, including at the thresholds."""
+    rules = ReorderSafetyStockRules(ghsc_frame[ghsc_frame['Country'] != 'Zambia'])
+    keys = list(zip(ghsc_frame['Country'], ghsc_frame['Commodity_Type']))
+    inventories = ghsc_frame['Order_Volume_Units'].to_numpy() / 10000
+
+    # Probe values exactly at and just below each known key's thresholds
+    for (country, commodity), i in rules._key_index.items():
+        for threshold in (float(rules._rp[i]), float(rules._ss[i])):
+            keys += [(country, commodity)] * 2
+            inventories = np.append(inventories, [threshold, np.nextafter(threshold, 0)])
+
+    batch = rules.decide_batch(keys, inventories)
+    for row, ((country, commodity), inventory) in enumerate(zip(keys, inventories)):
+        decision = rules.get_traditional_inventory_decision(country, commodity, inventory, context={})
+        assert BATCH_ACTIONS[batch['action'][row]] == decision['action']
+        assert batch['quantity'][row] == pytest.approx(decision['quantity'])
+
+
+def test_deterministic_act_batch_matches_act():
+    """DeterministicAgent.act_batch picks the same action as act for every state."""
+    rng = np.random.default_rng(1)
+    agent = DeterministicAgent(state_size=8, action_size=6)
+    states = rng.uniform(0, 1, (500, 8))
+
+    actions = agent.act_batch(states)
+    assert actions.tolist() == [agent.act(state) for state in states]
+
+
+def test_integrated_decisions_match_scalar_decision(ghsc_frame):
+    """make_integrated_supply_chain_decisions reproduces make_integrated_supply_chain_decision."""
+    framework = crf.ComprehensiveTraditionalRulesFramework(ghsc_frame)
+    rng = np.random.default_rng(2)
+    contexts = ghsc_frame.drop(columns=['Country', 'Commodity_Type']).assign(
+        estimated_reorder_point=5e6, estimated_safety_stock=3e6, max_order_volume=4e6)
+    contexts.loc[5, 'Freight_Cost_USD'] = np.nan
+    inventory = rng.uniform(0, 6e6, len(contexts))
+    reliability = contexts['Supplier_Reliability_Score'].to_numpy()
+
+    batch = framework.make_integrated_supply_chain_decisions(contexts, inventory, reliability)
+    for row, context in enumerate(contexts.to_dict('records')):
+        decision = framework.make_integrated_supply_chain_decision(
+            'ARV', 'Kenya', 'Central', inventory[row], reliability[row], context)
+        out = batch.iloc[row]
+        assert decision['procurement_action'] == out.procurement_action
+        assert decision['quantity_to_order'] == pytest.approx(out.quantity_to_order)
+        assert decision['supplier_action'] == out.supplier_action
+        assert decision['transport_mode'] == out.transport_mode
+        assert decision['violations'] == crf._mask_names(int(out.violation_mask), crf.VIOLATION_NAMES)
+        assert decision['warnings'] == crf._mask_names(int(out.warning_mask), crf.WARNING_NAMES)
+        assert decision['compliance_score'] == out.compliance_score
+        assert decision['escalation_level'] == out.escalation_level
+        assert decision['approval_level'] == out.approval_level
+        assert decision['approval_delay_hours'] == out.approval_delay_hours
+        assert decision['estimated_cost_impact'] == out.estimated_cost_impact
+        assert decision['estimated_delay'] == out.estimated_delay
+
+
+class _NoOpRules:
+    """Supplier/routing rules stand-in; their decisions do not feed the episode metrics."""
+
+    def get_traditional_supplier_decision(self, *args, **kwargs):
+        return {}
+
+    def get_traditional_routing_decision(self, *args, **kwargs):
+        return {}
+
+
+def test_episode_batch_matches_scalar_episode(ghsc_frame):
+    """simulate_traditional_episode_batch matches simulate_traditional_episode, edge values included."""
+    system = TraditionalBaselineSystem.__new__(TraditionalBaselineSystem)
+    system.inventory_rules = ReorderSafetyStockRules(ghsc_frame[ghsc_frame['Country'] != 'Zambia'])
+    system.supplier_rules = system.routing_rules = _NoOpRules()
+
+    records = ghsc_frame.copy()
+    records.loc[:5, 'Freight_Cost_USD'] = [1e-5, 0, -3, np.nan, np.inf, 2e16]
+    records.loc[6:8, 'On_Time_Delivery_%'] = [np.nan, -99.99, -100]
+
+    batch = system.simulate_traditional_episode_batch(records)
+    columns = records.columns.tolist()
+    for row, values in enumerate(records.itertuples(index=False, name=None)):
+        episode = system.simulate_traditional_episode(dict(zip(columns, values)))
+        for metric, value in episode.items():
+            assert np.array_equal(np.float64(value), np.float64(batch[metric][row]), equal_nan=True), (row, metric)
+
+
+def test_replay_buffer_n_step_returns():
+    """n-step samples carry discounted reward sums cut at episode ends, bootstrapping from the last step."""
+    rng = np.random.default_rng(3)
+    capacity, n_step, gamma = 16, 3, 0.9
+    buffer = ReplayBuffer(capacity, state_size=2, n_step=n_step, gamma=gamma)
+
+    # 40 pushes wrap the ring; episodes end every 7 transitions
+    for t in range(40):
+        buffer.push(np.full(2, t), t % 6, rng.uniform(-1, 1), np.full(2, t + 1), t % 7 == 6)
+
+    batch = buffer.sample(256)
+    for state, reward, next_state, done in zip(batch.states, batch.rewards, batch.next_states, batch.dones):
+        t = int(state[0])
+        assert t <= 40 - n_step  # transitions without a full continuation are never sampled
+        expected, k = 0.0, 0
+        for k in range(n_step):
+            expected += gamma ** k * buffer.rewards[(t + k) % capacity]
+            if (t + k) % 7 == 6:
+                break
+        assert reward == pytest.approx(expected, rel=1e-5)
+        assert int(next_state[0]) == t + k + 1
+        assert done == ((t + k) % 7 == 6)
+
+
+def test_cached_ve_matches_variable_elimination():
+    """CachedVE answers queries like stock VariableElimination, reducing once per non-hot evidence."""
+    from pgmpy.models import DiscreteBayesianNetwork
+    from pgmpy.factors.discrete import TabularCPD
+    from pgmpy.inference import VariableElimination
+    from src.healthcare_crl.models.causal_graph import CachedVE, ConstantCPD
+
+    states = {var: ['no', 'yes'] for var in 'ABCD'}
+    model = DiscreteBayesianNetwork([('A', 'B'), ('B', 'C'), ('A', 'C'), ('D', 'C')])
+    model.add_cpds(
+        TabularCPD('A', 2, [[0.3], [0.7]], state_names=states),
+        TabularCPD('B', 2, [[0.9, 0.2], [0.1, 0.8]], evidence=['A'], evidence_card=[2], state_names=states),
+        TabularCPD('C', 2, [[0.5, 0.4, 0.1, 0.6, 0.3, 0.2, 0.7, 0.8], [0.5, 0.6, 0.9, 0.4, 0.7, 0.8, 0.3, 0.2]],
+                   evidence=['A', 'B', 'D'], evidence_card=[2, 2, 2], state_names=states),
+        ConstantCPD('D', 2, state_names=states),
+    )
+    stock, cached = VariableElimination(model), CachedVE(model, hot_variables=['A'])
+
+    for rest in ({}, {'B': 'yes'}, {'D': 'no'}, {'B': 'no', 'D': 'yes'}):
+        for action_state in ('yes', 'no'):
+            evidence = {**rest, 'A': action_state}
+            expected = stock.query(['C'], evidence=evidence, show_progress=False)
+            assert np.allclose(cached.query(['C'], evidence=evidence).values, expected.values)
+        if 'B' not in rest:
+            expected = stock.query(['B', 'C'], evidence=rest, joint=False, show_progress=False)
+            result = cached.query(['B', 'C'], evidence=rest, joint=False)
+            assert result.keys() == expected.keys()
+            assert all(np.allclose(result[var].values, expected[var].values) for var in expected)
+    # Each yes/no pair shared one reduction of the non-hot evidence
+    assert cached._reduced_engine.cache_info().hits == 4
+
+    cached.query(['C']).values[:] = 0
+    assert np.allclose(cached.query(['C']).values, stock.query(['C'], show_progress=False).values)
+    with pytest.raises(KeyError):
+        cached.query(['C'], evidence={'B': 'maybe'})